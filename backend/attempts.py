@@ -0,0 +1,137 @@
+"""
+Recording quiz, MCQ test and flashcard results in bulk.
+
+A whole test is submitted at once: MCQs are scored here against
+``correct_answers`` and practice-exam items against their single
+``answer`` (the client's verdict is not trusted), flashcards carry the
+user's own right/wrong call. Both kinds of test question count as MCQs in
+``user_stats``. Everything is applied with a single read
+of the affected ``user_progress`` documents and a single ``bulk_write``,
+and the per-user totals in ``user_stats`` are bumped with one ``$inc``.
+
+Every attempt also reschedules the card for spaced repetition (see
+spaced_repetition.py).
+"""
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+
+import compact_progress
+from spaced_repetition import SCHEDULE_FIELDS, next_schedule
+
+# SM-2 quality recorded for a right / wrong answer
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 1
+
+
+def score_mcq(question: Dict[str, Any], selected: Iterable[str]) -> bool:
+    """An MCQ is correct when exactly the correct options were selected"""
+    return set(selected or []) == set(question.get("correct_answers") or [])
+
+
+def score_practice_exam(question: Dict[str, Any], selected: Iterable[str]) -> bool:
+    """A practice-exam item has one answer, which must be the only option selected"""
+    return question.get("answer") is not None and list(selected or []) == [question["answer"]]
+
+
+def grade_attempts(
+    questions: Dict[str, Dict[str, Any]], attempts: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Score each attempt against its question. Returns one result per
+    attempt: ``{"question_id", "type", "correct", ...}``, or ``"error"``
+    for unknown questions and types that cannot be batch-graded.
+    """
+    results = []
+    for attempt in attempts:
+        qid = attempt["question_id"]
+        question = questions.get(qid)
+        if question is None:
+            results.append({"question_id": qid, "error": "Question not found"})
+        elif question["type"] == "multiple_choice":
+            results.append({
+                "question_id": qid,
+                "type": "multiple_choice",
+                "correct": score_mcq(question, attempt.get("selected")),
+                "correct_answers": question.get("correct_answers") or [],
+            })
+        elif question["type"] == "practice_exam":
+            results.append({
+                "question_id": qid,
+                "type": "practice_exam",
+                "correct": score_practice_exam(question, attempt.get("selected")),
+                "correct_answers": [question["answer"]] if question.get("answer") is not None else [],
+            })
+        elif question["type"] == "flashcard" and attempt.get("correct") is not None:
+            results.append({"question_id": qid, "type": "flashcard", "correct": bool(attempt["correct"])})
+        else:
+            results.append({"question_id": qid, "error": f"{question['type']} attempts cannot be batch-recorded"})
+    return results
+
+
+async def record_attempts(
+    db,
+    user_id: str,
+    results: List[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Apply graded results to ``user_progress`` and ``user_stats``. Repeated
+    answers to one question count as separate attempts; the last one
+    decides the schedule. Returns the user's updated totals.
+    """
+    now = now or datetime.now(timezone.utc)
+    graded = [r for r in results if "error" not in r]
+    if not graded:
+        return await db.user_stats.find_one({"user_id": user_id}, {"_id": 0}) or {}
+
+    by_question: Dict[str, List[Dict[str, Any]]] = {}
+    for result in graded:
+        by_question.setdefault(result["question_id"], []).append(result)
+
+    existing = await db.user_progress.find(
+        {"user_id": user_id, "question_id": {"$in": list(by_question)}},
+        {"_id": 0, "question_id": 1, **{field: 1 for field in SCHEDULE_FIELDS}}
+    ).to_list(None)
+    progress = {p["question_id"]: p for p in existing}
+
+    ops = []
+    for qid, answers in by_question.items():
+        schedule = progress.get(qid)
+        for answer in answers:
+            schedule = next_schedule(schedule, CORRECT_QUALITY if answer["correct"] else WRONG_QUALITY, now)
+        correct = sum(1 for answer in answers if answer["correct"])
+        ops.append(UpdateOne(
+            {"user_id": user_id, "question_id": qid},
+            {
+                "$set": {**schedule, "last_correct": answers[-1]["correct"],
+                         "last_attempted": now, "updated_at": now},
+                "$inc": {"attempts": len(answers), "correct_count": correct},
+                "$setOnInsert": {
+                    "progress_id": f"prog_{uuid.uuid4().hex[:12]}",
+                    "bookmarked": False,
+                    "created_at": now,
+                },
+            },
+            upsert=True
+        ))
+    await db.user_progress.bulk_write(ops, ordered=False)
+    await compact_progress.record(db, user_id, {
+        qid: {"attempted": True, "correct": answers[-1]["correct"]} for qid, answers in by_question.items()
+    })
+
+    increments: Dict[str, int] = {}
+    for result in graded:
+        kind = "flashcard" if result["type"] == "flashcard" else "mcq"
+        increments[f"{kind}_answered"] = increments.get(f"{kind}_answered", 0) + 1
+        increments[f"{kind}_correct"] = increments.get(f"{kind}_correct", 0) + int(result["correct"])
+
+    return await db.user_stats.find_one_and_update(
+        {"user_id": user_id},
+        {"$inc": increments, "$set": {"last_activity": now}, "$setOnInsert": {"created_at": now}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
@@ -0,0 +1,199 @@
+"""
+Streaming export of collections as gzip-compressed NDJSON.
+
+Each line is an envelope ``{"collection": ..., "document": {...}}`` in
+MongoDB Extended JSON, i.e. exactly what ``bulk_import.import_stream``
+accepts, so an export from one environment can be streamed straight into
+another. Documents are read in ``_id`` order through a cursor, so memory
+stays constant however large a collection is.
+
+After every chunk the stream carries a checkpoint line
+``{"checkpoint": "<token>"}``. Passing the last token a client received as
+``resume`` continues the export right after it, so a large
+``scenario_responses`` history can be moved across several requests. A
+resumed stream opens with ``{"resumed_from": "<token>"}``, which makes
+the import upsert its documents instead of replacing the collection with
+them. Post the stream back unchanged, with ``Content-Encoding: gzip``:
+
+    curl .../admin/export?resume=... | curl -H "Content-Encoding: gzip" \
+        --data-binary @- .../admin/import-stream
+
+    GET /api/admin/export?collections=questions,scenario_responses[&resume=...]
+    python bulk_export.py -o export.ndjson.gz [--collections ...] [--resume]
+"""
+import asyncio
+import base64
+import gzip
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from bson import json_util
+
+from bulk_import import IMPORT_KEYS
+
+EXPORT_COLLECTIONS = tuple(IMPORT_KEYS)
+CHUNK_SIZE = 1000
+
+
+class ExportError(ValueError):
+    """Raised for unknown collections or malformed resume tokens"""
+
+
+def encode_checkpoint(collection: str, last_id: Any) -> str:
+    raw = json_util.dumps({"c": collection, "id": last_id})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_checkpoint(token: str) -> Tuple[str, Any]:
+    try:
+        data = json_util.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return data["c"], data["id"]
+    except Exception:
+        raise ExportError("Invalid resume token")
+
+
+def parse_collections(value: Optional[str]) -> List[str]:
+    """Comma-separated collection names, validated; empty means all"""
+    if not value:
+        return list(EXPORT_COLLECTIONS)
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPORT_COLLECTIONS]
+    if unknown:
+        raise ExportError(f"Collection '{unknown[0]}' cannot be exported")
+    return names
+
+
+async def export_chunks(
+    db,
+    collections: List[str],
+    resume: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[Tuple[bytes, str]]:
+    """
+    Yield ``(ndjson_bytes, checkpoint_token)`` per chunk. The token resumes
+    the export right after the last document in that chunk.
+    """
+    start_collection, last_id = (decode_checkpoint(resume) if resume else (None, None))
+    if start_collection is not None:
+        if start_collection not in collections:
+            raise ExportError("Resume token does not match the requested collections")
+        collections = collections[collections.index(start_collection):]
+
+    for name in collections:
+        query = {"_id": {"$gt": last_id}} if last_id is not None and name == start_collection else {}
+        cursor = db[name].find(query).sort("_id", 1).batch_size(chunk_size)
+
+        lines: List[str] = []
+        last = None
+        async for doc in cursor:
+            last = doc["_id"]
+            lines.append(json_util.dumps({"collection": name, "document": doc}))
+            if len(lines) >= chunk_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8"), encode_checkpoint(name, last)
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8"), encode_checkpoint(name, last)
+
+
+async def gzip_stream(
+    db,
+    collections: List[str],
+    resume: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Gzip-compressed NDJSON with a checkpoint line after every chunk. The
+    compressor is sync-flushed at each checkpoint, so everything up to the
+    last checkpoint a client received can be decompressed even if the
+    connection drops.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    if resume:
+        yield compressor.compress((json.dumps({"resumed_from": resume}) + "\n").encode("utf-8"))
+    async for payload, token in export_chunks(db, collections, resume, chunk_size):
+        checkpoint = (json.dumps({"checkpoint": token}) + "\n").encode("utf-8")
+        yield compressor.compress(payload + checkpoint) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+# ========== CLI ==========
+
+def _write_checkpoint(path: Path, token: str, offset: int):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"token": token, "offset": offset}))
+    os.replace(tmp, path)
+
+
+async def export_file(
+    db,
+    out: Path,
+    collections: List[str],
+    resume: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    on_progress=None,
+) -> int:
+    """
+    Export to a local ``.ndjson.gz`` file. Each chunk is written as its own
+    gzip member and followed by a checkpoint file (``<out>.checkpoint``), so
+    an interrupted export restarts from the last complete chunk. Returns the
+    number of documents written in this run.
+    """
+    checkpoint_path = Path(str(out) + ".checkpoint")
+    token = None
+    offset = 0
+    if resume and checkpoint_path.exists():
+        state = json.loads(checkpoint_path.read_text())
+        token, offset = state["token"], state["offset"]
+
+    written = 0
+    with open(out, "r+b" if token else "wb") as f:
+        # Drop any partial chunk written after the last checkpoint
+        f.truncate(offset)
+        f.seek(offset)
+        async for payload, token in export_chunks(db, collections, token, chunk_size):
+            f.write(gzip.compress(payload))
+            f.flush()
+            os.fsync(f.fileno())
+            _write_checkpoint(checkpoint_path, token, f.tell())
+            written += payload.count(b"\n")
+            if on_progress:
+                on_progress(written)
+
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+    return written
+
+
+async def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Export collections as gzip NDJSON")
+    parser.add_argument("-o", "--out", default="export.ndjson.gz")
+    parser.add_argument("--collections", help=f"comma-separated (default: {','.join(EXPORT_COLLECTIONS)})")
+    parser.add_argument("--resume", action="store_true", help="continue from <out>.checkpoint")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+
+    try:
+        count = await export_file(
+            db, Path(args.out), parse_collections(args.collections),
+            resume=args.resume, chunk_size=args.chunk_size,
+            on_progress=lambda n: print(f"  … {n} documents", flush=True),
+        )
+        print(f"✅ Exported {count} documents to {args.out}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,341 @@
+"""
+Streaming NDJSON import pipeline.
+
+Documents are parsed one line at a time and written in bounded
+``bulk_write`` chunks, so memory stays flat no matter how large the input
+is. Lines may be plain or MongoDB Extended JSON (``mongoexport`` output,
+with ``{"$oid": ...}`` / ``{"$date": ...}`` values).
+
+A stream either targets a single collection, or carries envelope lines of
+the form ``{"collection": "questions", "document": {...}}`` so several
+collections can travel in one body (the format ``bulk_export`` produces;
+its ``{"checkpoint": ...}`` lines are skipped). A resumed export starts
+with a ``{"resumed_from": ...}`` line: it holds only the documents after
+that checkpoint, so unless a mode is given its collections are upserted
+rather than replaced (which would drop the earlier part, or be refused by
+the shrink check).
+
+Used by ``POST /api/admin/import-stream``, ``POST /api/admin/import-data``,
+``migrate_to_railway.py`` and directly from the command line::
+
+    python bulk_import.py questions.json --collection questions
+    python bulk_import.py export.ndjson.gz
+"""
+import asyncio
+import gzip
+import json
+import logging
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Union
+
+from bson import json_util
+from pymongo import ReplaceOne, UpdateOne
+
+from catalog_swap import StagedCollection
+from sync import record_reset
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+
+# Collections that may be imported, with the field(s) that identify a document
+IMPORT_KEYS: Dict[str, tuple] = {
+    "questions": ("question_id",),
+    "categories": ("category_id",),
+    "users": ("email",),
+    "user_progress": ("user_id", "question_id"),
+    "scenario_responses": ("response_id",),
+    "scenario_response_bodies": ("response_id",),
+}
+
+# replace: build a staging collection and atomically swap it in
+# upsert: replace documents matching the key, insert the rest
+# insert_missing: only insert documents whose key is not present yet
+IMPORT_MODES = ("replace", "upsert", "insert_missing")
+
+# Users are never wiped by an import, only added where missing
+DEFAULT_MODES = {"users": "insert_missing"}
+
+
+class BulkImportError(ValueError):
+    """Raised for malformed lines or unsupported collections"""
+
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class _CollectionWriter:
+    """Buffers operations for one collection and flushes them in chunks"""
+
+    def __init__(self, db, name: str, mode: str, chunk_size: int, force: bool = False):
+        if name not in IMPORT_KEYS:
+            raise BulkImportError(f"Collection '{name}' cannot be imported")
+        if mode not in IMPORT_MODES:
+            raise BulkImportError(f"Unknown import mode '{mode}'")
+        self.collection = db[name]
+        self.name = name
+        self.mode = mode
+        self.keys = IMPORT_KEYS[name]
+        self.chunk_size = chunk_size
+        self.ops: List[Any] = []
+        self.started = False
+        self.staged = StagedCollection(db, name, chunk_size, force=force) if mode == "replace" else None
+        self.stats = {"collection": name, "mode": mode, "read": 0,
+                      "inserted": 0, "upserted": 0, "modified": 0, "chunks": 0}
+
+    def _key_filter(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        missing = [k for k in self.keys if doc.get(k) is None]
+        if missing:
+            raise BulkImportError(f"{self.name} document missing key field '{missing[0]}'")
+        return {k: doc[k] for k in self.keys}
+
+    async def add(self, doc: Dict[str, Any]) -> bool:
+        """Queue one document; returns True when a chunk was flushed"""
+        if not self.started:
+            self.started = True
+            if self.staged:
+                await self.staged.begin()
+
+        self.stats["read"] += 1
+        if self.name == "users" and doc.get("email"):
+            doc["email"] = doc["email"].lower()
+
+        if self.staged:
+            if await self.staged.add(doc):
+                self.stats["inserted"] = self.staged.written
+                self.stats["chunks"] += 1
+                return True
+            return False
+        else:
+            # _id from another deployment must not clash with the live one
+            doc.pop("_id", None)
+            key = self._key_filter(doc)
+            if self.mode == "upsert":
+                self.ops.append(ReplaceOne(key, doc, upsert=True))
+            else:
+                self.ops.append(UpdateOne(key, {"$setOnInsert": doc}, upsert=True))
+
+        if len(self.ops) >= self.chunk_size:
+            await self.flush()
+            return True
+        return False
+
+    async def flush(self):
+        if self.staged:
+            if self.staged.ops:
+                self.stats["chunks"] += 1
+            await self.staged.flush()
+            self.stats["inserted"] = self.staged.written
+            return
+        if not self.ops:
+            return
+        result = await self.collection.bulk_write(self.ops, ordered=False)
+        self.stats["inserted"] += result.inserted_count
+        self.stats["upserted"] += result.upserted_count
+        self.stats["modified"] += result.modified_count
+        self.stats["chunks"] += 1
+        self.ops = []
+
+    async def finish(self):
+        """Flush what is left; a replacement is validated and swapped in here"""
+        await self.flush()
+        if self.staged:
+            self.stats["swap"] = await self.staged.commit()
+        elif self.stats["upserted"] or self.stats["modified"]:
+            # Imported documents carry their own timestamps; delta-sync clients refetch
+            await record_reset(self.collection.database, self.name)
+
+    async def abort(self):
+        if self.staged:
+            await self.staged.abort()
+
+
+def parse_line(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Parse one NDJSON line (plain or Extended JSON). Blank lines yield None."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    line = line.strip()
+    if not line:
+        return None
+    doc = json_util.loads(line)
+    if not isinstance(doc, dict):
+        raise BulkImportError("Each line must be a JSON object")
+    return doc
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]):
+    """Split an async byte stream (e.g. a request body) into lines"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def gunzip_chunks(chunks: AsyncIterable[bytes]):
+    """Decompress a gzip byte stream; concatenated members (bulk_export files) are read in turn"""
+    decompressor = zlib.decompressobj(31)
+    try:
+        async for chunk in chunks:
+            while chunk:
+                data = decompressor.decompress(chunk)
+                if data:
+                    yield data
+                if not decompressor.eof:
+                    break
+                chunk = decompressor.unused_data
+                decompressor = zlib.decompressobj(31)
+        tail = decompressor.flush()
+    except zlib.error as e:
+        raise BulkImportError(f"Invalid gzip body: {e}")
+    if tail:
+        yield tail
+
+
+async def _aiter(lines: Union[Iterable, AsyncIterable]):
+    if hasattr(lines, "__aiter__"):
+        async for line in lines:
+            yield line
+    else:
+        for line in lines:
+            yield line
+
+
+async def import_stream(
+    db,
+    lines: Union[Iterable, AsyncIterable],
+    collection: Optional[str] = None,
+    mode: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    on_progress: Optional[ProgressCallback] = None,
+    force: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Import an NDJSON stream. ``lines`` may be any (async) iterable of str,
+    bytes or already-parsed dicts. Without ``collection`` every line must be
+    an envelope naming its collection. Returns per-collection stats.
+
+    Replacements only become visible once the whole stream has been read
+    and validated; if anything fails, the live collections are untouched.
+    ``force`` skips the shrink check (see catalog_swap.MIN_RATIO). A stream
+    that opens with a ``{"resumed_from": ...}`` line defaults to upsert.
+    """
+    writers: Dict[str, _CollectionWriter] = {}
+    fallback = "replace"
+
+    def writer_for(name: str) -> _CollectionWriter:
+        if name not in writers:
+            writers[name] = _CollectionWriter(
+                db, name, mode or DEFAULT_MODES.get(name, fallback), chunk_size, force
+            )
+        return writers[name]
+
+    try:
+        line_number = 0
+        async for line in _aiter(lines):
+            line_number += 1
+            try:
+                doc = line if isinstance(line, dict) else parse_line(line)
+            except (ValueError, BulkImportError) as e:
+                raise BulkImportError(f"line {line_number}: {e}")
+            if doc is None:
+                continue
+
+            if collection:
+                writer = writer_for(collection)
+            else:
+                if "checkpoint" in doc and "document" not in doc:
+                    continue
+                if "resumed_from" in doc and "document" not in doc:
+                    if not writers:
+                        fallback = "upsert"
+                    continue
+                if "collection" not in doc or not isinstance(doc.get("document"), dict):
+                    raise BulkImportError(f"line {line_number}: expected {{\"collection\": ..., \"document\": {{...}}}}")
+                writer = writer_for(doc["collection"])
+                doc = doc["document"]
+
+            if await writer.add(doc) and on_progress:
+                on_progress(writer.stats)
+
+        for writer in writers.values():
+            await writer.finish()
+            if on_progress:
+                on_progress(writer.stats)
+    except Exception:
+        for writer in writers.values():
+            await writer.abort()
+        raise
+
+    return {name: writer.stats for name, writer in writers.items()}
+
+
+def _open_text(path: Union[str, Path]):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+async def import_file(db, path: Union[str, Path], collection: str, **kwargs) -> Dict[str, Any]:
+    """Stream one NDJSON / mongoexport file (optionally gzipped) into a collection"""
+    with _open_text(path) as f:
+        stats = await import_stream(db, f, collection=collection, **kwargs)
+    return stats.get(collection, {"collection": collection, "read": 0})
+
+
+async def import_export_file(db, path: Union[str, Path], **kwargs) -> Dict[str, Dict[str, Any]]:
+    """Stream a bulk_export file (envelope lines, usually gzipped) into its collections"""
+    with _open_text(path) as f:
+        return await import_stream(db, f, **kwargs)
+
+
+def log_progress(stats: Dict[str, Any]):
+    logger.info(f"Import {stats['collection']}: {stats['read']} read, "
+                f"{stats['chunks']} chunks written")
+
+
+# ========== CLI ==========
+
+async def main(argv: Optional[List[str]] = None):
+    import argparse
+    import os
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Stream NDJSON files into MongoDB")
+    parser.add_argument("files", nargs="+", help="NDJSON / mongoexport files, or bulk_export .ndjson.gz files")
+    parser.add_argument("--collection", help="target collection (default: file name stem; "
+                                             "export files name their own collections)")
+    parser.add_argument("--mode", choices=IMPORT_MODES, help="default: replace (insert_missing for users)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+
+    def progress(stats):
+        print(f"  … {stats['collection']}: {stats['read']} read", flush=True)
+
+    try:
+        for path in args.files:
+            options = dict(mode=args.mode, chunk_size=args.chunk_size, on_progress=progress)
+            if not args.collection and path.endswith(".ndjson.gz"):
+                print(f"Importing export {path}")
+                stats = await import_export_file(db, path, **options)
+            else:
+                collection = args.collection or Path(path).stem
+                print(f"Importing {path} → {collection}")
+                stats = await import_file(db, path, collection, **options)
+            print(f"  ✅ {json.dumps(stats, default=str)}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+"""
+Zero-downtime replacement of whole collections.
+
+Instead of ``delete_many({})`` followed by a reinsert (during which readers
+see an empty or partial collection), a replacement is written into a
+staging collection, given the same indexes as the live one, validated, and
+then renamed over the live collection in a single atomic
+``renameCollection``. The previous contents are snapshotted to
+``<name>__previous`` first so a bad import can be rolled back.
+
+Each run stages into its own ``<name>__staging_<started>_<run id>``, so
+concurrent replacements of one collection never write into (or drop) each
+other's staging data; the last to commit wins. Staging collections left by
+runs that started more than ``STALE_STAGING`` seconds ago are dropped.
+"""
+import logging
+import time
+import uuid
+from typing import Any, AsyncIterable, Dict, Iterable, List, Union
+
+from pymongo import InsertOne
+
+from sync import record_reset
+
+logger = logging.getLogger(__name__)
+
+STAGING_SUFFIX = "__staging"
+PREVIOUS_SUFFIX = "__previous"
+CHUNK_SIZE = 1000
+# An interrupted import's staging collection is dropped after this long
+STALE_STAGING = 24 * 3600
+
+# A replacement smaller than this fraction of the live collection is
+# treated as a broken import and refused unless forced
+MIN_RATIO = 0.5
+
+
+class SwapValidationError(RuntimeError):
+    """Raised when a staged collection fails validation and is not swapped in"""
+
+
+class StagedCollection:
+    """
+    Collects documents for a replacement of ``name`` in a staging collection.
+
+        staged = StagedCollection(db, "questions")
+        await staged.begin()
+        await staged.add(doc) ...
+        await staged.commit()      # or: await staged.abort()
+    """
+
+    def __init__(self, db, name: str, chunk_size: int = CHUNK_SIZE,
+                 min_ratio: float = MIN_RATIO, force: bool = False):
+        self.db = db
+        self.name = name
+        self.staging_name = f"{name}{STAGING_SUFFIX}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        self.previous_name = name + PREVIOUS_SUFFIX
+        self.chunk_size = chunk_size
+        self.min_ratio = min_ratio
+        self.force = force
+        self.ops: List[Any] = []
+        self.written = 0
+
+    async def begin(self):
+        # Leftovers from interrupted imports are discarded once stale
+        prefix = f"{self.name}{STAGING_SUFFIX}_"
+        cutoff = time.time() - STALE_STAGING
+        for collection in await self.db.list_collection_names():
+            started = collection[len(prefix):].split("_")[0]
+            if collection.startswith(prefix) and started.isdigit() and int(started) < cutoff:
+                await self.db[collection].drop()
+
+    async def add(self, doc: Dict[str, Any]) -> bool:
+        """Queue one document; returns True when a chunk was flushed"""
+        self.ops.append(InsertOne(doc))
+        if len(self.ops) >= self.chunk_size:
+            await self.flush()
+            return True
+        return False
+
+    async def flush(self):
+        if not self.ops:
+            return
+        result = await self.db[self.staging_name].bulk_write(self.ops, ordered=False)
+        self.written += result.inserted_count
+        self.ops = []
+
+    async def _copy_indexes(self):
+        live_indexes = await self.db[self.name].index_information()
+        staging = self.db[self.staging_name]
+        for index_name, spec in live_indexes.items():
+            if index_name == "_id_":
+                continue
+            options = {k: v for k, v in spec.items() if k not in ("key", "v", "ns")}
+            await staging.create_index(spec["key"], name=index_name, **options)
+
+    async def _validate(self):
+        staged_count = await self.db[self.staging_name].count_documents({})
+        if staged_count != self.written:
+            raise SwapValidationError(
+                f"{self.name}: staged {staged_count} documents but wrote {self.written}"
+            )
+        live_count = await self.db[self.name].count_documents({})
+        if not self.force and live_count and staged_count < live_count * self.min_ratio:
+            raise SwapValidationError(
+                f"{self.name}: replacement has {staged_count} documents, live has {live_count}; "
+                f"refusing to swap (use force to override)"
+            )
+        return staged_count, live_count
+
+    async def commit(self) -> Dict[str, Any]:
+        """Index, validate and atomically swap the staging collection in"""
+        await self.flush()
+        try:
+            await self._copy_indexes()
+            staged_count, live_count = await self._validate()
+        except Exception:
+            await self.abort()
+            raise
+
+        # Keep the outgoing version for rollback. $out replaces the previous
+        # snapshot atomically, and the live collection stays readable meanwhile.
+        if live_count:
+            await self.db[self.name].aggregate([{"$out": self.previous_name}]).to_list(None)
+
+        if staged_count == 0:
+            # An empty staging collection is never created server-side
+            await self.db[self.name].delete_many({})
+        else:
+            await self.db[self.staging_name].rename(self.name, dropTarget=True)
+
+        # Delta-sync clients refetch the whole collection
+        await record_reset(self.db, self.name)
+        logger.info(f"Swapped {self.name}: {live_count} -> {staged_count} documents")
+        return {"collection": self.name, "previous": live_count, "current": staged_count}
+
+    async def abort(self):
+        self.ops = []
+        await self.db[self.staging_name].drop()
+
+
+async def _aiter(docs: Union[Iterable, AsyncIterable]):
+    if hasattr(docs, "__aiter__"):
+        async for doc in docs:
+            yield doc
+    else:
+        for doc in docs:
+            yield doc
+
+
+async def staged_replace(
+    db,
+    name: str,
+    docs: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    force: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Replace the whole of collection ``name`` with ``docs`` without a visible gap"""
+    staged = StagedCollection(db, name, chunk_size=chunk_size, force=force)
+    await staged.begin()
+    try:
+        async for doc in _aiter(docs):
+            await staged.add(doc)
+    except Exception:
+        await staged.abort()
+        raise
+    return await staged.commit()
+
+
+async def rollback(db, name: str) -> Dict[str, Any]:
+    """Swap ``<name>__previous`` back in as the live collection"""
+    previous_name = name + PREVIOUS_SUFFIX
+    if previous_name not in await db.list_collection_names():
+        raise SwapValidationError(f"No previous version of {name} to roll back to")
+
+    # Copy rather than rename; commit() snapshots the version being rolled
+    # back, so a second rollback undoes the first
+    staged = StagedCollection(db, name, force=True)
+    await staged.begin()
+    await db[previous_name].aggregate([{"$out": staged.staging_name}]).to_list(None)
+    staged.written = await db[staged.staging_name].count_documents({})
+    return await staged.commit()
+
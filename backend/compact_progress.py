@@ -0,0 +1,314 @@
+"""
+Compact per-user progress: one small document per user instead of one
+``user_progress`` document per (user, question).
+
+Every question gets a stable ordinal (``question_ordinals``; ordinals are
+never reused, so a deleted question leaves a hole rather than shifting
+everyone's bits). A user's progress is then:
+
+    user_progress_bits: {
+        user_id,
+        bookmarked, attempted, correct: Binary   # bit i = question with ordinal i
+        scores: Binary                            # one byte per ordinal, 0-100, 255 = none
+        graded_count, score_sum                   # graded scenario response totals
+        rev, updated_at
+    }
+
+Counts are numpy popcounts over those buffers, ANDed with per-type masks of
+the live question bank, so ``/stats`` reads a single document of a few
+hundred bytes.
+
+The representation is optional and kept alongside ``user_progress`` (which
+stays the source of truth): set ``COMPACT_PROGRESS=1`` to maintain it and
+serve stats from it. A user's document is built from
+``user_progress`` the first time it is needed, so it can be switched on at
+any time; dropping ``user_progress_bits`` simply rebuilds it lazily.
+"""
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from bson import Binary
+from pymongo import InsertOne, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+NO_SCORE = 255
+BITSET_FIELDS = ("bookmarked", "attempted", "correct")
+MAX_RETRIES = 5
+
+
+def enabled() -> bool:
+    return os.environ.get("COMPACT_PROGRESS", "").lower() in ("1", "true", "yes")
+
+
+# ========== QUESTION ORDINALS ==========
+
+class QuestionOrdinals:
+    """question_id <-> ordinal, plus per-type bitmasks of the live question bank"""
+
+    def __init__(self):
+        self.by_question: Dict[str, int] = {}
+        self.by_ordinal: Dict[int, str] = {}
+        self.types: Dict[str, str] = {}  # question_id -> type, live questions only
+        self.masks: Dict[str, np.ndarray] = {}
+
+    async def load(self, db):
+        """Load ordinals, assign ones to new questions and rebuild the type masks"""
+        self.__init__()
+        async for row in db.question_ordinals.find({}, {"_id": 0}):
+            self._remember(row["question_id"], row["ordinal"])
+        async for q in db.questions.find({}, {"_id": 0, "question_id": 1, "type": 1}):
+            self.types[q["question_id"]] = q["type"]
+        await self.assign(db, [qid for qid in self.types if qid not in self.by_question])
+        self._rebuild_masks()
+
+    def _remember(self, question_id: str, ordinal: int):
+        self.by_question[question_id] = ordinal
+        self.by_ordinal[ordinal] = question_id
+
+    async def assign(self, db, question_ids: List[str]):
+        """Give new questions the next free ordinals (reserved as one block)"""
+        if not question_ids:
+            return
+        counter = await db.counters.find_one_and_update(
+            {"_id": "question_ordinal"},
+            {"$inc": {"seq": len(question_ids)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        first = counter["seq"] - len(question_ids)
+        rows = [{"question_id": qid, "ordinal": first + i} for i, qid in enumerate(question_ids)]
+        try:
+            await db.question_ordinals.bulk_write([InsertOne(dict(r)) for r in rows], ordered=False)
+        except Exception as e:
+            # Another worker assigned some of them first; theirs win
+            logger.info(f"Question ordinals assigned concurrently, reloading: {e}")
+            rows = await db.question_ordinals.find(
+                {"question_id": {"$in": question_ids}}, {"_id": 0}
+            ).to_list(None)
+        for row in rows:
+            self._remember(row["question_id"], row["ordinal"])
+
+    def _rebuild_masks(self):
+        size = (max(self.by_ordinal, default=-1) + 8) // 8
+        masks: Dict[str, bytearray] = {}
+        for qid, qtype in self.types.items():
+            ordinal = self.by_question.get(qid)
+            if ordinal is None:
+                continue
+            for key in (qtype, "all"):
+                mask = masks.setdefault(key, bytearray(size))
+                mask[ordinal >> 3] |= 1 << (ordinal & 7)
+        self.masks = {key: np.frombuffer(bytes(mask), dtype=np.uint8) for key, mask in masks.items()}
+
+    async def add_question(self, db, question_id: str, qtype: str):
+        self.types[question_id] = qtype
+        if question_id not in self.by_question:
+            await self.assign(db, [question_id])
+        self._rebuild_masks()
+
+    def remove_question(self, question_id: str):
+        if self.types.pop(question_id, None) is not None:
+            self._rebuild_masks()
+
+    def count(self, qtype: str = "all") -> int:
+        mask = self.masks.get(qtype)
+        return int(np.bitwise_count(mask).sum()) if mask is not None else 0
+
+
+ordinals = QuestionOrdinals()
+
+
+# ========== BITSETS ==========
+
+def _array(buffer: Optional[bytes]) -> np.ndarray:
+    return np.frombuffer(buffer or b"", dtype=np.uint8)
+
+
+def popcount(buffer: Optional[bytes], mask: Optional[np.ndarray] = None) -> int:
+    """Number of set bits, optionally restricted to ``mask``"""
+    bits = _array(buffer)
+    if mask is not None:
+        n = min(len(bits), len(mask))
+        bits = bits[:n] & mask[:n]
+    return int(np.bitwise_count(bits).sum())
+
+
+def set_ordinals(buffer: Optional[bytes]) -> List[int]:
+    """Ordinals whose bit is set, ascending"""
+    return np.flatnonzero(np.unpackbits(_array(buffer), bitorder="little")).tolist()
+
+
+def _set_bit(buffer: bytearray, ordinal: int, value: bool):
+    byte = ordinal >> 3
+    if byte >= len(buffer):
+        if not value:
+            return
+        buffer.extend(bytes(byte + 1 - len(buffer)))
+    if value:
+        buffer[byte] |= 1 << (ordinal & 7)
+    else:
+        buffer[byte] &= ~(1 << (ordinal & 7)) & 0xFF
+
+
+def _set_score(buffer: bytearray, ordinal: int, score: Optional[float]):
+    if ordinal >= len(buffer):
+        if score is None:
+            return
+        buffer.extend(bytes([NO_SCORE]) * (ordinal + 1 - len(buffer)))
+    buffer[ordinal] = NO_SCORE if score is None else max(0, min(100, round(score)))
+
+
+def score_summary(scores: Optional[bytes]) -> Dict[str, Any]:
+    values = _array(scores)
+    values = values[values != NO_SCORE]
+    return {"scored": int(values.size), "mean": float(values.mean()) if values.size else None}
+
+
+# ========== PER-USER DOCUMENTS ==========
+
+def _empty(user_id: str) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        **{field: Binary(b"") for field in BITSET_FIELDS},
+        "scores": Binary(b""),
+        "graded_count": 0,
+        "score_sum": 0.0,
+        "rev": 0,
+    }
+
+
+async def build(db, user_id: str) -> Dict[str, Any]:
+    """Build a user's compact document from user_progress and scenario_responses"""
+    buffers = {field: bytearray() for field in (*BITSET_FIELDS, "scores")}
+    async for p in db.user_progress.find(
+        {"user_id": user_id},
+        {"_id": 0, "question_id": 1, "bookmarked": 1, "attempts": 1, "last_correct": 1, "last_score": 1}
+    ):
+        ordinal = ordinals.by_question.get(p["question_id"])
+        if ordinal is None:
+            continue
+        _set_bit(buffers["bookmarked"], ordinal, bool(p.get("bookmarked")))
+        _set_bit(buffers["attempted"], ordinal, (p.get("attempts") or 0) > 0)
+        _set_bit(buffers["correct"], ordinal, bool(p.get("last_correct")))
+        _set_score(buffers["scores"], ordinal, p.get("last_score"))
+
+    totals = await db.scenario_responses.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$group": {
+            "_id": None,
+            "graded_count": {"$sum": {"$cond": [{"$ne": [{"$ifNull": ["$ai_grade", None]}, None]}, 1, 0]}},
+            "score_sum": {"$sum": {"$ifNull": ["$ai_grade", 0]}},
+        }},
+    ]).to_list(1)
+
+    doc = _empty(user_id)
+    doc.update({field: Binary(bytes(buf)) for field, buf in buffers.items()})
+    if totals:
+        doc.update({k: totals[0][k] for k in ("graded_count", "score_sum")})
+    doc["updated_at"] = datetime.now(timezone.utc)
+    return doc
+
+
+async def _get_or_build(db, user_id: str):
+    doc = await db.user_progress_bits.find_one({"user_id": user_id}, {"_id": 0})
+    if doc:
+        return doc, False
+    doc = await build(db, user_id)
+    try:
+        await db.user_progress_bits.insert_one(dict(doc))
+    except DuplicateKeyError:
+        return await db.user_progress_bits.find_one({"user_id": user_id}, {"_id": 0}), False
+    return doc, True
+
+
+async def get(db, user_id: str) -> Dict[str, Any]:
+    """A user's compact document, built on first use"""
+    return (await _get_or_build(db, user_id))[0]
+
+
+async def record(
+    db,
+    user_id: str,
+    changes: Dict[str, Dict[str, Any]],
+    inc: Optional[Dict[str, float]] = None,
+):
+    """
+    Apply ``{question_id: {"bookmarked"|"attempted"|"correct": bool, "score": float|None}}``
+    and optional counter increments. A no-op unless COMPACT_PROGRESS is set.
+    Callers write user_progress first, so a freshly built document already
+    includes the change.
+    """
+    if not enabled():
+        return
+    for _ in range(MAX_RETRIES):
+        doc, built = await _get_or_build(db, user_id)
+        if built:
+            return
+        buffers = {field: bytearray(doc.get(field) or b"") for field in (*BITSET_FIELDS, "scores")}
+        for qid, change in changes.items():
+            ordinal = ordinals.by_question.get(qid)
+            if ordinal is None:
+                continue
+            for field in BITSET_FIELDS:
+                if field in change:
+                    _set_bit(buffers[field], ordinal, bool(change[field]))
+            if "score" in change:
+                _set_score(buffers["scores"], ordinal, change["score"])
+
+        # Optimistic concurrency: retry if another request wrote in between
+        result = await db.user_progress_bits.update_one(
+            {"user_id": user_id, "rev": doc.get("rev", 0)},
+            {
+                "$set": {**{f: Binary(bytes(b)) for f, b in buffers.items()},
+                         "updated_at": datetime.now(timezone.utc)},
+                "$inc": {"rev": 1, **(inc or {})},
+            }
+        )
+        if result.matched_count:
+            return
+    logger.warning(f"Compact progress for {user_id} kept changing; dropping it for a rebuild")
+    await db.user_progress_bits.delete_one({"user_id": user_id})
+
+
+async def reset_scores(db, user_id: str):
+    """Forget attempts and scores, keep bookmarks (mirrors /reset-scores)"""
+    if not enabled():
+        return
+    await db.user_progress_bits.update_one(
+        {"user_id": user_id},
+        {
+            "$set": {"attempted": Binary(b""), "correct": Binary(b""), "scores": Binary(b""),
+                     "graded_count": 0, "score_sum": 0.0,
+                     "updated_at": datetime.now(timezone.utc)},
+            "$inc": {"rev": 1},
+        }
+    )
+
+
+async def invalidate(db, user_ids: Optional[Iterable[str]] = None):
+    """Drop compact documents (all, or some users') so they are rebuilt from user_progress"""
+    query = {"user_id": {"$in": list(user_ids)}} if user_ids is not None else {}
+    await db.user_progress_bits.delete_many(query)
+
+
+# ========== READS ==========
+
+async def stats(db, user_id: str) -> Dict[str, Any]:
+    """The progress part of /stats from the user's single compact document"""
+    doc = await get(db, user_id)
+    live = ordinals.masks.get("all")
+    graded = doc.get("graded_count") or 0
+    return {
+        "total_flashcards": ordinals.count("flashcard"),
+        "total_scenarios": ordinals.count("scenario"),
+        "attempted_flashcards": popcount(doc.get("attempted"), live),
+        "attempted_scenarios": score_summary(doc.get("scores"))["scored"],
+        "bookmarks": popcount(doc.get("bookmarked"), live),
+        "average_score": (doc.get("score_sum") or 0) / graded if graded else None,
+        "total_responses": graded,
+    }
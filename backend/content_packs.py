@@ -0,0 +1,450 @@
+"""
+Declarative content packs for the question bank.
+
+A pack is a versioned file under ``content/packs`` holding one header record
+followed by one record per question:
+
+- ``*.jsonl`` / ``*.ndjson``: one JSON object per line
+- ``*.yaml`` / ``*.yml``: a multi-document YAML stream (``---`` separated)
+
+The header looks like::
+
+    {"pack": "core", "version": 3, "schema_version": 1,
+     "description": "...", "categories": [{...}, ...]}
+
+and every following record is a question document without timestamps.
+Each question carries a stable ``question_id`` that identifies it within
+the pack, so a pack can be diffed against the live ``questions`` collection
+and only the changed documents written.
+
+Run ``python content_packs.py`` to sync every pack into MongoDB
+(``--dry-run`` prints the diff without writing).
+"""
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).parent
+PACKS_DIR = ROOT_DIR / "content" / "packs"
+
+SCHEMA_VERSION = 1
+PACK_SUFFIXES = (".jsonl", ".ndjson", ".yaml", ".yml")
+BULK_CHUNK_SIZE = 500
+
+QUESTION_TYPES = ("flashcard", "scenario", "multiple_choice")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Field -> accepted Python types for question records
+QUESTION_FIELDS: Dict[str, tuple] = {
+    "question_id": (str,),
+    "type": (str,),
+    "category_id": (str,),
+    "category_name": (str,),
+    "title": (str,),
+    "content": (str,),
+    "description": (str,),
+    "question": (str,),
+    "options": (list,),
+    "correct_answers": (list,),
+    "answer": (str,),
+    "model_answer": (str,),
+    "explanation": (str,),
+    "difficulty": (str,),
+    "reference": (str,),
+    "time_limit": (int,),
+    "is_complex": (bool,),
+    "parts": (int,),
+    "study_tip": (str,),
+    "is_practice_test": (bool,),
+    "is_gold": (bool,),
+    "source": (str,),
+}
+
+# Fields that steer the sync and are not stored on documents: legacy_titles
+# lists earlier titles/question texts, so a reworded question still adopts
+# the document seeded under its old text
+PACK_ONLY_FIELDS: Dict[str, tuple] = {
+    "legacy_titles": (list,),
+}
+
+REQUIRED_FIELDS: Dict[str, tuple] = {
+    "flashcard": ("title", "content", "answer"),
+    "scenario": ("title", "content"),
+    "multiple_choice": ("question", "options", "correct_answers"),
+}
+
+CATEGORY_FIELDS: Dict[str, tuple] = {
+    "category_id": (str,),
+    "name": (str,),
+    "description": (str,),
+    "order": (int,),
+}
+
+# Bookkeeping fields stored on live documents that came from a pack
+PACK_META_FIELDS = ("pack", "pack_key", "pack_version", "content_hash")
+
+
+class PackValidationError(ValueError):
+    """Raised when a pack header or record does not match the schema"""
+
+    def __init__(self, source: str, line: int, message: str):
+        super().__init__(f"{source}:{line}: {message}")
+        self.source = source
+        self.line = line
+
+
+# ========== READING ==========
+
+def _iter_raw_records(path: Path) -> Iterator[Tuple[int, Any]]:
+    """Yield (record_number, record) pairs from a pack file without loading it whole"""
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        with open(path, "r", encoding="utf-8") as f:
+            for number, record in enumerate(yaml.safe_load_all(f), start=1):
+                if record is not None:
+                    yield number, record
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise PackValidationError(path.name, number, f"invalid JSON: {e.msg}")
+
+
+def _check_fields(source: str, line: int, record: Dict[str, Any], fields: Dict[str, tuple], kind: str):
+    for key, value in record.items():
+        if key not in fields:
+            raise PackValidationError(source, line, f"unknown {kind} field '{key}'")
+        # bool is an int subclass, so int fields must reject it explicitly
+        expected = fields[key]
+        if value is not None and (
+            not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected)
+        ):
+            raise PackValidationError(
+                source, line, f"{kind} field '{key}' must be {expected[0].__name__}"
+            )
+
+
+def validate_header(source: str, header: Any) -> Dict[str, Any]:
+    if not isinstance(header, dict) or "pack" not in header:
+        raise PackValidationError(source, 1, "first record must be a pack header with a 'pack' name")
+    if header.get("schema_version", SCHEMA_VERSION) != SCHEMA_VERSION:
+        raise PackValidationError(
+            source, 1, f"unsupported schema_version {header.get('schema_version')}"
+        )
+    if not isinstance(header.get("version"), int):
+        raise PackValidationError(source, 1, "header 'version' must be an integer")
+
+    seen = set()
+    for category in header.get("categories", []):
+        _check_fields(source, 1, category, CATEGORY_FIELDS, "category")
+        for key in ("category_id", "name", "description"):
+            if not category.get(key):
+                raise PackValidationError(source, 1, f"category missing '{key}'")
+        if category["category_id"] in seen:
+            raise PackValidationError(source, 1, f"duplicate category {category['category_id']}")
+        seen.add(category["category_id"])
+    return header
+
+
+def validate_question(source: str, line: int, record: Any) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise PackValidationError(source, line, "question record must be an object")
+    _check_fields(source, line, record, {**QUESTION_FIELDS, **PACK_ONLY_FIELDS}, "question")
+
+    for key in ("question_id", "type", "category_id", "category_name"):
+        if not record.get(key):
+            raise PackValidationError(source, line, f"question missing '{key}'")
+
+    qtype = record["type"]
+    if qtype not in QUESTION_TYPES:
+        raise PackValidationError(source, line, f"unknown question type '{qtype}'")
+    for key in REQUIRED_FIELDS[qtype]:
+        if not record.get(key):
+            raise PackValidationError(source, line, f"{qtype} missing '{key}'")
+
+    if record.get("difficulty", "medium") not in DIFFICULTIES:
+        raise PackValidationError(source, line, f"unknown difficulty '{record['difficulty']}'")
+    if qtype == "multiple_choice":
+        missing = [a for a in record["correct_answers"] if a not in record["options"]]
+        if missing:
+            raise PackValidationError(source, line, f"correct answer not among options: {missing[0]!r}")
+    return record
+
+
+def read_pack(path: Path) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """
+    Open a pack and return its validated header plus a lazy iterator of
+    validated question records. Records are validated as they are consumed,
+    and duplicate question ids within the pack are rejected.
+    """
+    path = Path(path)
+    records = _iter_raw_records(path)
+    first = next(records, None)
+    if first is None:
+        raise PackValidationError(path.name, 1, "empty pack")
+    header = validate_header(path.name, first[1])
+
+    def questions() -> Iterator[Dict[str, Any]]:
+        seen = set()
+        for line, record in records:
+            record = validate_question(path.name, line, record)
+            if record["question_id"] in seen:
+                raise PackValidationError(path.name, line, f"duplicate question_id {record['question_id']}")
+            seen.add(record["question_id"])
+            yield record
+
+    return header, questions()
+
+
+def list_packs(packs_dir: Path = PACKS_DIR) -> List[Path]:
+    """All pack files in a directory, in name order"""
+    if not packs_dir.is_dir():
+        return []
+    return sorted(p for p in packs_dir.iterdir() if p.suffix in PACK_SUFFIXES)
+
+
+def write_pack(path: Path, header: Dict[str, Any], questions: Iterable[Dict[str, Any]]) -> int:
+    """Write a JSONL pack. Returns the number of questions written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for question in questions:
+            f.write(json.dumps(question, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """Stable hash of a question record's content fields"""
+    payload = {k: v for k, v in record.items() if k in QUESTION_FIELDS}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _document(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in record.items() if k not in PACK_ONLY_FIELDS}
+
+
+def pack_documents(path: Path) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Like read_pack, but yields documents ready to insert into ``questions``"""
+    header, questions = read_pack(path)
+    now = datetime.now(timezone.utc)
+
+    def documents() -> Iterator[Dict[str, Any]]:
+        for record in questions:
+            yield {**_document(record), "pack": header["pack"], "pack_key": record["question_id"],
+                   "pack_version": header["version"], "content_hash": content_hash(record),
+                   "created_at": now, "updated_at": now}
+
+    return header, documents()
+
+
+def _natural_key(doc: Dict[str, Any]) -> Tuple[str, str]:
+    return doc.get("type", ""), (doc.get("title") or doc.get("question") or "").strip()
+
+
+def _legacy_keys(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Natural keys a legacy document of this record may have: its text, then earlier texts"""
+    return [_natural_key(record)] + [(record["type"], title.strip()) for title in record.get("legacy_titles") or []]
+
+
+# ========== IN-MEMORY CATALOG ==========
+
+def load_catalog(paths: Optional[Iterable[Path]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Build an in-memory catalog straight from the packs, without MongoDB
+    (the server falls back to it when the questions cannot be read).
+    Returns {"categories": {category_id: doc}, "questions": {question_id: doc}};
+    questions are stamped with the load time, as pack_documents does.
+    """
+    catalog: Dict[str, Dict[str, Any]] = {"categories": {}, "questions": {}}
+    now = datetime.now(timezone.utc)
+    for path in paths if paths is not None else list_packs():
+        header, questions = read_pack(path)
+        for category in header.get("categories", []):
+            catalog["categories"][category["category_id"]] = dict(category)
+        for record in questions:
+            doc = _document(record)
+            doc["pack"] = header["pack"]
+            doc["pack_version"] = header["version"]
+            doc["created_at"] = doc["updated_at"] = now
+            catalog["questions"][doc["question_id"]] = doc
+    return catalog
+
+
+# ========== DIFF & APPLY ==========
+
+async def _live_index(db, pack_name: str):
+    """Map the live documents a pack owns (and legacy seeded ones) to their ids and hashes"""
+    owned: Dict[str, Tuple[str, Optional[str]]] = {}
+    legacy: Dict[Tuple[str, str], str] = {}
+    cursor = db.questions.find(
+        {"$or": [{"pack": pack_name}, {"pack": {"$exists": False}}]},
+        {"_id": 0, "question_id": 1, "pack": 1, "pack_key": 1, "content_hash": 1,
+         "type": 1, "title": 1, "question": 1},
+    )
+    async for doc in cursor:
+        if doc.get("pack") == pack_name:
+            owned[doc.get("pack_key") or doc["question_id"]] = (doc["question_id"], doc.get("content_hash"))
+        else:
+            legacy.setdefault(_natural_key(doc), doc["question_id"])
+    return owned, legacy
+
+
+async def apply_pack(
+    db,
+    path: Path,
+    dry_run: bool = False,
+    prune: bool = True,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Diff a pack against the live ``questions`` collection and write only
+    the changes, in bounded ``bulk_write`` chunks.
+
+    - records whose content hash is unchanged are skipped
+    - legacy documents seeded before packs existed are matched by
+      (type, title/question), or a record's ``legacy_titles``, and adopted
+      in place, keeping their question_id
+      so existing user progress stays attached
+    - with ``prune``, documents the pack owns but no longer lists are deleted
+    """
+    from pymongo import DeleteOne, InsertOne, UpdateOne
+    from sync import record_deletes
+
+    header, questions = read_pack(path)
+    pack_name = header["pack"]
+    owned, legacy = await _live_index(db, pack_name)
+    now = datetime.now(timezone.utc)
+    stats = {"pack": pack_name, "version": header["version"],
+             "inserted": 0, "updated": 0, "adopted": 0, "deleted": 0, "unchanged": 0}
+
+    if header.get("categories") and not dry_run:
+        # Only categories that changed get a new updated_at (delta sync relies on it)
+        live_categories = {
+            c["category_id"]: c async for c in db.categories.find(
+                {"category_id": {"$in": [c["category_id"] for c in header["categories"]]}}, {"_id": 0}
+            )
+        }
+        changed = [c for c in header["categories"]
+                   if any(live_categories.get(c["category_id"], {}).get(k) != v for k, v in c.items())]
+        if changed:
+            await db.categories.bulk_write([
+                UpdateOne({"category_id": c["category_id"]}, {"$set": {**c, "updated_at": now}}, upsert=True)
+                for c in changed
+            ], ordered=False)
+
+    ops: List[Any] = []
+
+    async def flush():
+        if ops and not dry_run:
+            await db.questions.bulk_write(ops, ordered=False)
+        ops.clear()
+
+    seen = set()
+    for record in questions:
+        key = record["question_id"]
+        seen.add(key)
+        digest = content_hash(record)
+        meta = {"pack": pack_name, "pack_key": key,
+                "pack_version": header["version"], "content_hash": digest}
+        natural = next((k for k in _legacy_keys(record) if k in legacy), None)
+
+        if key in owned or natural:
+            if key in owned:
+                live_id, live_hash = owned[key]
+                if live_hash == digest:
+                    stats["unchanged"] += 1
+                    continue
+                stats["updated"] += 1
+            else:
+                live_id = legacy.pop(natural)
+                stats["adopted"] += 1
+            fields = {k: v for k, v in _document(record).items() if k != "question_id"}
+            update = {"$set": {**fields, **meta, "updated_at": now}}
+            unset = {f: "" for f in QUESTION_FIELDS if f not in record and f != "question_id"}
+            if unset:
+                update["$unset"] = unset
+            ops.append(UpdateOne({"question_id": live_id}, update))
+        else:
+            ops.append(InsertOne({**_document(record), **meta, "created_at": now, "updated_at": now}))
+            stats["inserted"] += 1
+
+        if len(ops) >= chunk_size:
+            await flush()
+
+    pruned: List[str] = []
+    if prune:
+        for key, (live_id, _) in owned.items():
+            if key not in seen:
+                ops.append(DeleteOne({"question_id": live_id}))
+                pruned.append(live_id)
+                stats["deleted"] += 1
+                if len(ops) >= chunk_size:
+                    await flush()
+
+    await flush()
+    if pruned and not dry_run:
+        await record_deletes(db, "questions", pruned)
+    return stats
+
+
+async def apply_all_packs(db, packs_dir: Path = PACKS_DIR, **kwargs) -> List[Dict[str, Any]]:
+    """Apply every pack in a directory, in name order"""
+    return [await apply_pack(db, path, **kwargs) for path in list_packs(packs_dir)]
+
+
+# ========== CLI ==========
+
+def _format_stats(stats: Dict[str, Any]) -> str:
+    return (f"{stats['pack']} v{stats['version']}: +{stats['inserted']} inserted, "
+            f"~{stats['updated']} updated, {stats['adopted']} adopted, "
+            f"-{stats['deleted']} deleted, {stats['unchanged']} unchanged")
+
+
+async def main(argv: Optional[List[str]] = None):
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Sync content packs into MongoDB")
+    parser.add_argument("packs", nargs="*", help="pack names or paths (default: all packs)")
+    parser.add_argument("--dry-run", action="store_true", help="print the diff without writing")
+    parser.add_argument("--no-prune", action="store_true", help="keep questions removed from a pack")
+    parser.add_argument("--validate", action="store_true", help="only validate the packs")
+    args = parser.parse_args(argv)
+
+    paths = [Path(p) if Path(p).suffix else PACKS_DIR / f"{p}.jsonl" for p in args.packs] or list_packs()
+
+    if args.validate:
+        for path in paths:
+            header, questions = read_pack(path)
+            count = sum(1 for _ in questions)
+            print(f"✓ {header['pack']} v{header['version']}: {count} questions")
+        return
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(ROOT_DIR / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    try:
+        for path in paths:
+            stats = await apply_pack(db, path, dry_run=args.dry_run, prune=not args.no_prune)
+            print(("[dry run] " if args.dry_run else "✓ ") + _format_stats(stats))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
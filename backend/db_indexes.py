@@ -0,0 +1,135 @@
+"""
+MongoDB indexes the API relies on, created at startup.
+
+``ensure_indexes`` is idempotent, so running it on every boot is cheap; an
+index that already exists with the same spec is left alone.
+"""
+import logging
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from sync import TOMBSTONE_RETENTION
+
+logger = logging.getLogger(__name__)
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "user_progress": [
+        # One progress document per (user, question); upserts rely on it
+        IndexModel([("user_id", ASCENDING), ("question_id", ASCENDING)], name="user_question", unique=True),
+        # Spaced-repetition due queue: one range scan per user, oldest due first
+        IndexModel([("user_id", ASCENDING), ("due_at", ASCENDING)], name="user_due"),
+        # Bookmark listing, newest first; partial so it only holds bookmarked rows
+        IndexModel(
+            [("user_id", ASCENDING), ("bookmarked_at", DESCENDING), ("question_id", DESCENDING)],
+            name="user_bookmarks", partialFilterExpression={"bookmarked": True}
+        ),
+        # Delta sync (sync.py): a user's progress changed since a cursor
+        IndexModel([("user_id", ASCENDING), ("updated_at", ASCENDING)], name="user_updated"),
+    ],
+    "questions": [
+        IndexModel([("updated_at", ASCENDING)], name="updated"),
+    ],
+    "categories": [
+        IndexModel([("updated_at", ASCENDING)], name="updated"),
+    ],
+    "scenario_responses": [
+        # History pages (newest first, keyset on response_id) and delta sync
+        IndexModel([("user_id", ASCENDING), ("submitted_at", DESCENDING), ("response_id", DESCENDING)],
+                   name="user_history"),
+    ],
+    "scenario_response_bodies": [
+        IndexModel([("response_id", ASCENDING)], name="response", unique=True),
+        IndexModel([("user_id", ASCENDING)], name="user"),
+    ],
+    "user_sessions": [
+        IndexModel([("session_token", ASCENDING)], name="token", unique=True),
+        IndexModel([("user_id", ASCENDING)], name="user"),
+        # One guest session per device (see guest_login)
+        IndexModel([("device_fingerprint", ASCENDING)], name="device", unique=True,
+                   partialFilterExpression={"device_fingerprint": {"$exists": True}}),
+        # TTL: MongoDB deletes sessions once expires_at has passed
+        IndexModel([("expires_at", ASCENDING)], name="expire", expireAfterSeconds=0),
+    ],
+    "users": [
+        # Admin analytics: active users per day/week/month (user_activity.py)
+        IndexModel([("last_active_at", ASCENDING)], name="last_active", sparse=True),
+    ],
+    "password_resets": [
+        IndexModel([("token", ASCENDING), ("email", ASCENDING)], name="token_email"),
+        IndexModel([("expires_at", ASCENDING)], name="expire", expireAfterSeconds=0),
+    ],
+    "token_revocations": [
+        IndexModel([("jti", ASCENDING)], name="jti", sparse=True),
+        IndexModel([("created_at", ASCENDING)], name="created"),
+        IndexModel([("expires_at", ASCENDING)], name="expire", expireAfterSeconds=0),
+    ],
+    "rate_limits": [
+        IndexModel([("expires_at", ASCENDING)], name="expire", expireAfterSeconds=0),
+    ],
+    "tombstones": [
+        IndexModel([("user_id", ASCENDING), ("deleted_at", ASCENDING)], name="user_deleted"),
+        # TTL: tombstones are only needed for as long as delta cursors stay valid
+        IndexModel([("deleted_at", ASCENDING)], name="expire",
+                   expireAfterSeconds=int(TOMBSTONE_RETENTION.total_seconds())),
+    ],
+    "exam_sessions": [
+        IndexModel([("exam_id", ASCENDING)], name="exam", unique=True),
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created"),
+    ],
+    "user_progress_bits": [
+        IndexModel([("user_id", ASCENDING)], name="user", unique=True),
+    ],
+    "question_ordinals": [
+        IndexModel([("question_id", ASCENDING)], name="question", unique=True),
+        IndexModel([("ordinal", ASCENDING)], name="ordinal", unique=True),
+    ],
+    "user_stats": [
+        IndexModel([("user_id", ASCENDING)], name="user", unique=True),
+    ],
+}
+
+
+async def merge_duplicate_progress(db) -> int:
+    """
+    Collapse duplicate (user_id, question_id) progress documents left by the
+    old find-then-insert bookmark toggle, so the unique index can be built.
+    The oldest document is kept, bookmarked if any copy was, with the
+    highest attempt count. Returns the number of documents removed.
+    """
+    duplicates = await db.user_progress.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {
+            "_id": {"user_id": "$user_id", "question_id": "$question_id"},
+            "ids": {"$push": "$_id"},
+            "bookmarked": {"$max": {"$ifNull": ["$bookmarked", False]}},
+            "attempts": {"$max": {"$ifNull": ["$attempts", 0]}},
+        }},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ], allowDiskUse=True).to_list(None)
+
+    removed = 0
+    for group in duplicates:
+        keep, *extra = group["ids"]
+        await db.user_progress.update_one(
+            {"_id": keep}, {"$set": {"bookmarked": group["bookmarked"], "attempts": group["attempts"]}}
+        )
+        result = await db.user_progress.delete_many({"_id": {"$in": extra}})
+        removed += result.deleted_count
+    if removed:
+        logger.info(f"Merged {removed} duplicate user_progress documents")
+    return removed
+
+
+async def ensure_indexes(db):
+    try:
+        if "user_question" not in await db.user_progress.index_information():
+            await merge_duplicate_progress(db)
+    except Exception as e:
+        logger.error(f"Merging duplicate progress failed: {e}")
+
+    for collection, indexes in INDEXES.items():
+        try:
+            await db[collection].create_indexes(indexes)
+        except Exception as e:
+            logger.error(f"Index creation on {collection} failed: {e}")
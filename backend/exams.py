@@ -0,0 +1,197 @@
+"""
+Server-side practice exam sessions.
+
+An exam freezes a sampled set of MCQs when it is created, so a reload or a
+second device resumes exactly the same exam. Answers are written
+incrementally - a client may send one answer or everything changed since
+its last save, and either way it is one ``$set`` on the session document -
+and the whole exam is scored in a single pass when it is finished.
+
+    exam_sessions: {
+        exam_id, user_id, status: "in_progress" | "finished",
+        question_ids: [...],             # frozen at creation, in exam order
+        answers: {question_id: [selected options]},
+        duration_seconds, created_at, expires_at, updated_at,
+        # once finished:
+        finished_at, correct, total, score, results: [{question_id, correct}]
+    }
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from attempts import record_attempts, score_mcq
+
+DEFAULT_QUESTION_COUNT = 50
+MAX_QUESTION_COUNT = 200
+DEFAULT_DURATION_MINUTES = 90
+
+# Grace period for answers sent just as the timer runs out
+ANSWER_GRACE = timedelta(seconds=30)
+
+# Never sent to the client while an exam is running
+HIDDEN_FIELDS = ("correct_answers", "explanation", "answer", "model_answer")
+
+
+class ExamError(Exception):
+    """Raised for exam operations that are not allowed; ``status_code`` maps to HTTP"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _public_question(question: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in question.items() if k not in HIDDEN_FIELDS}
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Motor returns naive datetimes unless the client is tz_aware
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def _questions_in_order(db, question_ids: List[str]) -> List[Dict[str, Any]]:
+    questions = await db.questions.find({"question_id": {"$in": question_ids}}, {"_id": 0}).to_list(None)
+    by_id = {q["question_id"]: q for q in questions}
+    return [by_id[qid] for qid in question_ids if qid in by_id]
+
+
+async def create_exam(
+    db,
+    user_id: str,
+    count: int = DEFAULT_QUESTION_COUNT,
+    category_id: Optional[str] = None,
+    duration_minutes: int = DEFAULT_DURATION_MINUTES,
+) -> Dict[str, Any]:
+    """Sample ``count`` MCQs and freeze them into a new session"""
+    match: Dict[str, Any] = {"type": "multiple_choice"}
+    if category_id:
+        match["category_id"] = category_id
+    sampled = await db.questions.aggregate([
+        {"$match": match},
+        {"$sample": {"size": max(1, min(count, MAX_QUESTION_COUNT))}},
+        {"$project": {"_id": 0, "question_id": 1}},
+    ]).to_list(None)
+    if not sampled:
+        raise ExamError(404, "No questions available for this exam")
+
+    now = datetime.now(timezone.utc)
+    session = {
+        "exam_id": f"exam_{uuid.uuid4().hex[:12]}",
+        "user_id": user_id,
+        "status": "in_progress",
+        "question_ids": [q["question_id"] for q in sampled],
+        "answers": {},
+        "category_id": category_id,
+        "duration_seconds": duration_minutes * 60,
+        "created_at": now,
+        "updated_at": now,
+        "expires_at": now + timedelta(minutes=duration_minutes),
+    }
+    await db.exam_sessions.insert_one(dict(session))
+    return session
+
+
+async def get_exam(db, user_id: str, exam_id: str) -> Dict[str, Any]:
+    """The session plus its questions (answers hidden until it is finished)"""
+    session = await db.exam_sessions.find_one({"exam_id": exam_id, "user_id": user_id}, {"_id": 0})
+    if not session:
+        raise ExamError(404, "Exam not found")
+    questions = await _questions_in_order(db, session["question_ids"])
+    if session["status"] != "finished":
+        questions = [_public_question(q) for q in questions]
+    session["questions"] = questions
+    session["remaining_seconds"] = max(
+        0, int((_as_utc(session["expires_at"]) - datetime.now(timezone.utc)).total_seconds())
+    )
+    return session
+
+
+async def save_answers(db, user_id: str, exam_id: str, answers: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Merge answers into a running exam with one conditional update. Question
+    ids outside the frozen set, finished exams and expired timers are
+    rejected by the update filter itself.
+    """
+    if not answers:
+        raise ExamError(400, "No answers given")
+    if any("." in qid or qid.startswith("$") for qid in answers):
+        raise ExamError(400, "Invalid question id")
+
+    now = datetime.now(timezone.utc)
+    result = await db.exam_sessions.update_one(
+        {
+            "exam_id": exam_id,
+            "user_id": user_id,
+            "status": "in_progress",
+            "expires_at": {"$gt": now - ANSWER_GRACE},
+            "question_ids": {"$all": list(answers)},
+        },
+        {"$set": {**{f"answers.{qid}": selected for qid, selected in answers.items()}, "updated_at": now}}
+    )
+    if result.matched_count:
+        return {"saved": len(answers), "updated_at": now}
+
+    # Work out why nothing matched
+    session = await db.exam_sessions.find_one(
+        {"exam_id": exam_id, "user_id": user_id},
+        {"_id": 0, "status": 1, "expires_at": 1, "question_ids": 1}
+    )
+    if not session:
+        raise ExamError(404, "Exam not found")
+    if session["status"] != "in_progress":
+        raise ExamError(409, "Exam is already finished")
+    if _as_utc(session["expires_at"]) <= now - ANSWER_GRACE:
+        raise ExamError(409, "Exam time is up; finish it to see your score")
+    raise ExamError(400, "Answer for a question that is not part of this exam")
+
+
+async def finish_exam(db, user_id: str, exam_id: str) -> Dict[str, Any]:
+    """
+    Score every answer in one pass, close the session and record the
+    results in the user's progress. Finishing twice returns the same result.
+    """
+    session = await db.exam_sessions.find_one({"exam_id": exam_id, "user_id": user_id}, {"_id": 0})
+    if not session:
+        raise ExamError(404, "Exam not found")
+    if session["status"] == "finished":
+        return await get_exam(db, user_id, exam_id)
+
+    questions = await _questions_in_order(db, session["question_ids"])
+    answers = session.get("answers") or {}
+    results = [
+        {
+            "question_id": q["question_id"],
+            "type": "multiple_choice",
+            "selected": answers.get(q["question_id"]),
+            "correct": score_mcq(q, answers.get(q["question_id"])),
+        }
+        for q in questions
+    ]
+    correct = sum(1 for r in results if r["correct"])
+    now = datetime.now(timezone.utc)
+
+    closed = await db.exam_sessions.update_one(
+        {"exam_id": exam_id, "user_id": user_id, "status": "in_progress"},
+        {"$set": {
+            "status": "finished",
+            "finished_at": now,
+            "updated_at": now,
+            "results": [{"question_id": r["question_id"], "correct": r["correct"]} for r in results],
+            "correct": correct,
+            "total": len(results),
+            "score": round(correct / len(results) * 100, 1) if results else 0,
+        }}
+    )
+    # Only the request that closed the session records attempts (answered questions only)
+    if closed.modified_count:
+        await record_attempts(db, user_id, [r for r in results if r["selected"] is not None], now)
+    return await get_exam(db, user_id, exam_id)
+
+
+async def list_exams(db, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+    return await db.exam_sessions.find(
+        {"user_id": user_id},
+        {"_id": 0, "answers": 0, "results": 0, "question_ids": 0}
+    ).sort("created_at", -1).to_list(limit)
@@ -0,0 +1,164 @@
+"""
+Fast JSON responses and the trusted-read path.
+
+``FastJSONResponse`` is the app's default response class. It renders with
+orjson when the package is installed, which encodes datetimes natively and
+is several times faster than ``json.dumps``, and falls back to the
+standard library otherwise. Either way datetimes are written the way
+pydantic writes them for a ``response_model`` (UTC as ``Z``, naive ones
+without an offset), so skipping validation does not change how a
+timestamp looks to clients. Rendering is timed as the request's serialize
+phase (metrics.py). Routes built with ``TimedRoute`` also count FastAPI's
+own ``serialize_response`` - ``response_model`` validation and
+``jsonable_encoder``, which run between the endpoint returning and the
+response being rendered - in that phase.
+
+For documents read from our own collections, validating them again
+against ``response_model`` and walking them through ``jsonable_encoder``
+costs more than the query. ``trusted`` wraps them in a response instead:
+FastAPI sends Response objects as they are, while the route's
+``response_model`` still describes the schema in OpenAPI. Reads on this
+path select exactly the model's fields with ``projection(model)``, and
+fields a document lacks get their model defaults, as validation would
+have filled them in.
+"""
+import asyncio
+import json
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+import metrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Document = Dict[str, Any]
+
+
+# ========== ENCODING ==========
+
+def _default(value: Any) -> Any:
+    """Types the encoder has no native form for (datetimes for json, Decimal, ObjectId, models...)"""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        with metrics.timer("serialize"):
+            return dumps(content)
+
+
+# ========== SERIALIZE TIMING ==========
+
+# {"at": when the endpoint returned, "rendered": serialize time counted by then}
+_returned: ContextVar[Optional[Dict[str, float]]] = ContextVar("endpoint_returned", default=None)
+
+
+def _stamped(call: Callable) -> Callable:
+    """The endpoint, noting when it returns content FastAPI still has to serialize"""
+    def stamp(result: Any) -> Any:
+        mark = _returned.get()
+        if mark is not None and not isinstance(result, Response):
+            mark.update(at=time.perf_counter(), rendered=metrics.phase_time("serialize"))
+        return result
+
+    if asyncio.iscoroutinefunction(call):
+        @wraps(call)
+        async def endpoint(*args, **kwargs):
+            return stamp(await call(*args, **kwargs))
+    else:
+        @wraps(call)
+        def endpoint(*args, **kwargs):
+            return stamp(call(*args, **kwargs))
+    endpoint._stamped = True
+    return endpoint
+
+
+class TimedRoute(APIRoute):
+    """
+    A route whose serialize phase runs from the endpoint's return to the
+    finished response, so ``serialize_response`` is counted along with
+    ``render()`` (which times itself and is not counted twice)
+    """
+
+    def get_route_handler(self) -> Callable:
+        if not getattr(self.dependant.call, "_stamped", False):
+            self.dependant.call = _stamped(self.dependant.call)
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            mark: Dict[str, float] = {}
+            token = _returned.set(mark)
+            try:
+                response = await handler(request)
+            finally:
+                _returned.reset(token)
+            if mark:
+                elapsed = time.perf_counter() - mark["at"]
+                rendered = metrics.phase_time("serialize") - mark["rendered"]
+                metrics.add_phase_time("serialize", max(elapsed - rendered, 0.0))
+            return response
+
+        return timed_handler
+
+
+# ========== TRUSTED READS ==========
+
+@lru_cache(maxsize=None)
+def projection(model: Type[BaseModel]) -> Dict[str, int]:
+    """MongoDB projection of exactly the model's fields (shared: do not modify)"""
+    return {"_id": 0, **{name: 1 for name in model.model_fields}}
+
+
+@lru_cache(maxsize=None)
+def _defaults(model: Type[BaseModel]) -> Tuple[Document, Tuple[Tuple[str, Callable[[], Any]], ...]]:
+    static, factories = {}, []
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif not field.is_required():
+            static[name] = field.default
+    return static, tuple(factories)
+
+
+def with_defaults(model: Type[BaseModel], document: Document) -> Document:
+    static, factories = _defaults(model)
+    filled = {**static, **document}
+    for name, factory in factories:
+        if name not in document:
+            filled[name] = factory()
+    return filled
+
+
+def trusted(model: Type[BaseModel], content: Union[Document, List[Document]],
+            headers: Optional[Mapping[str, str]] = None) -> FastJSONResponse:
+    """
+    One document or a list of them, read with ``projection(model)``, as a
+    response that skips ``response_model`` validation
+    """
+    if isinstance(content, list):
+        body: Any = [with_defaults(model, document) for document in content]
+    else:
+        body = with_defaults(model, content)
+    return FastJSONResponse(body, headers=headers)
@@ -0,0 +1,72 @@
+"""
+Per-device guest identities.
+
+Each device that logs in as a guest gets its own lightweight user
+(``guest_<fingerprint>``), created on its first guest login, so guests no
+longer share - and contend on - the same progress documents and stats.
+Clients that do not send a device id still get the old shared guest.
+
+When a guest registers, everything they did as a guest moves to the new
+account in one bulk update per collection, and the guest identity is
+removed.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from pymongo import ReturnDocument
+
+import compact_progress
+
+# The single guest every device used to share; never merged into an account
+SHARED_GUEST_ID = "user_guest_detective"
+SHARED_GUEST_EMAIL = "guest@cpd-study.app"
+GUEST_NAME = "Guest User"
+
+# Collections holding per-user data, re-keyed on merge
+USER_COLLECTIONS = ("user_progress", "scenario_responses", "scenario_response_bodies",
+                    "exam_sessions", "user_stats")
+
+
+def guest_user_id(fingerprint: str) -> str:
+    return f"guest_{fingerprint[:20]}"
+
+
+def is_device_guest(user_id: str) -> bool:
+    return user_id.startswith("guest_")
+
+
+async def ensure_guest(db, user_id: str) -> Dict[str, Any]:
+    """The guest's user document, created on first use"""
+    email = SHARED_GUEST_EMAIL if user_id == SHARED_GUEST_ID else f"{user_id}@guest.cpd-study.app"
+    return await db.users.find_one_and_update(
+        {"user_id": user_id},
+        {"$setOnInsert": {"user_id": user_id, "email": email, "name": GUEST_NAME,
+                          "role": "guest", "created_at": datetime.now(timezone.utc)}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+
+async def merge_into_new_account(db, guest_id: str, user_id: str) -> Dict[str, int]:
+    """
+    Move a device guest's progress, responses, exams and stats to a newly
+    registered account, then delete the guest. The account is new, so
+    nothing can collide and each collection is a single update_many.
+    """
+    if not is_device_guest(guest_id):
+        return {}
+    now = datetime.now(timezone.utc)
+    moved = {}
+    for name in USER_COLLECTIONS:
+        update = {"$set": {"user_id": user_id}}
+        if name == "user_progress":
+            # Delta sync picks the moved rows up as changes of the new account
+            update["$set"]["updated_at"] = now
+        result = await db[name].update_many({"user_id": guest_id}, update)
+        moved[name] = result.modified_count
+
+    await compact_progress.invalidate(db, [guest_id, user_id])
+    await db.user_sessions.delete_many({"user_id": guest_id})
+    await db.users.delete_one({"user_id": guest_id, "role": "guest"})
+    return moved
@@ -0,0 +1,695 @@
+"""
+Load test and benchmark harness for the API.
+
+Seeds a throwaway database at a chosen scale, starts the app against it
+with a fake LLM, drives a weighted mix of traffic at a fixed arrival rate
+and reports latency percentiles and throughput per endpoint:
+
+    python load_test.py run --users 10000 --responses 1000000 --rps 200 --duration 60
+    python load_test.py run --mongomock --users 500 --responses 20000     # no MongoDB needed
+    python load_test.py run --base-url http://localhost:8001 --no-seed    # an app you started
+    python load_test.py compare load_results/a.json load_results/b.json
+
+Seeding uses the real content packs for questions, then generates users
+(one shared password), progress, bookmarks, quiz totals and scenario
+responses (long ones stored as compressed bodies, as the app would). A
+database is only dropped and seeded when its name contains "loadtest",
+and is reused while its seeded scale matches.
+
+The app runs under uvicorn with ``RATE_LIMIT_STORE=off`` and
+``OPENAI_BASE_URL`` pointing at a local fake that answers in
+``--llm-latency`` seconds; other settings (``COMPACT_PROGRESS``,
+``SESSION_SIGNING_KEY``, ...) are passed through, so variants can be
+compared. ``--mongomock`` serves from an in-memory mongomock database
+(needs the ``mongomock-motor`` package) and is best-effort: handy for quick
+relative numbers, but not MongoDB's, and index builds, explains and a few
+query operators behave differently or not at all. The app's client is
+replaced before ``server`` is imported, so every module sees the one
+in-memory database.
+
+Traffic is open-loop: requests start on schedule whether or not earlier
+ones have finished, and latency is measured from the scheduled start, so a
+stalled server shows up as latency rather than as fewer requests
+(requests beyond ``--max-in-flight`` are counted as dropped). The first
+``--warmup`` seconds are not measured.
+
+Each run is written to ``load_results/`` and compared with the latest
+earlier run of the same scenario (or ``--baseline``): a p95 or p99 more
+than ``--tolerance`` slower, lower throughput or more errors on any
+endpoint is reported as a regression and the command exits with status 1.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import bcrypt
+import httpx
+
+ROOT_DIR = Path(__file__).parent
+RESULTS_DIR = ROOT_DIR / "load_results"
+
+DEFAULT_DB = "cpd_loadtest"
+PASSWORD = "loadtest-password"
+BATCH_SIZE = 5_000
+
+# Endpoint -> weight; override with --mix name=weight,...
+DEFAULT_MIX = {
+    "questions": 18,
+    "question": 14,
+    "categories": 6,
+    "bookmarks": 8,
+    "bookmark_toggle": 4,
+    "attempts": 12,
+    "stats": 12,
+    "leaderboard": 8,
+    "history": 6,
+    "submit": 5,
+    "login": 4,
+    "me": 3,
+}
+
+# Regressions smaller than this are noise however large in relative terms
+MIN_REGRESSION_MS = 5.0
+
+LONG_ANSWER = ("I would first secure the scene and request additional units, then identify and separate "
+               "witnesses, preserve evidence, document the chain of custody and notify the watch "
+               "commander before interviewing the complainant. ")
+
+
+# ========== SEEDING ==========
+
+def scale_of(args) -> Dict[str, int]:
+    return {"users": args.users, "responses": args.responses, "progress_per_user": args.progress_per_user,
+            "bookmarks_per_user": args.bookmarks_per_user}
+
+
+async def seed(db, scale: Dict[str, int], rng: random.Random, log=print):
+    """Drop ``db`` and fill it with the content packs and generated users and activity"""
+    from content_packs import apply_all_packs
+    from response_bodies import split
+
+    if "loadtest" not in db.name:
+        raise SystemExit(f"Refusing to seed {db.name!r}: load test databases must have 'loadtest' in their name")
+
+    started = time.perf_counter()
+    await db.client.drop_database(db.name)
+    await apply_all_packs(db)
+    questions = await db.questions.find({}, {"_id": 0, "question_id": 1, "type": 1}).to_list(None)
+    question_ids = [q["question_id"] for q in questions]
+    scenario_ids = [q["question_id"] for q in questions if q["type"] == "scenario"] or question_ids
+    now = datetime.now(timezone.utc)
+
+    # One hash for everyone: bcrypt at the default cost takes ~0.25 s per call
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    user_ids = [f"user_lt{i:07d}" for i in range(scale["users"])]
+    for start in range(0, len(user_ids), BATCH_SIZE):
+        await db.users.insert_many([{
+            "user_id": user_ids[i],
+            "email": f"lt{i}@load.test",
+            "name": f"Load Test {i}",
+            "picture": None,
+            "password_hash": password_hash,
+            "role": "user",
+            "created_at": now - timedelta(days=rng.randint(0, 365)),
+        } for i in range(start, min(start + BATCH_SIZE, len(user_ids)))], ordered=False)
+    log(f"  {len(user_ids)} users")
+
+    # Written BATCH_SIZE at a time, like the responses below, so memory does
+    # not grow with users * progress_per_user
+    progress, stats, written = [], [], 0
+    for i, user_id in enumerate(user_ids):
+        picked = rng.sample(question_ids, min(scale["progress_per_user"], len(question_ids)))
+        for n, question_id in enumerate(picked):
+            attempted = now - timedelta(hours=rng.randint(1, 2000))
+            progress.append({
+                "progress_id": f"prog_{uuid.uuid4().hex[:12]}",
+                "user_id": user_id,
+                "question_id": question_id,
+                "bookmarked": n < scale["bookmarks_per_user"],
+                "bookmarked_at": attempted if n < scale["bookmarks_per_user"] else None,
+                "attempts": rng.randint(1, 5),
+                "last_score": float(rng.randint(0, 100)),
+                "last_attempted": attempted,
+                "created_at": attempted,
+                "updated_at": attempted,
+            })
+        answered = rng.randint(0, 200)
+        stats.append({"user_id": user_id, "mcq_answered": answered,
+                      "mcq_correct": rng.randint(0, answered), "flashcard_answered": rng.randint(0, 300)})
+        if len(progress) + len(stats) >= BATCH_SIZE or i == len(user_ids) - 1:
+            if progress:
+                await db.user_progress.insert_many(progress, ordered=False)
+            await db.user_stats.insert_many(stats, ordered=False)
+            written += len(progress)
+            progress, stats = [], []
+    log(f"  {written} progress documents")
+
+    total = scale["responses"]
+    for start in range(0, total, BATCH_SIZE):
+        hot, bodies = [], []
+        for _ in range(min(BATCH_SIZE, total - start)):
+            response = {
+                "response_id": f"resp_{uuid.uuid4().hex[:12]}",
+                "user_id": rng.choice(user_ids) if user_ids else "user_lt0000000",
+                "question_id": rng.choice(scenario_ids),
+                "user_response": LONG_ANSWER * rng.randint(1, 8),
+                "ai_grade": float(rng.randint(40, 100)) if rng.random() > 0.05 else None,
+                "ai_feedback": "Solid structure; cite the relevant directive and cover notification.",
+                "time_taken": rng.randint(60, 1800),
+                "submitted_at": now - timedelta(minutes=rng.randint(1, 525_600)),
+            }
+            doc, body = split(response, now)
+            hot.append(doc)
+            if body:
+                bodies.append(body)
+        if bodies:
+            await db.scenario_response_bodies.insert_many(bodies, ordered=False)
+        await db.scenario_responses.insert_many(hot, ordered=False)
+    log(f"  {total} scenario responses")
+
+    await db.load_test_meta.replace_one({"_id": "seed"}, {"_id": "seed", "scale": scale, "seeded_at": now},
+                                        upsert=True)
+    log(f"Seeded {db.name} in {time.perf_counter() - started:.1f} s")
+
+
+async def ensure_seeded(db, scale: Dict[str, int], rng: random.Random, force: bool = False, log=print):
+    meta = await db.load_test_meta.find_one({"_id": "seed"})
+    if not force and meta and meta.get("scale") == scale:
+        log(f"Reusing {db.name} seeded at {meta['seeded_at']:%Y-%m-%d %H:%M}")
+        return
+    log(f"Seeding {db.name}: {scale}")
+    await seed(db, scale, rng, log=log)
+
+
+# ========== FAKE LLM ==========
+
+async def start_fake_llm(latency: float, rng: random.Random):
+    """An OpenAI-compatible chat completions endpoint answering in ``latency`` seconds"""
+    from aiohttp import web
+
+    async def completions(request):
+        await asyncio.sleep(latency * rng.uniform(0.5, 1.5))
+        grade = rng.randint(40, 100)
+        return web.json_response({
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "fake-gpt",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant",
+                            "content": f"GRADE: {grade}\nFEEDBACK: Covers the key steps; tighten the "
+                                       f"sequence of notifications and cite the directive."},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 400, "completion_tokens": 60, "total_tokens": 460},
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    port = free_port()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+# ========== APP PROCESS ==========
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(args, port: int, llm_url: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "MONGO_URL": args.mongo_url or "mongodb://localhost:27017",
+        "DB_NAME": args.db_name,
+        "RATE_LIMIT_STORE": "off",
+        "OPENAI_API_KEY": "load-test",
+        "OPENAI_BASE_URL": llm_url,
+    }
+    if args.mongomock:
+        command = [sys.executable, str(Path(__file__).resolve()), "serve", "--port", str(port),
+                   "--db-name", args.db_name, "--seed-random", str(args.seed_random),
+                   *[f"--{k.replace('_', '-')}={v}" for k, v in scale_of(args).items()]]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1", "--port", str(port),
+                   "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"]
+    return subprocess.Popen(command, cwd=ROOT_DIR, env=env)
+
+
+async def wait_healthy(base_url: str, process: Optional[subprocess.Popen], timeout: float):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=5) as client:
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                raise SystemExit(f"App exited during startup (status {process.returncode})")
+            try:
+                response = await client.get("/api/health")
+                if response.status_code == 200 and response.json().get("status") == "healthy":
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise SystemExit(f"App not healthy after {timeout:.0f} s")
+
+
+def stop_app(process: subprocess.Popen):
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def serve(args):
+    """``serve``: the app on an in-memory mongomock database, seeded at startup"""
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        raise SystemExit("--mongomock needs the mongomock-motor package")
+    import motor.motor_asyncio
+    import uvicorn
+
+    # server.py connects at import: give it the in-memory client then, so no
+    # module or startup hook is left holding a client for MONGO_URL
+    motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+    os.environ["DB_NAME"] = args.db_name
+    import server
+
+    async def seed_in_memory():
+        await seed(server.db, scale_of(args), random.Random(args.seed_random))
+
+    server.app.router.on_startup.insert(0, seed_in_memory)
+    uvicorn.run(server.app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+
+# ========== TRAFFIC ==========
+
+class Catalog:
+    """What the traffic picks from: question ids by type and logged-in sessions"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.questions: Dict[str, List[Dict[str, Any]]] = {}
+        self.all_ids: List[str] = []
+        self.sessions: List[str] = []
+        self.users: int = 0
+
+    def question(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        pool = self.questions.get(kind) if kind else None
+        if not pool:
+            pool = [q for qs in self.questions.values() for q in qs]
+        return self.rng.choice(pool)
+
+    def auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.rng.choice(self.sessions)}"}
+
+    def email(self) -> str:
+        return f"lt{self.rng.randrange(self.users)}@load.test"
+
+
+async def login(client: httpx.AsyncClient, catalog: Catalog) -> httpx.Response:
+    response = await client.post("/api/auth/login", json={"email": catalog.email(), "password": PASSWORD})
+    if response.status_code == 200:
+        # Later requests spread over old and new sessions, as real traffic does
+        catalog.sessions[catalog.rng.randrange(len(catalog.sessions))] = response.json()["session_token"]
+    return response
+
+
+def _attempts(catalog: Catalog) -> Dict[str, Any]:
+    attempts = []
+    for _ in range(10):
+        question = catalog.question(catalog.rng.choice(["multiple_choice", "flashcard"]))
+        if question["type"] == "multiple_choice":
+            attempts.append({"question_id": question["question_id"],
+                             "selected": [catalog.rng.choice(question.get("options") or ["?"])]})
+        else:
+            attempts.append({"question_id": question["question_id"], "correct": catalog.rng.random() < 0.7})
+    return {"attempts": attempts}
+
+
+Action = Callable[[httpx.AsyncClient, Catalog], Awaitable[httpx.Response]]
+
+ACTIONS: Dict[str, Action] = {
+    "questions": lambda c, cat: c.get("/api/questions", params={"type": cat.rng.choice(
+        ["flashcard", "multiple_choice", "scenario"])}, headers=cat.auth()),
+    "question": lambda c, cat: c.get(f"/api/questions/{cat.question()['question_id']}", headers=cat.auth()),
+    "categories": lambda c, cat: c.get("/api/categories"),
+    "bookmarks": lambda c, cat: c.get("/api/bookmarks", headers=cat.auth()),
+    "bookmark_toggle": lambda c, cat: c.post("/api/bookmarks/toggle", headers=cat.auth(),
+                                             json={"question_id": cat.question()["question_id"]}),
+    "attempts": lambda c, cat: c.post("/api/attempts/batch", headers=cat.auth(), json=_attempts(cat)),
+    "stats": lambda c, cat: c.get("/api/stats", headers=cat.auth()),
+    "leaderboard": lambda c, cat: c.get("/api/leaderboard", headers=cat.auth()),
+    "history": lambda c, cat: c.get("/api/scenarios/history", headers=cat.auth()),
+    "submit": lambda c, cat: c.post("/api/scenarios/submit", headers=cat.auth(), json={
+        "question_id": cat.question("scenario")["question_id"],
+        "user_response": LONG_ANSWER * cat.rng.randint(1, 8),
+        "time_taken": cat.rng.randint(60, 1800),
+    }),
+    "login": login,
+    "me": lambda c, cat: c.get("/api/auth/me", headers=cat.auth()),
+}
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ACTIONS:
+            raise SystemExit(f"Unknown endpoint {name.strip()!r}; choose from {', '.join(ACTIONS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+async def prepare(client: httpx.AsyncClient, catalog: Catalog, sessions: int, users: int):
+    """Log in the virtual users and learn the question bank (not measured)"""
+    catalog.users = users
+    semaphore = asyncio.Semaphore(16)
+
+    async def one(i):
+        async with semaphore:
+            response = await client.post("/api/auth/login", json={"email": f"lt{i}@load.test", "password": PASSWORD})
+            response.raise_for_status()
+            return response.json()["session_token"]
+
+    picked = catalog.rng.sample(range(users), min(sessions, users))
+    catalog.sessions = list(await asyncio.gather(*(one(i) for i in picked)))
+    response = await client.get("/api/questions", headers=catalog.auth())
+    response.raise_for_status()
+    for question in response.json():
+        catalog.questions.setdefault(question["type"], []).append(question)
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.dropped = 0
+
+    def record(self, name: str, seconds: float, status: str, ok: bool):
+        self.latencies.setdefault(name, []).append(seconds)
+        by_status = self.statuses.setdefault(name, {})
+        by_status[status] = by_status.get(status, 0) + 1
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+async def drive(client: httpx.AsyncClient, catalog: Catalog, mix: Dict[str, float], rps: float,
+                duration: float, warmup: float, max_in_flight: int) -> Recorder:
+    recorder = Recorder()
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    measured_from = start + warmup
+    end = measured_from + duration
+    in_flight = set()
+
+    async def fire(name: str, scheduled: float):
+        try:
+            response = await ACTIONS[name](client, catalog)
+            status, ok = str(response.status_code), response.status_code < 400
+        except httpx.HTTPError as e:
+            status, ok = type(e).__name__, False
+        if scheduled >= measured_from:
+            recorder.record(name, loop.time() - scheduled, status, ok)
+
+    i = 0
+    while True:
+        scheduled = start + i / rps
+        if scheduled >= end:
+            break
+        i += 1
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            if scheduled >= measured_from:
+                recorder.dropped += 1
+            continue
+        task = asyncio.create_task(fire(catalog.rng.choices(names, weights)[0], scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+    if in_flight:
+        await asyncio.wait(in_flight)
+    return recorder
+
+
+# ========== REPORTS ==========
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(q / 100 * len(sorted_values) + 0.999999))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, Any]:
+    values = sorted(latencies)
+    ms = lambda seconds: round(seconds * 1000, 2)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "error_rate": round(errors / len(values), 4) if values else 0.0,
+        "throughput": round((len(values) - errors) / duration, 2),
+        "mean_ms": ms(sum(values) / len(values)) if values else 0.0,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "max_ms": ms(values[-1]) if values else 0.0,
+    }
+
+
+def build_result(args, recorder: Recorder, mix: Dict[str, float], label: str) -> Dict[str, Any]:
+    endpoints = {
+        name: {**summarize(recorder.latencies[name], recorder.errors.get(name, 0), args.duration),
+               "statuses": recorder.statuses[name]}
+        for name in sorted(recorder.latencies)
+    }
+    everything = [s for values in recorder.latencies.values() for s in values]
+    return {
+        "label": label,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "scenario": scenario_of(args, mix),
+        "dropped": recorder.dropped,
+        "total": summarize(everything, sum(recorder.errors.values()), args.duration),
+        "endpoints": endpoints,
+    }
+
+
+def scenario_of(args, mix: Dict[str, float]) -> Dict[str, Any]:
+    """What must match for two runs to be comparable"""
+    return {
+        "rps": args.rps,
+        "duration": args.duration,
+        "mix": mix,
+        "scale": scale_of(args),
+        "sessions": args.sessions,
+        "backend": "mongomock" if args.mongomock else ("external" if args.base_url else "mongodb"),
+        "workers": args.workers,
+        "llm_latency": args.llm_latency,
+        "compact_progress": bool(os.environ.get("COMPACT_PROGRESS")),
+        "signed_sessions": bool(os.environ.get("SESSION_SIGNING_KEY")),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(result: Dict[str, Any]):
+    header = f"{'endpoint':<16}{'count':>8}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["endpoints"].items()) + [("TOTAL", result["total"])]
+    for name, s in rows:
+        print(f"{name:<16}{s['count']:>8}{s['errors']:>8}{s['throughput']:>9.1f}"
+              f"{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}")
+    if result["dropped"]:
+        print(f"{result['dropped']} requests dropped at the in-flight limit")
+
+
+def save_result(result: Dict[str, Any], results_dir: Path) -> Path:
+    results_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    path = results_dir / f"{stamp}-{result['label']}.json"
+    path.write_text(json.dumps(result, indent=2, sort_keys=True))
+    return path
+
+
+def find_baseline(result: Dict[str, Any], results_dir: Path, exclude: Path) -> Optional[Path]:
+    """The most recent earlier run of the same scenario"""
+    for path in sorted(results_dir.glob("*.json"), reverse=True):
+        if path == exclude:
+            continue
+        try:
+            if json.loads(path.read_text()).get("scenario") == result["scenario"]:
+                return path
+        except ValueError:
+            continue
+    return None
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions of ``current`` against ``baseline``, one line each"""
+    problems = []
+    for name, now in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if not before:
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            if now[key] > before[key] * (1 + tolerance) and now[key] - before[key] > MIN_REGRESSION_MS:
+                problems.append(f"{name}: {key} {before[key]:.1f} -> {now[key]:.1f}")
+        if now["throughput"] < before["throughput"] * (1 - tolerance):
+            problems.append(f"{name}: throughput {before['throughput']:.1f} -> {now['throughput']:.1f} req/s")
+        if now["error_rate"] > before["error_rate"] + 0.01:
+            problems.append(f"{name}: error rate {before['error_rate']:.1%} -> {now['error_rate']:.1%}")
+    return problems
+
+
+def report_comparison(baseline_path: Path, baseline: Dict[str, Any], result: Dict[str, Any],
+                      tolerance: float) -> bool:
+    problems = compare(baseline, result, tolerance)
+    print(f"\nCompared with {baseline_path.name} ({baseline.get('git_commit') or 'unknown commit'}):")
+    for line in problems:
+        print(f"  REGRESSION {line}")
+    if not problems:
+        print(f"  no regressions beyond {tolerance:.0%}")
+    return not problems
+
+
+# ========== CLI ==========
+
+async def run(args) -> int:
+    rng = random.Random(args.seed_random)
+    mix = parse_mix(args.mix)
+
+    if not args.mongomock and not args.no_seed:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        mongo = AsyncIOMotorClient(args.mongo_url or "mongodb://localhost:27017")
+        try:
+            await ensure_seeded(mongo[args.db_name], scale_of(args), rng, force=args.reseed)
+        finally:
+            mongo.close()
+
+    llm_runner, llm_url = await start_fake_llm(args.llm_latency, rng)
+    process = None
+    base_url = args.base_url
+    try:
+        if not base_url:
+            port = free_port()
+            process = start_app(args, port, llm_url)
+            base_url = f"http://127.0.0.1:{port}"
+        else:
+            print(f"Using {base_url}; point its OPENAI_BASE_URL at {llm_url} to fake grading")
+        await wait_healthy(base_url, process, args.startup_timeout)
+
+        limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+            catalog = Catalog(rng)
+            await prepare(client, catalog, args.sessions, args.users)
+            print(f"Driving {args.rps:g} req/s for {args.duration:g} s (+{args.warmup:g} s warmup)")
+            recorder = await drive(client, catalog, mix, args.rps, args.duration, args.warmup, args.max_in_flight)
+    finally:
+        if process is not None:
+            stop_app(process)
+        await llm_runner.cleanup()
+
+    result = build_result(args, recorder, mix, args.label)
+    print_report(result)
+    results_dir = Path(args.results_dir)
+    path = save_result(result, results_dir)
+    print(f"\nSaved {path}")
+
+    baseline_path = Path(args.baseline) if args.baseline else find_baseline(result, results_dir, path)
+    if baseline_path is None:
+        print("No earlier run of this scenario to compare with")
+        return 0
+    ok = report_comparison(baseline_path, json.loads(baseline_path.read_text()), result, args.tolerance)
+    return 0 if ok else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the API and catch latency regressions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_scale(p):
+        p.add_argument("--users", type=int, default=1000)
+        p.add_argument("--responses", type=int, default=50_000, help="scenario responses to seed")
+        p.add_argument("--progress-per-user", type=int, default=30)
+        p.add_argument("--bookmarks-per-user", type=int, default=5)
+        p.add_argument("--db-name", default=DEFAULT_DB)
+        p.add_argument("--seed-random", type=int, default=1, help="random seed, for repeatable data and traffic")
+
+    run_parser = commands.add_parser("run", help="seed, start the app and drive traffic")
+    add_scale(run_parser)
+    run_parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL"))
+    run_parser.add_argument("--mongomock", action="store_true", help="serve from an in-memory mongomock database")
+    run_parser.add_argument("--base-url", help="test an app that is already running instead of starting one")
+    run_parser.add_argument("--no-seed", action="store_true", help="use the database as it is")
+    run_parser.add_argument("--reseed", action="store_true", help="seed even if the scale matches")
+    run_parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    run_parser.add_argument("--rps", type=float, default=50, help="target request rate")
+    run_parser.add_argument("--duration", type=float, default=60, help="measured seconds")
+    run_parser.add_argument("--warmup", type=float, default=10, help="unmeasured seconds before")
+    run_parser.add_argument("--mix", help="endpoint weights, e.g. questions=5,submit=1 (default: a typical mix)")
+    run_parser.add_argument("--sessions", type=int, default=200, help="virtual users logged in up front")
+    run_parser.add_argument("--max-in-flight", type=int, default=256)
+    run_parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    run_parser.add_argument("--llm-latency", type=float, default=0.5, help="fake LLM response time in seconds")
+    run_parser.add_argument("--startup-timeout", type=float, default=600)
+    run_parser.add_argument("--label", default="run", help="name for the results file")
+    run_parser.add_argument("--results-dir", default=str(RESULTS_DIR))
+    run_parser.add_argument("--baseline", help="results file to compare with (default: latest matching run)")
+    run_parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before a regression")
+
+    serve_parser = commands.add_parser("serve", help=argparse.SUPPRESS)
+    add_scale(serve_parser)
+    serve_parser.add_argument("--port", type=int, required=True)
+
+    compare_parser = commands.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.2)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        serve(args)
+        return 0
+    if args.command == "compare":
+        baseline, current = Path(args.baseline), Path(args.current)
+        print_report(json.loads(current.read_text()))
+        ok = report_comparison(baseline, json.loads(baseline.read_text()), json.loads(current.read_text()),
+                               args.tolerance)
+        return 0 if ok else 1
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Request metrics in the Prometheus text format, without extra dependencies.
+
+``MetricsMiddleware`` records, per route template (``/api/questions/{question_id}``,
+not the raw path, so label cardinality stays bounded):
+
+    http_requests_total{method, route, status}
+    http_request_duration_seconds{method, route}        histogram
+    http_requests_in_flight
+    http_request_phase_seconds_total{route, phase}      time spent in mongo / llm / serialize
+
+Phase time is collected per request in a context variable: MongoDB command
+durations come from the command listener in mongo_monitor.py (Motor runs
+commands in executor threads with the request's context copied), LLM calls are wrapped
+in ``timer("llm")``, and serialization - ``response_model`` validation,
+``jsonable_encoder`` and rendering - is timed by ``TimedRoute`` and
+``FastJSONResponse`` (fast_json.py).
+Comparing a route's phase totals with its duration sum shows where its time
+goes.
+
+``GET /metrics`` serves everything registered here; set ``METRICS_TOKEN`` to
+require ``Authorization: Bearer <token>``.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+# ========== METRIC TYPES ==========
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted(self.values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float):
+        with self.lock:
+            self.values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = buckets
+        self.values: Dict[LabelValues, List[float]] = {}  # bucket counts..., sum, count
+
+    def observe(self, *labels: str, value: float):
+        with self.lock:
+            row = self.values.get(labels)
+            if row is None:
+                row = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted((k, list(v)) for k, v in self.values.items())
+        lines = self._header()
+        for key, row in items:
+            for bound, count in zip(self.buckets, row):
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {_number(count)}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {_number(row[-1])}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(row[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {_number(row[-1])}")
+        return lines
+
+
+REGISTRY: List[_Metric] = []
+
+
+def render() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+# ========== HTTP METRICS ==========
+
+REQUESTS = Counter("http_requests_total", "HTTP requests", ("method", "route", "status"))
+DURATION = Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served")
+PHASE_SECONDS = Counter("http_request_phase_seconds_total",
+                        "Time spent per request phase (mongo, llm, serialize)", ("route", "phase"))
+
+# {"scope": ASGI scope, "phases": {phase: seconds}} of the request being served
+_request: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_metrics", default=None)
+
+
+def add_phase_time(phase: str, seconds: float):
+    """Attribute time to a phase of the current request (no-op outside a request)"""
+    request = _request.get()
+    if request is not None:
+        phases = request["phases"]
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+def phase_time(phase: str) -> float:
+    """Seconds attributed to a phase of the current request so far"""
+    request = _request.get()
+    return request["phases"].get(phase, 0.0) if request is not None else 0.0
+
+
+def current_route() -> str:
+    """Route template of the request being served, "background" outside one"""
+    request = _request.get()
+    return _route_template(request["scope"]) if request is not None else "background"
+
+
+@contextmanager
+def timer(phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase_time(phase, time.perf_counter() - started)
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streaming responses are timed to their last byte"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+        phases: Dict[str, float] = {}
+        # The router fills in scope["route"] once it has matched
+        token = _request.set({"scope": scope, "phases": phases})
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc(amount=1)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.inc(amount=-1)
+            _request.reset(token)
+            route = _route_template(scope)
+            REQUESTS.inc(scope["method"], route, str(status["code"]))
+            DURATION.observe(scope["method"], route, value=elapsed)
+            for phase, seconds in phases.items():
+                PHASE_SECONDS.inc(route, phase, amount=seconds)
+
@@ -0,0 +1,269 @@
+"""
+MongoDB command monitoring and the slow-query log.
+
+``CommandMonitor`` is registered on the Motor client as a pymongo command
+listener. For every command it records, labelled with the route of the
+request that issued it ("background" for startup jobs and the like):
+
+    mongodb_commands_total{command, collection, route, status}
+    mongodb_command_duration_seconds{command, collection, route}    histogram
+    mongodb_slow_commands_total{command, collection, route}
+    mongodb_collscans_total{collection, route}                      debug mode only
+
+and adds the time to the request's "mongo" phase (see metrics.py).
+
+Queries slower than ``MONGO_SLOW_MS`` (default 100, 0 disables) are logged
+with their shape - the filter/pipeline with every value replaced by ``?`` -
+and their winning plan, fetched with a ``queryPlanner`` explain and
+redacted the same way (filters, index bounds and parsed queries), so no
+user data reaches the log. ``MONGO_DEBUG_COLLSCAN=1`` explains every
+find/aggregate/count/distinct/findAndModify and flags plans that scan a whole
+collection. Plans are cached per shape for ``PLAN_TTL`` seconds, so each
+shape is explained at most once per interval however often it runs.
+
+Listener callbacks run on Motor's executor threads and must not block, so
+explains are scheduled on the event loop the monitor was bound to at
+startup.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = {"find", "aggregate", "count", "distinct", "findAndModify"}
+# Handshakes and the explains we issue ourselves
+IGNORED = {"hello", "ismaster", "isMaster", "ping", "endSessions", "explain", "saslStart",
+           "saslContinue", "buildInfo", "getLastError", "killCursors"}
+# Session and transport fields an explain must not carry
+NOT_EXPLAINED = {"lsid", "txnNumber", "autocommit", "startTransaction", "$clusterTime", "$db",
+                 "$readPreference", "readConcern", "writeConcern"}
+# The parts of a command that decide its plan
+SHAPE_FIELDS = ("filter", "query", "pipeline", "sort", "projection", "fields", "key", "update")
+# Plan fields that carry the query's literal values
+PLAN_VALUE_FIELDS = {"filter", "indexBounds", "parsedQuery", "transformBy"}
+# Plan fields that embed them in ways we cannot redact (SBE plans are text)
+PLAN_DROPPED_FIELDS = {"slotBasedPlan"}
+
+PLAN_TTL = 300
+MAX_PLANS = 5_000
+MAX_LOGGED_PLAN = 2_000
+_MISSING = object()
+
+COMMAND_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+COMMANDS = metrics.Counter("mongodb_commands_total", "MongoDB commands",
+                           ("command", "collection", "route", "status"))
+DURATION = metrics.Histogram("mongodb_command_duration_seconds", "MongoDB command latency",
+                             ("command", "collection", "route"), buckets=COMMAND_BUCKETS)
+SLOW = metrics.Counter("mongodb_slow_commands_total", "MongoDB commands over MONGO_SLOW_MS",
+                       ("command", "collection", "route"))
+COLLSCANS = metrics.Counter("mongodb_collscans_total", "Queries planned as a collection scan",
+                            ("collection", "route"))
+
+
+def slow_threshold() -> float:
+    """Seconds above which a command is logged, 0 when the slow log is off"""
+    return float(os.environ.get("MONGO_SLOW_MS", "100") or 0) / 1000
+
+
+def debug_collscan() -> bool:
+    return os.environ.get("MONGO_DEBUG_COLLSCAN", "").lower() in ("1", "true", "yes")
+
+
+# ========== SHAPES AND PLANS ==========
+
+def shape(value: Any) -> Any:
+    """The structure of a filter or pipeline with every value replaced by "?" """
+    if isinstance(value, dict):
+        return {k: shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [shape(v) for v in value]
+        # {"$in": [...]} of 3 ids and of 300 ids are the same query
+        if items and all(item == "?" for item in items):
+            return ["?"]
+        return items
+    return "?"
+
+
+def command_shape(command: Dict[str, Any]) -> str:
+    return json.dumps({k: shape(command[k]) for k in SHAPE_FIELDS if k in command}, sort_keys=True)
+
+
+def _plan_nodes(node: Any):
+    """Every plan stage (a dict with a "stage") anywhere in an explain result"""
+    if isinstance(node, dict):
+        if "stage" in node:
+            yield node
+        for value in node.values():
+            yield from _plan_nodes(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _plan_nodes(value)
+
+
+def winning_plans(explain: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The winning plans of an explain; aggregations have one per $cursor stage"""
+    plans = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "winningPlan":
+                    plans.append(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(explain)
+    return plans
+
+
+def redact_plan(node: Any) -> Any:
+    """A plan with every literal from the query replaced by "?", safe to log"""
+    if isinstance(node, dict):
+        return {k: shape(v) if k in PLAN_VALUE_FIELDS else redact_plan(v)
+                for k, v in node.items() if k not in PLAN_DROPPED_FIELDS}
+    if isinstance(node, list):
+        return [redact_plan(v) for v in node]
+    return node
+
+
+def summarize_plan(plan: Dict[str, Any]) -> str:
+    """``FETCH < IXSCAN(user_progress_user)`` style one-liner, outermost stage first"""
+    parts = []
+    for node in _plan_nodes(plan):
+        index = node.get("indexName")
+        parts.append(f"{node['stage']}({index})" if index else node["stage"])
+    return " < ".join(parts)
+
+
+def has_collscan(plans: List[Dict[str, Any]]) -> bool:
+    return any(node["stage"] == "COLLSCAN" for plan in plans for node in _plan_nodes(plan))
+
+
+# ========== LISTENER ==========
+
+class CommandMonitor(monitoring.CommandListener):
+    def __init__(self):
+        self.pending: Dict[Tuple[Any, int], Tuple[str, str, str, Optional[Tuple[str, Dict[str, Any]]]]] = {}
+        # (database, command, collection, shape) -> (explained at, has COLLSCAN); None while running
+        self.plans: Dict[Tuple[str, str, str, str], Optional[Tuple[float, bool]]] = {}
+        self.lock = threading.Lock()
+        self.client = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, client):
+        """Enable explains: call from the event loop the client is used on"""
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+
+    # pymongo callbacks (executor threads, request context copied)
+
+    def started(self, event):
+        name = event.command_name
+        if name in IGNORED:
+            return
+        command = event.command
+        collection = command.get("collection") if name == "getMore" else command.get(name)
+        explainable = name in EXPLAINABLE and self.loop is not None
+        self.pending[(event.connection_id, event.request_id)] = (
+            name,
+            collection if isinstance(collection, str) else "-",
+            metrics.current_route(),
+            (event.database_name, command) if explainable else None,
+        )
+
+    def succeeded(self, event):
+        self._finished(event, "ok")
+
+    def failed(self, event):
+        self._finished(event, "error")
+
+    def _finished(self, event, status: str):
+        entry = self.pending.pop((event.connection_id, event.request_id), None)
+        if entry is None:
+            return
+        name, collection, route, explain_source = entry
+        seconds = event.duration_micros / 1_000_000
+        COMMANDS.inc(name, collection, route, status)
+        DURATION.observe(name, collection, route, value=seconds)
+        metrics.add_phase_time("mongo", seconds)
+
+        threshold = slow_threshold()
+        slow = bool(threshold) and seconds >= threshold
+        if slow:
+            SLOW.inc(name, collection, route)
+        if explain_source is None or status != "ok" or not (slow or debug_collscan()):
+            return
+
+        database, command = explain_source
+        key = (database, name, collection, command_shape(command))
+        with self.lock:
+            plan = self.plans.get(key, _MISSING)
+            stale = plan is _MISSING or (plan is not None and plan[0] < time.monotonic() - PLAN_TTL)
+            if stale:
+                self.plans[key] = None  # claimed: one explain per shape at a time
+        if stale:
+            self._schedule(key, command, route, seconds if slow else None)
+            return
+        if plan and plan[1]:
+            COLLSCANS.inc(collection, route)
+        if slow:
+            note = "plan explained recently" if plan else "explain running"
+            logger.warning(f"Slow MongoDB {name} on {collection} from {route}: "
+                           f"{seconds * 1000:.0f} ms, shape {key[3]} ({note})")
+
+    # explains (event loop)
+
+    def _schedule(self, key, command: Dict[str, Any], route: str, slow_seconds: Optional[float]):
+        if len(self.plans) > MAX_PLANS:
+            self._sweep()
+        try:
+            asyncio.run_coroutine_threadsafe(self._explain(key, command, route, slow_seconds), self.loop)
+        except RuntimeError:  # loop closed (shutdown)
+            with self.lock:
+                self.plans.pop(key, None)
+
+    def _sweep(self):
+        cutoff = time.monotonic() - PLAN_TTL
+        with self.lock:
+            self.plans = {k: v for k, v in self.plans.items() if v is None or v[0] >= cutoff}
+
+    async def _explain(self, key, command: Dict[str, Any], route: str, slow_seconds: Optional[float]):
+        database, name, collection, command_key = key
+        explained = {k: v for k, v in command.items() if k not in NOT_EXPLAINED}
+        try:
+            result = await self.client[database].command({"explain": explained, "verbosity": "queryPlanner"})
+        except Exception as e:
+            with self.lock:
+                self.plans.pop(key, None)
+            logger.info(f"Explain of {name} on {collection} failed: {e}")
+            return
+
+        plans = winning_plans(result)
+        collscan = has_collscan(plans)
+        with self.lock:
+            self.plans[key] = (time.monotonic(), collscan)
+        summary = "; ".join(summarize_plan(plan) for plan in plans) or "no plan"
+        if collscan:
+            COLLSCANS.inc(collection, route)
+        if slow_seconds is not None:
+            plan_json = json.dumps([redact_plan(plan) for plan in plans], default=str)[:MAX_LOGGED_PLAN]
+            logger.warning(f"Slow MongoDB {name} on {collection} from {route}: "
+                           f"{slow_seconds * 1000:.0f} ms, shape {command_key}, plan {summary}: {plan_json}")
+        elif collscan:
+            logger.warning(f"COLLSCAN: {name} on {collection} from {route}, shape {command_key}, plan {summary}")
+
+
+monitor = CommandMonitor()
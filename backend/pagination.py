@@ -0,0 +1,32 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor carries the sort-key values of the last item a client received
+(``{"t": <datetime>, "id": "q_..."}``), encoded as URL-safe base64 of
+Extended JSON so datetimes survive the round trip. The next page is then
+a range query on an index rather than a ``skip``.
+"""
+import base64
+from typing import Any, Dict
+
+from bson import json_util
+
+
+class CursorError(ValueError):
+    """Raised for cursors that cannot be decoded"""
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    raw = json_util.dumps(values, json_options=json_util.RELAXED_JSON_OPTIONS)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        values = json_util.loads(base64.urlsafe_b64decode(token.encode("ascii")),
+                                 json_options=json_util.RELAXED_JSON_OPTIONS)
+    except Exception:
+        raise CursorError("Invalid cursor")
+    if not isinstance(values, dict):
+        raise CursorError("Invalid cursor")
+    return values
@@ -0,0 +1,139 @@
+"""
+Sliding-window rate limits for the auth endpoints.
+
+Login, forgot-password and reset-password are limited per client IP and per
+email (reset codes are six digits, so without a limit they can simply be
+enumerated). Checks run before any database lookup or bcrypt work.
+
+Two stores, chosen with ``RATE_LIMIT_STORE``:
+
+    memory (default)  exact sliding window (a deque of hit times per key),
+                      per worker process
+    mongo             sliding-window counter shared by every worker: hits are
+                      counted in fixed buckets (``rate_limits``, TTL-expired)
+                      and the previous bucket is weighted by how much of it
+                      still overlaps the window
+    off               no limits (load tests)
+
+Rejected attempts are not counted in memory, so hammering a limit does not
+extend it; the Mongo counter counts every attempt.
+"""
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional
+
+from pymongo import ReturnDocument
+
+# Keys kept in memory before idle ones are swept
+MAX_KEYS = 100_000
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    limit: int
+    window: float  # seconds
+
+
+RULES = {
+    "login_ip": Rule("login_ip", 20, 300),
+    "login_email": Rule("login_email", 10, 900),
+    "forgot_ip": Rule("forgot_ip", 5, 3600),
+    "forgot_email": Rule("forgot_email", 3, 3600),
+    "reset_ip": Rule("reset_ip", 10, 900),
+    "reset_email": Rule("reset_email", 5, 900),
+    # Resets without an email (older app versions) share one budget, so the
+    # code space cannot be swept from many addresses either
+    "reset_anonymous": Rule("reset_anonymous", 100, 900),
+}
+
+
+class RateLimited(Exception):
+    """Raised when a rule's limit is exceeded; ``retry_after`` is in seconds"""
+
+    def __init__(self, rule: Rule, retry_after: float):
+        super().__init__(f"Rate limit {rule.name} exceeded")
+        self.rule = rule
+        self.retry_after = max(1, int(retry_after + 0.999))
+
+
+def store() -> str:
+    return os.environ.get("RATE_LIMIT_STORE", "memory").lower()
+
+
+# ========== IN-MEMORY ==========
+
+class MemoryWindows:
+    def __init__(self):
+        self.hits: Dict[str, Deque[float]] = {}
+
+    def hit(self, rule: Rule, key: str, now: float) -> float:
+        """Record a hit; returns 0 when allowed, else seconds until one is"""
+        if len(self.hits) >= MAX_KEYS:
+            self.sweep(now)
+        hits = self.hits.setdefault(f"{rule.name}:{key}", deque())
+        while hits and hits[0] <= now - rule.window:
+            hits.popleft()
+        if len(hits) >= rule.limit:
+            return hits[0] + rule.window - now
+        hits.append(now)
+        return 0
+
+    def sweep(self, now: float):
+        longest = max(rule.window for rule in RULES.values())
+        self.hits = {k: v for k, v in self.hits.items() if v and v[-1] > now - longest}
+
+
+memory_windows = MemoryWindows()
+
+
+# ========== MONGO ==========
+
+async def _mongo_hit(db, rule: Rule, key: str, now: float) -> float:
+    bucket = int(now // rule.window)
+    current = await db.rate_limits.find_one_and_update(
+        {"_id": f"{rule.name}:{key}:{bucket}"},
+        {"$inc": {"n": 1},
+         "$setOnInsert": {"expires_at": datetime.fromtimestamp((bucket + 2) * rule.window, timezone.utc)}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    previous = await db.rate_limits.find_one({"_id": f"{rule.name}:{key}:{bucket - 1}"})
+    elapsed = now - bucket * rule.window
+    estimate = (previous["n"] if previous else 0) * (1 - elapsed / rule.window) + current["n"]
+    if estimate > rule.limit:
+        return rule.window - elapsed
+    return 0
+
+
+# ========== CHECKS ==========
+
+async def check(db, rule_name: str, key: Optional[str]):
+    """Count one attempt against a rule; raises RateLimited when over the limit"""
+    if not key or store() == "off":
+        return
+    rule = RULES[rule_name]
+    now = time.time()
+    key = key.lower()
+    if store() == "mongo":
+        retry_after = await _mongo_hit(db, rule, key, now)
+    else:
+        retry_after = memory_windows.hit(rule, key, now)
+    if retry_after > 0:
+        raise RateLimited(rule, retry_after)
+
+
+def client_ip(request) -> str:
+    """
+    The caller's address. Behind N trusted proxies (``TRUSTED_PROXY_HOPS``)
+    it is the Nth address from the right of X-Forwarded-For; otherwise the
+    socket peer, since the header is trivially spoofed.
+    """
+    hops = int(os.environ.get("TRUSTED_PROXY_HOPS", "0") or 0)
+    forwarded = [a.strip() for a in request.headers.get("x-forwarded-for", "").split(",") if a.strip()]
+    if hops and forwarded:
+        return forwarded[-min(hops, len(forwarded))]
+    return request.client.host if request.client else "unknown"
@@ -0,0 +1,207 @@
+"""
+Statute / directive reference parsing and the reference -> questions index.
+
+The ``reference`` field on questions is free text ("720 ILCS 5/12-1,
+5/12-3", "General Order G03-02: Use of Force", "Miranda v. Arizona (1966)").
+``parse_references`` turns it into canonical keys:
+
+    ilcs:720:5:12-3          720 ILCS 5/12-3 (subsections like "(d)" dropped)
+    ilcs:430:65              430 ILCS 65/ (whole act)
+    directive:G03-02-01      CPD General / Special Orders
+    case:miranda-v-arizona   court decisions
+    amendment:4              4th Amendment, Amendment IV
+    usc:18:2703              18 USC 2703
+    decree:consent-decree    the CPD Consent Decree
+
+Keys are hierarchical: ``ilcs:720:5`` is the parent of ``ilcs:720:5:12-3``
+and ``directive:G03-02`` of ``directive:G03-02-01``.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+ILCS_RE = re.compile(r"\b(\d{2,4})\s*ILCS\s*(\d+)\s*/\s*([0-9][0-9A-Za-z.\-]*)?", re.IGNORECASE)
+# "5/12-3" following an ILCS citation in the same text reuses its chapter
+ILCS_CONTINUATION_RE = re.compile(r"(?<![\w/.\-])(\d+)/([0-9][0-9A-Za-z.\-]*)")
+ILCS_ACT_ONLY_RE = re.compile(r"\b(\d{2,4})\s*ILCS\s*(\d+)\b(?!\s*/)", re.IGNORECASE)
+DIRECTIVE_RE = re.compile(r"\b([GS])(\d{2}(?:-\d{2})+)\b", re.IGNORECASE)
+CASE_RE = re.compile(
+    r"\b((?:[A-Z][\w'.]*)(?: [A-Z][\w'.]*)*) v\. ((?:[A-Z][\w']*)(?: [A-Z][\w']*)*)"
+)
+AMENDMENT_RE = re.compile(
+    r"\b(?:(\d{1,2})(?:st|nd|rd|th)\s+Amendment|Amendment\s+([IVX]+|\d{1,2}))\b", re.IGNORECASE
+)
+USC_RE = re.compile(r"\b(\d{1,2})\s*U\.?S\.?C\.?\s*§?\s*(\d+[a-z]?)\b", re.IGNORECASE)
+CONSENT_DECREE_RE = re.compile(r"\bconsent decree\b", re.IGNORECASE)
+
+ROMAN = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7, "VIII": 8,
+         "IX": 9, "X": 10, "XI": 11, "XII": 12, "XIII": 13, "XIV": 14}
+ORDINALS = {1: "1st", 2: "2nd", 3: "3rd"}
+
+KEY_KINDS = ("ilcs", "directive", "case", "amendment", "usc", "decree")
+
+
+def _section(raw: Optional[str]) -> Optional[str]:
+    """Strip trailing punctuation and words glued onto a section number"""
+    if not raw:
+        return None
+    match = re.match(r"\d+(?:[.\-]\d+)*", raw)
+    return match.group() if match else None
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def parse_references(text: Optional[str]) -> List[str]:
+    """Canonical reference keys found in a free-text reference, in order of appearance"""
+    if not text:
+        return []
+    found = []  # (position, key)
+
+    chapter = None
+    for match in ILCS_RE.finditer(text):
+        chapter = match.group(1)
+        section = _section(match.group(3))
+        key = f"ilcs:{chapter}:{match.group(2)}" + (f":{section}" if section else "")
+        found.append((match.start(), key))
+    if chapter:
+        covered = [m.span() for m in ILCS_RE.finditer(text)]
+        for match in ILCS_CONTINUATION_RE.finditer(text):
+            if any(start <= match.start() < end for start, end in covered):
+                continue
+            section = _section(match.group(2))
+            if section:
+                found.append((match.start(), f"ilcs:{chapter}:{match.group(1)}:{section}"))
+    for match in ILCS_ACT_ONLY_RE.finditer(text):
+        found.append((match.start(), f"ilcs:{match.group(1)}:{match.group(2)}"))
+
+    for match in DIRECTIVE_RE.finditer(text):
+        found.append((match.start(), f"directive:{match.group(1).upper()}{match.group(2)}"))
+
+    for match in CASE_RE.finditer(text):
+        found.append((match.start(), f"case:{_slug(match.group(1))}-v-{_slug(match.group(2))}"))
+
+    for match in AMENDMENT_RE.finditer(text):
+        raw = match.group(1) or match.group(2)
+        number = ROMAN.get(raw.upper()) if not raw.isdigit() else int(raw)
+        if number:
+            found.append((match.start(), f"amendment:{number}"))
+
+    for match in USC_RE.finditer(text):
+        found.append((match.start(), f"usc:{match.group(1)}:{match.group(2).lower()}"))
+
+    if CONSENT_DECREE_RE.search(text):
+        found.append((CONSENT_DECREE_RE.search(text).start(), "decree:consent-decree"))
+
+    keys: List[str] = []
+    for _, key in sorted(found):
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+def normalize_key(value: str) -> Optional[str]:
+    """Accept a canonical key or any free-text citation and return its canonical key"""
+    value = value.strip()
+    kind = value.split(":", 1)[0].lower()
+    if kind in KEY_KINDS and ":" in value:
+        if kind == "directive":
+            return "directive:" + value.split(":", 1)[1].upper()
+        return value.lower()
+    keys = parse_references(value)
+    return keys[0] if keys else None
+
+
+def reference_label(key: str) -> str:
+    """Human-readable citation for a canonical key"""
+    kind, _, rest = key.partition(":")
+    parts = rest.split(":")
+    if kind == "ilcs":
+        label = f"{parts[0]} ILCS {parts[1]}"
+        return label + (f"/{parts[2]}" if len(parts) > 2 else "")
+    if kind == "directive":
+        return rest
+    if kind == "case":
+        plaintiff, _, defendant = rest.partition("-v-")
+        title = lambda s: " ".join(w.capitalize() for w in s.split("-"))
+        return f"{title(plaintiff)} v. {title(defendant)}"
+    if kind == "amendment":
+        number = int(rest)
+        return f"{ORDINALS.get(number, f'{number}th')} Amendment"
+    if kind == "usc":
+        return f"{parts[0]} U.S.C. § {parts[1]}"
+    if kind == "decree":
+        return "Consent Decree"
+    return key
+
+
+def _is_child(key: str, parent: str) -> bool:
+    if not key.startswith(parent) or key == parent:
+        return False
+    return key[len(parent)] in (":", "-")
+
+
+class ReferenceIndex:
+    """reference_key -> question_ids, maintained alongside question writes"""
+
+    def __init__(self):
+        self.questions_by_key: Dict[str, Set[str]] = {}
+        self.keys_by_question: Dict[str, List[str]] = {}
+
+    def __len__(self):
+        return len(self.questions_by_key)
+
+    def clear(self):
+        self.__init__()
+
+    def rebuild(self, questions: Iterable[Dict]):
+        self.clear()
+        for question in questions:
+            self.add(question)
+
+    def add(self, question: Dict):
+        qid = question["question_id"]
+        self.remove(qid)
+        keys = parse_references(question.get("reference"))
+        if not keys:
+            return
+        self.keys_by_question[qid] = keys
+        for key in keys:
+            self.questions_by_key.setdefault(key, set()).add(qid)
+
+    def remove(self, question_id: str):
+        for key in self.keys_by_question.pop(question_id, []):
+            ids = self.questions_by_key.get(key)
+            if ids is None:
+                continue
+            ids.discard(question_id)
+            if not ids:
+                del self.questions_by_key[key]
+
+    def lookup(self, key: str, include_children: bool = True) -> Set[str]:
+        ids = set(self.questions_by_key.get(key, ()))
+        if include_children:
+            for other, other_ids in self.questions_by_key.items():
+                if _is_child(other, key):
+                    ids |= other_ids
+        return ids
+
+    def related(self, question_ids: Iterable[str], exclude: Iterable[str] = ()) -> List[Dict]:
+        """Other references cited by the given questions, most shared first (``exclude`` covers subsections too)"""
+        exclude = set(exclude)
+        counts: Dict[str, int] = {}
+        for qid in question_ids:
+            for key in self.keys_by_question.get(qid, []):
+                if not any(key == e or _is_child(key, e) for e in exclude):
+                    counts[key] = counts.get(key, 0) + 1
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return [{"key": key, "label": reference_label(key), "shared_questions": count}
+                for key, count in ranked]
+
+    def listing(self, kind: Optional[str] = None) -> List[Dict]:
+        return [
+            {"key": key, "label": reference_label(key), "kind": key.split(":", 1)[0],
+             "question_count": len(ids)}
+            for key, ids in sorted(self.questions_by_key.items())
+            if not kind or key.startswith(kind + ":")
+        ]
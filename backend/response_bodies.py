@@ -0,0 +1,192 @@
+"""
+Compressed storage for the long text of scenario responses.
+
+``scenario_responses`` is scanned by /stats, the leaderboard and the admin
+analytics, which only need ``ai_grade``; the answer and feedback text make
+up nearly all of each document. Text longer than ``INLINE_LIMIT`` is
+therefore moved to a side collection, compressed:
+
+    scenario_responses:        {response_id, user_id, question_id, ai_grade, time_taken,
+                                submitted_at, preview, has_body: true}
+    scenario_response_bodies:  {response_id, user_id, codec, user_response, ai_feedback: Binary,
+                                size, created_at}
+
+Short responses stay inline, as do documents written before this existed;
+``attach_bodies`` puts the text back for the few reads that need it. The
+codec is zstd (``zstandard`` is pinned in requirements.txt) and zlib where
+the package is missing; each body records its codec, and zstd bodies need
+``zstandard`` to be read back.
+
+    python response_bodies.py [--dry-run]    # move existing long text out of line
+"""
+import asyncio
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import Binary
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Combined text length above which a response body is stored out of line
+INLINE_LIMIT = 512
+PREVIEW_LENGTH = 160
+TEXT_FIELDS = ("user_response", "ai_feedback")
+ZSTD_LEVEL = 6
+ZLIB_LEVEL = 6
+BATCH_SIZE = 500
+
+
+# ========== CODECS ==========
+
+def default_codec() -> str:
+    return "zstd" if zstandard else "zlib"
+
+
+def compress(text: Optional[str], codec: str) -> Optional[Binary]:
+    if text is None:
+        return None
+    raw = text.encode("utf-8")
+    if codec == "zstd":
+        return Binary(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw))
+    return Binary(zlib.compress(raw, ZLIB_LEVEL))
+
+
+def decompress(data: Optional[bytes], codec: str) -> Optional[str]:
+    if data is None:
+        return None
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed response bodies")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raw = zlib.decompress(data)
+    return raw.decode("utf-8")
+
+
+# ========== WRITES ==========
+
+def split(response: Dict[str, Any], now: Optional[datetime] = None) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Split a scenario response into the document for ``scenario_responses``
+    and, when its text is long, a compressed body document (else None).
+    """
+    size = sum(len(response.get(field) or "") for field in TEXT_FIELDS)
+    if size <= INLINE_LIMIT:
+        return response, None
+    codec = default_codec()
+    body = {
+        "response_id": response["response_id"],
+        "user_id": response["user_id"],
+        "codec": codec,
+        **{field: compress(response.get(field), codec) for field in TEXT_FIELDS},
+        "size": size,
+        "created_at": now or datetime.now(timezone.utc),
+    }
+    hot = {k: v for k, v in response.items() if k not in TEXT_FIELDS}
+    hot["preview"] = (response.get("user_response") or "")[:PREVIEW_LENGTH]
+    hot["has_body"] = True
+    return hot, body
+
+
+async def insert_response(db, response: Dict[str, Any]):
+    """Insert a scenario response, its body first so readers never miss it"""
+    hot, body = split(response)
+    if body:
+        await db.scenario_response_bodies.insert_one(body)
+    await db.scenario_responses.insert_one(dict(hot))
+
+
+async def delete_bodies(db, user_id: str):
+    await db.scenario_response_bodies.delete_many({"user_id": user_id})
+
+
+# ========== READS ==========
+
+async def attach_bodies(db, responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill in the text of responses stored out of line (one query for the lot)"""
+    ids = [r["response_id"] for r in responses if r.get("has_body")]
+    if not ids:
+        return responses
+    bodies = {
+        b["response_id"]: b async for b in db.scenario_response_bodies.find(
+            {"response_id": {"$in": ids}}, {"_id": 0}
+        )
+    }
+    for response in responses:
+        body = bodies.get(response["response_id"])
+        if body:
+            for field in TEXT_FIELDS:
+                response[field] = decompress(body.get(field), body["codec"])
+            response.pop("preview", None)
+            response.pop("has_body", None)
+    return responses
+
+
+# ========== MIGRATION ==========
+
+async def offload_existing(db, dry_run: bool = False) -> Dict[str, int]:
+    """Move the long inline text of existing responses into compressed bodies"""
+    from pymongo import ReplaceOne, UpdateOne
+
+    stats = {"scanned": 0, "moved": 0, "bytes_before": 0, "bytes_after": 0}
+    bodies: List[Any] = []
+    updates: List[Any] = []
+
+    async def flush():
+        if bodies and not dry_run:
+            # Bodies first: a response never points at a body that is not there
+            await db.scenario_response_bodies.bulk_write(bodies, ordered=False)
+            await db.scenario_responses.bulk_write(updates, ordered=False)
+        bodies.clear()
+        updates.clear()
+
+    async for response in db.scenario_responses.find({"has_body": {"$ne": True}}, {"_id": 0}):
+        stats["scanned"] += 1
+        hot, body = split(response)
+        if not body:
+            continue
+        stats["moved"] += 1
+        stats["bytes_before"] += body["size"]
+        stats["bytes_after"] += sum(len(body[field] or b"") for field in TEXT_FIELDS)
+        # Upsert, so an interrupted run can simply be repeated
+        bodies.append(ReplaceOne({"response_id": body["response_id"]}, body, upsert=True))
+        updates.append(UpdateOne(
+            {"response_id": response["response_id"]},
+            {"$set": {"preview": hot["preview"], "has_body": True},
+             "$unset": {field: "" for field in TEXT_FIELDS}}
+        ))
+        if len(bodies) >= BATCH_SIZE:
+            await flush()
+    await flush()
+    return stats
+
+
+async def main(argv: Optional[List[str]] = None):
+    import argparse
+    import os
+    from pathlib import Path
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Move long scenario response text into compressed bodies")
+    parser.add_argument("--dry-run", action="store_true", help="report what would move without writing")
+    args = parser.parse_args(argv)
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    try:
+        stats = await offload_existing(db, dry_run=args.dry_run)
+        print(f"{stats['moved']} of {stats['scanned']} responses moved ({default_codec()}): "
+              f"{stats['bytes_before']} -> {stats['bytes_after']} bytes")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,258 @@
+"""
+In-process full-text index over the question bank.
+
+An inverted index with BM25 ranking (fields weighted, BM25F-style), prefix
+matching and highlight snippets. The tokenizer keeps statute and directive
+citations intact - "720 ILCS 5/12-3" yields "720", "ilcs", "5/12-3" (plus
+the shorter citations inside it, "5/12" and "12-3", and its parts "5", "12",
+"3") and "S06-02" yields "s06-02", "s06", "02" - so citations can be
+searched exactly as they are written, in full or from any section on.
+
+The index lives in the server process. It is built from MongoDB at startup
+and updated incrementally whenever a question is created, updated or
+deleted, so a query never touches the database.
+"""
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Indexed fields and their weights
+FIELD_WEIGHTS: Dict[str, float] = {
+    "title": 2.0,
+    "question": 2.0,
+    "reference": 1.5,
+    "content": 1.0,
+    "options": 0.7,
+    "explanation": 0.8,
+}
+
+# Fields returned with every hit so clients can render a result list
+RESULT_FIELDS = ("question_id", "type", "category_id", "category_name", "title",
+                 "question", "reference", "difficulty")
+
+K1 = 1.2
+B = 0.75
+PREFIX_BOOST = 0.6
+MAX_PREFIX_EXPANSION = 50
+SNIPPET_RADIUS = 80
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[./\-][a-z0-9]+)*")
+SEPARATOR_RE = re.compile(r"([./\-])")
+# Longest run of parts indexed from inside a compound (bounds long dotted tokens)
+MAX_SUBTERM_PARTS = 6
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the
+this to was were what when which who will with
+""".split())
+
+
+def _field_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+def subterms(token: str) -> List[str]:
+    """
+    Every run of consecutive parts of a compound with its separators, the
+    whole token excepted: "5/12-3.05" -> "5", "5/12", "5/12-3", "12",
+    "12-3", "12-3.05", "3", "3.05", "05"
+    """
+    pieces = SEPARATOR_RE.split(token)  # parts at even positions
+    n = len(pieces) // 2 + 1
+    terms = []
+    for i in range(n):
+        for j in range(i + 1, min(n, i + MAX_SUBTERM_PARTS) + 1):
+            if j - i < n:
+                terms.append("".join(pieces[2 * i:2 * j - 1]))
+    return terms
+
+
+def tokenize(text: str) -> List[str]:
+    """Index terms for a piece of text; compound citations also yield their subterms"""
+    terms = []
+    for match in TOKEN_RE.finditer(text.lower()):
+        token = match.group()
+        if token in STOPWORDS:
+            continue
+        terms.append(token)
+        if not token.isalnum():
+            terms.extend(t for t in subterms(token) if t not in STOPWORDS)
+    return terms
+
+
+def _query_terms(query: str) -> List[str]:
+    """Query terms, compound citations kept whole (their parts would dilute the match)"""
+    seen = []
+    for match in TOKEN_RE.finditer(query.lower()):
+        token = match.group()
+        if token not in STOPWORDS and token not in seen:
+            seen.append(token)
+    return seen
+
+
+class SearchIndex:
+    def __init__(self):
+        # term -> {question_id: weighted term frequency}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.vocabulary: List[str] = []  # sorted, for prefix lookups
+        self.doc_lengths: Dict[str, float] = {}
+        self.doc_terms: Dict[str, Set[str]] = {}
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.total_length = 0.0
+
+    def __len__(self):
+        return len(self.docs)
+
+    # ---------- maintenance ----------
+
+    def clear(self):
+        self.__init__()
+
+    def rebuild(self, questions: Iterable[Dict[str, Any]]):
+        self.clear()
+        for question in questions:
+            self.add(question)
+
+    def add(self, question: Dict[str, Any]):
+        qid = question["question_id"]
+        if qid in self.docs:
+            self.remove(qid)
+
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        stored = {field: question.get(field) for field in RESULT_FIELDS}
+        for field, weight in FIELD_WEIGHTS.items():
+            text = _field_text(question.get(field))
+            if not text:
+                continue
+            stored.setdefault("_text", {})[field] = text
+            for term in tokenize(text):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+                length += weight
+
+        for term, tf in frequencies.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                insort(self.vocabulary, term)
+            posting[qid] = tf
+
+        self.docs[qid] = stored
+        self.doc_terms[qid] = set(frequencies)
+        self.doc_lengths[qid] = length
+        self.total_length += length
+
+    def remove(self, question_id: str):
+        if question_id not in self.docs:
+            return
+        for term in self.doc_terms.pop(question_id):
+            posting = self.postings[term]
+            posting.pop(question_id, None)
+            if not posting:
+                del self.postings[term]
+                del self.vocabulary[bisect_left(self.vocabulary, term)]
+        self.total_length -= self.doc_lengths.pop(question_id)
+        del self.docs[question_id]
+
+    # ---------- querying ----------
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """The term itself plus vocabulary terms it is a prefix of"""
+        matches = [(term, 1.0)] if term in self.postings else []
+        if len(term) >= 2:
+            start = bisect_left(self.vocabulary, term)
+            for candidate in self.vocabulary[start:start + MAX_PREFIX_EXPANSION + 1]:
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    matches.append((candidate, PREFIX_BOOST))
+        return matches
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        type: Optional[str] = None,
+        category_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        terms = _query_terms(query)
+        n_docs = len(self.docs)
+        if not terms or not n_docs:
+            return {"total": 0, "results": []}
+
+        avg_length = self.total_length / n_docs
+        scores: Dict[str, float] = {}
+        matched_terms: Set[str] = set()
+        for term in terms:
+            for index_term, boost in self._expand(term):
+                posting = self.postings[index_term]
+                matched_terms.add(index_term)
+                idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                for qid, tf in posting.items():
+                    norm = K1 * (1 - B + B * self.doc_lengths[qid] / avg_length)
+                    scores[qid] = scores.get(qid, 0.0) + boost * idf * tf * (K1 + 1) / (tf + norm)
+
+        if type or category_id:
+            scores = {
+                qid: score for qid, score in scores.items()
+                if (not type or self.docs[qid]["type"] == type)
+                and (not category_id or self.docs[qid]["category_id"] == category_id)
+            }
+
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        results = []
+        for qid, score in ranked:
+            doc = self.docs[qid]
+            hit = {field: doc.get(field) for field in RESULT_FIELDS}
+            hit["score"] = round(score, 4)
+            hit.update(_snippet(doc.get("_text", {}), matched_terms))
+            results.append(hit)
+        return {"total": len(scores), "results": results}
+
+
+def _snippet(texts: Dict[str, str], terms: Set[str]) -> Dict[str, Any]:
+    """
+    A window of text around the first match, in field-weight order, with
+    character offsets of every matched token inside the snippet.
+    """
+    for field in FIELD_WEIGHTS:
+        text = texts.get(field)
+        if not text:
+            continue
+        spans = []
+        lowered = text.lower()
+        for match in TOKEN_RE.finditer(lowered):
+            token = match.group()
+            parts = subterms(token) if not token.isalnum() else []
+            if token in terms or any(p in terms for p in parts):
+                spans.append((match.start(), match.end()))
+        if not spans:
+            continue
+
+        start = max(0, spans[0][0] - SNIPPET_RADIUS)
+        end = min(len(text), spans[0][1] + SNIPPET_RADIUS)
+        # Do not cut words in half
+        if start > 0:
+            space = text.find(" ", start)
+            start = space + 1 if 0 <= space < spans[0][0] else start
+        if end < len(text):
+            space = text.rfind(" ", spans[0][1], end)
+            end = space if space > 0 else end
+
+        snippet = text[start:end]
+        highlights = [[s - start, e - start] for s, e in spans if s >= start and e <= end]
+        prefix = "…" if start > 0 else ""
+        if prefix:
+            highlights = [[s + 1, e + 1] for s, e in highlights]
+        return {
+            "snippet_field": field,
+            "snippet": prefix + snippet + ("…" if end < len(text) else ""),
+            "highlights": highlights,
+        }
+    return {"snippet_field": None, "snippet": None, "highlights": []}
@@ -1,18 +1,45 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Cookie, Response, Header
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Cookie, Response, Header, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+import asyncio
 import os
 import logging
+import time
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, EmailStr, ValidationError
+from typing import List, Optional, Dict, Any, Union
 import uuid
+import hashlib
 from datetime import datetime, timezone, timedelta
 import bcrypt
 import httpx
 
+from content_packs import apply_all_packs, load_catalog
+from bulk_import import IMPORT_KEYS, BulkImportError, gunzip_chunks, import_stream, iter_lines, log_progress
+from catalog_swap import SwapValidationError, rollback
+from bulk_export import ExportError, decode_checkpoint, gzip_stream, parse_collections
+from search_index import SearchIndex
+from references import ReferenceIndex, normalize_key, reference_label
+from db_indexes import ensure_indexes
+from spaced_repetition import due_cards, quality_from_score, record_review
+from attempts import grade_attempts, record_attempts
+from exams import ExamError, create_exam, finish_exam, get_exam, list_exams, save_answers
+import user_activity
+import compact_progress
+import session_tokens
+import guests
+import rate_limit
+import metrics
+from fast_json import FastJSONResponse, TimedRoute, projection, trusted, with_defaults
+import mongo_monitor
+from pagination import CursorError, decode_cursor, encode_cursor
+from sync import changes_since, record_deletes, record_reset
+from response_bodies import attach_bodies, delete_bodies, insert_response
+
 # Try to import emergentintegrations (only available on Emergent platform)
 try:
     from emergentintegrations.llm.chat import LlmChat, UserMessage
@@ -27,22 +54,30 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[mongo_monitor.monitor])
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Create a router with the /api prefix
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", route_class=TimedRoute)
 
 # Current app version - UPDATE THIS WHEN RELEASING NEW VERSIONS
 CURRENT_APP_VERSION = "1.5.0"
 MINIMUM_REQUIRED_VERSION = "1.5.0"
 
+# In-memory full-text index over the question bank (see search_index.py)
+search_index = SearchIndex()
+# question_id -> question as the API returns it, for joins without a DB round-trip
+question_catalog: Dict[str, Dict[str, Any]] = {}
+# reference key (statute / directive / case) -> question_ids (see references.py)
+reference_index = ReferenceIndex()
+
 # LLM Keys
 EMERGENT_LLM_KEY = os.environ.get('EMERGENT_LLM_KEY')
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+OPENAI_BASE_URL = os.environ.get('OPENAI_BASE_URL', 'https://api.openai.com/v1')
 
 # ========== MODELS ==========
 
@@ -76,6 +111,7 @@ class Category(BaseModel):
     name: str
     description: str
     order: int = 0
+    updated_at: Optional[datetime] = None
 
 class Question(BaseModel):
     question_id: str
@@ -100,6 +136,21 @@ class Question(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+class QuestionWithProgress(Question):
+    progress: Optional[Dict[str, Any]] = None  # Only with ?with_progress=true
+
+class RelatedReference(BaseModel):
+    key: str
+    label: str
+    shared_questions: int
+
+class ReferenceQuestions(BaseModel):
+    key: str
+    label: str
+    total: int
+    questions: List[Question]
+    related: List[RelatedReference]  # Other references the same questions cite, top 10
+
 class QuestionCreate(BaseModel):
     type: str
     category_id: str
@@ -116,10 +167,19 @@ class UserProgress(BaseModel):
     user_id: str
     question_id: str
     bookmarked: bool = False
+    bookmarked_at: Optional[datetime] = None
     attempts: int = 0
     last_score: Optional[float] = None
     last_attempted: Optional[datetime] = None
+    # Spaced-repetition schedule (see spaced_repetition.py)
+    ease: Optional[float] = None
+    interval_days: Optional[int] = None
+    repetitions: Optional[int] = None
+    lapses: Optional[int] = None
+    due_at: Optional[datetime] = None
+    last_reviewed: Optional[datetime] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class ScenarioResponse(BaseModel):
     response_id: str
@@ -136,9 +196,36 @@ class ScenarioSubmit(BaseModel):
     user_response: str
     time_taken: int
 
+class ReviewSubmit(BaseModel):
+    quality: int = Field(ge=0, le=5)  # 0-2 forgotten, 3 hard, 4 good, 5 easy
+
+class AttemptSubmit(BaseModel):
+    question_id: str
+    selected: Optional[List[str]] = None  # MCQs and practice-exam items: the chosen options, scored server-side
+    correct: Optional[bool] = None  # Flashcards: the user's own call
+
+class AttemptBatch(BaseModel):
+    attempts: List[AttemptSubmit] = Field(max_length=500)
+
+class ExamCreate(BaseModel):
+    count: int = Field(default=50, ge=1, le=200)
+    category_id: Optional[str] = None
+    duration_minutes: int = Field(default=90, ge=1, le=600)
+
+class ExamAnswers(BaseModel):
+    answers: Dict[str, List[str]]  # question_id -> selected options
+
+class ProgressLookup(BaseModel):
+    question_ids: Optional[List[str]] = Field(default=None, max_length=1000)
+    category_id: Optional[str] = None
+
 class BookmarkToggle(BaseModel):
     question_id: str
 
+class BookmarkBulk(BaseModel):
+    question_ids: List[str] = Field(max_length=1000)
+    bookmarked: bool = True
+
 # ========== AUTH HELPERS ==========
 
 def hash_password(password: str) -> str:
@@ -160,6 +247,21 @@ async def get_current_user(
     if not token:
         return None
     
+    # Signed tokens are checked without a database lookup (see session_tokens.py)
+    if session_tokens.is_signed(token):
+        claims = session_tokens.verify(token) if session_tokens.enabled() else None
+        if not claims or await session_tokens.revocations.is_revoked(db, claims):
+            return None
+        user_activity.buffer.seen(claims["uid"])
+        return User(
+            user_id=claims["uid"],
+            email=claims["email"],
+            name=claims["name"],
+            picture=claims.get("picture"),
+            role=claims["role"],
+            created_at=datetime.fromtimestamp(claims["cat"], timezone.utc)
+        )
+    
     session = await db.user_sessions.find_one(
         {"session_token": token},
         {"_id": 0}
@@ -183,9 +285,85 @@ async def get_current_user(
     )
     
     if user_doc:
+        user_activity.buffer.seen(user_doc["user_id"])
         return User(**user_doc)
     return None
 
+async def new_session(user_doc: Dict[str, Any], days: int) -> str:
+    """A session token: signed and stateless with SESSION_SIGNING_KEY, else a user_sessions row"""
+    if session_tokens.enabled():
+        return session_tokens.issue(user_doc, days)
+    session_token = f"session_{uuid.uuid4().hex}"
+    await db.user_sessions.insert_one({
+        "user_id": user_doc["user_id"],
+        "session_token": session_token,
+        "expires_at": datetime.now(timezone.utc) + timedelta(days=days),
+        "created_at": datetime.now(timezone.utc)
+    })
+    return session_token
+
+def device_fingerprint(request: Request, device_id: Optional[str]) -> str:
+    """
+    Stable per-device key for reusing guest sessions: the app's own device id
+    (X-Device-Id) when it sends one, else client address and user agent.
+    Only a hash is stored.
+    """
+    raw = device_id or f"{request.client.host if request.client else ''}|{request.headers.get('user-agent', '')}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+async def reuse_guest_session(request: Request, device_id: Optional[str], user_id: str) -> str:
+    """This device's guest session token, extended by another 7 days, or a new one"""
+    now = datetime.now(timezone.utc)
+    query = {"device_fingerprint": device_fingerprint(request, device_id)}
+    renew = {
+        "$set": {"user_id": user_id, "expires_at": now + timedelta(days=7), "last_activity": now},
+        "$setOnInsert": {"session_token": f"session_{uuid.uuid4().hex}", "is_guest": True, "created_at": now},
+    }
+    try:
+        session = await db.user_sessions.find_one_and_update(
+            query, renew, projection={"_id": 0, "session_token": 1},
+            upsert=True, return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # A concurrent login from the same device created it first
+        session = await db.user_sessions.find_one_and_update(
+            query, renew, projection={"_id": 0, "session_token": 1},
+            return_document=ReturnDocument.AFTER
+        )
+    return session["session_token"]
+
+async def session_metrics() -> Dict[str, Any]:
+    """How big user_sessions is; expired sessions are removed by a TTL index (db_indexes.py)"""
+    now = datetime.now(timezone.utc)
+    metrics = {
+        "documents": await db.user_sessions.estimated_document_count(),
+        "guest": await db.user_sessions.count_documents({"is_guest": True}),
+        "expired_pending": await db.user_sessions.count_documents({"expires_at": {"$lte": now}}),
+        "password_resets": await db.password_resets.estimated_document_count(),
+    }
+    try:
+        coll_stats = await db.command("collStats", "user_sessions")
+        metrics["size_bytes"] = coll_stats.get("size")
+        metrics["index_bytes"] = coll_stats.get("totalIndexSize")
+    except Exception as e:
+        logger.debug(f"collStats on user_sessions failed: {e}")
+    return metrics
+
+async def enforce_rate_limits(request: Request, prefix: str, email: Optional[str] = None):
+    """Per-IP then per-email limits for an auth endpoint; 429 with Retry-After when exceeded"""
+    try:
+        await rate_limit.check(db, f"{prefix}_ip", rate_limit.client_ip(request))
+        if email:
+            await rate_limit.check(db, f"{prefix}_email", email)
+        elif f"{prefix}_anonymous" in rate_limit.RULES:
+            await rate_limit.check(db, f"{prefix}_anonymous", "all")
+    except rate_limit.RateLimited as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many attempts. Please wait and try again.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
 async def require_user(user: Optional[User] = Depends(get_current_user)) -> User:
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -199,7 +377,7 @@ async def require_admin(user: User = Depends(require_user)) -> User:
 # ========== AUTH ENDPOINTS ==========
 
 @api_router.post("/auth/register")
-async def register(user_data: UserCreate):
+async def register(user_data: UserCreate, current: Optional[User] = Depends(get_current_user)):
     # Normalize email to lowercase
     email = user_data.email.lower()
     
@@ -220,14 +398,15 @@ async def register(user_data: UserCreate):
     
     await db.users.insert_one(user.model_dump())
     
+    # Registering from a device guest session keeps what was done as a guest
+    merged = {}
+    if current and current.role == "guest" and guests.is_device_guest(current.user_id):
+        merged = await guests.merge_into_new_account(db, current.user_id, user_id)
+        if session_tokens.enabled():
+            await session_tokens.revocations.revoke_user(db, current.user_id)
+    
     # Create session
-    session_token = f"session_{uuid.uuid4().hex}"
-    await db.user_sessions.insert_one({
-        "user_id": user_id,
-        "session_token": session_token,
-        "expires_at": datetime.now(timezone.utc) + timedelta(days=30),
-        "created_at": datetime.now(timezone.utc)
-    })
+    session_token = await new_session(user.model_dump(), days=30)
     
     response = JSONResponse(content={
         "user_id": user_id,
@@ -235,7 +414,8 @@ async def register(user_data: UserCreate):
         "name": user_data.name,
         "role": "user",
         "is_guest": False,
-        "session_token": session_token
+        "session_token": session_token,
+        "merged_from_guest": merged
     })
     
     response.set_cookie(
@@ -251,7 +431,9 @@ async def register(user_data: UserCreate):
     return response
 
 @api_router.post("/auth/login")
-async def login(credentials: UserLogin):
+async def login(credentials: UserLogin, request: Request):
+    await enforce_rate_limits(request, "login", credentials.email)
+    
     # Check if this is a registered email user
     user_doc = await db.users.find_one({"email": credentials.email.lower()}, {"_id": 0})
     
@@ -266,13 +448,7 @@ async def login(credentials: UserLogin):
         raise HTTPException(status_code=401, detail="Invalid credentials. Please register first or use Guest login.")
     
     # Create session
-    session_token = f"session_{uuid.uuid4().hex}"
-    await db.user_sessions.insert_one({
-        "user_id": user_doc["user_id"],
-        "session_token": session_token,
-        "expires_at": datetime.now(timezone.utc) + timedelta(days=30),
-        "created_at": datetime.now(timezone.utc)
-    })
+    session_token = await new_session(user_doc, days=30)
     
     response = JSONResponse(content={
         "user_id": user_doc["user_id"],
@@ -296,38 +472,30 @@ async def login(credentials: UserLogin):
     return response
 
 @api_router.post("/auth/guest")
-async def guest_login():
-    """Login as a guest user - progress is shared among all guests"""
-    GUEST_USER_ID = "user_guest_detective"
-    GUEST_EMAIL = "guest@cpd-study.app"
-    GUEST_NAME = "Guest User"
-    
-    # Check if guest user exists, create if not
-    user_doc = await db.users.find_one({"user_id": GUEST_USER_ID}, {"_id": 0})
-    
-    if not user_doc:
-        user_doc = {
-            "user_id": GUEST_USER_ID,
-            "email": GUEST_EMAIL,
-            "name": GUEST_NAME,
-            "role": "guest",
-            "created_at": datetime.now(timezone.utc)
-        }
-        await db.users.insert_one(user_doc)
+async def guest_login(request: Request, x_device_id: Optional[str] = Header(None)):
+    """
+    Login as a guest. Each device (X-Device-Id) gets its own guest identity,
+    created on first login, whose progress carries over if it registers;
+    clients without a device id share the old common guest.
+    A device keeps one guest session: logging in again (the app does so on
+    every 401) renews it instead of creating another.
+    """
+    if x_device_id:
+        guest_id = guests.guest_user_id(device_fingerprint(request, x_device_id))
+    else:
+        guest_id = guests.SHARED_GUEST_ID
+    user_doc = await guests.ensure_guest(db, guest_id)
     
-    # Create session
-    session_token = f"session_{uuid.uuid4().hex}"
-    await db.user_sessions.insert_one({
-        "user_id": GUEST_USER_ID,
-        "session_token": session_token,
-        "expires_at": datetime.now(timezone.utc) + timedelta(days=7),
-        "created_at": datetime.now(timezone.utc)
-    })
+    if session_tokens.enabled():
+        # Signed guest tokens need no user_sessions row at all
+        session_token = session_tokens.issue(user_doc, days=7)
+    else:
+        session_token = await reuse_guest_session(request, x_device_id, guest_id)
     
     response = JSONResponse(content={
-        "user_id": GUEST_USER_ID,
-        "email": GUEST_EMAIL,
-        "name": GUEST_NAME,
+        "user_id": guest_id,
+        "email": user_doc["email"],
+        "name": user_doc["name"],
         "role": "guest",
         "is_guest": True,
         "session_token": session_token
@@ -378,18 +546,14 @@ async def get_session_data(x_session_id: str = Header(None)):
             role="user",
             created_at=datetime.now(timezone.utc)
         )
-        await db.users.insert_one(user.model_dump())
+        user_doc = user.model_dump()
+        await db.users.insert_one(dict(user_doc))
     else:
         user_id = existing_user["user_id"]
+        user_doc = existing_user
     
     # Create session
-    session_token = f"session_{uuid.uuid4().hex}"
-    await db.user_sessions.insert_one({
-        "user_id": user_id,
-        "session_token": session_token,
-        "expires_at": datetime.now(timezone.utc) + timedelta(days=7),
-        "created_at": datetime.now(timezone.utc)
-    })
+    session_token = await new_session(user_doc, days=7)
     
     return SessionDataResponse(
         id=user_id,
@@ -410,9 +574,21 @@ async def get_me(user: User = Depends(require_user)):
     }
 
 @api_router.post("/auth/logout")
-async def logout(response: Response, session_token: Optional[str] = Cookie(None)):
-    if session_token:
-        await db.user_sessions.delete_one({"session_token": session_token})
+async def logout(
+    response: Response,
+    session_token: Optional[str] = Cookie(None),
+    authorization: Optional[str] = Header(None)
+):
+    token = session_token
+    if not token and authorization and authorization.startswith("Bearer "):
+        token = authorization.replace("Bearer ", "")
+    
+    if token and session_tokens.is_signed(token):
+        claims = session_tokens.verify(token) if session_tokens.enabled() else None
+        if claims:
+            await session_tokens.revocations.revoke_token(db, claims)
+    elif token:
+        await db.user_sessions.delete_one({"session_token": token})
     
     response.delete_cookie(key="session_token", path="/")
     return {"message": "Logged out"}
@@ -467,11 +643,13 @@ class PasswordResetRequest(BaseModel):
 class PasswordResetConfirm(BaseModel):
     token: str
     new_password: str
+    email: Optional[str] = None  # Narrows the code to one account (and its rate limit)
 
 @api_router.post("/auth/forgot-password")
-async def forgot_password(request: PasswordResetRequest):
+async def forgot_password(request: PasswordResetRequest, http_request: Request):
     """Request password reset - generates token"""
     email = request.email.lower()
+    await enforce_rate_limits(http_request, "forgot", email)
     user = await db.users.find_one({"email": email}, {"_id": 0})
     
     if not user:
@@ -500,13 +678,16 @@ async def forgot_password(request: PasswordResetRequest):
     }
 
 @api_router.post("/auth/reset-password")
-async def reset_password(request: PasswordResetConfirm):
+async def reset_password(request: PasswordResetConfirm, http_request: Request):
     """Reset password using token"""
+    email = request.email.lower() if request.email else None
+    await enforce_rate_limits(http_request, "reset", email)
+    
     # Find valid reset token
-    reset_doc = await db.password_resets.find_one({
-        "token": request.token,
-        "expires_at": {"$gt": datetime.now(timezone.utc)}
-    })
+    query = {"token": request.token, "expires_at": {"$gt": datetime.now(timezone.utc)}}
+    if email:
+        query["email"] = email
+    reset_doc = await db.password_resets.find_one(query)
     
     if not reset_doc:
         raise HTTPException(status_code=400, detail="Invalid or expired reset code")
@@ -525,12 +706,14 @@ async def reset_password(request: PasswordResetConfirm):
         raise HTTPException(status_code=400, detail="Failed to update password")
     
     # Delete the used token
-    await db.password_resets.delete_one({"token": request.token})
+    await db.password_resets.delete_one({"_id": reset_doc["_id"]})
     
     # Invalidate all existing sessions for this user
     user = await db.users.find_one({"email": reset_doc["email"]}, {"_id": 0})
     if user:
         await db.user_sessions.delete_many({"user_id": user["user_id"]})
+        if session_tokens.enabled():
+            await session_tokens.revocations.revoke_user(db, user["user_id"])
     
     return {"message": "Password reset successful. Please log in with your new password."}
 
@@ -538,20 +721,44 @@ async def reset_password(request: PasswordResetConfirm):
 
 @api_router.get("/categories", response_model=List[Category])
 async def get_categories():
-    categories = await db.categories.find({}, {"_id": 0}).sort("order", 1).to_list(100)
-    return categories
+    categories = await db.categories.find({}, projection(Category)).sort("order", 1).to_list(100)
+    return trusted(Category, categories)
 
 @api_router.post("/categories", response_model=Category)
 async def create_category(category: Category, user: User = Depends(require_admin)):
+    category.updated_at = datetime.now(timezone.utc)
     await db.categories.insert_one(category.model_dump())
     return category
 
 # ========== QUESTION ENDPOINTS ==========
 
-@api_router.get("/questions", response_model=List[Question])
+def catalog_add(question: Dict[str, Any]):
+    try:
+        question_catalog[question["question_id"]] = Question(**question).model_dump()
+    except ValidationError as e:
+        logger.warning(f"Question {question.get('question_id')} left out of the catalog: {e}")
+
+def rebuild_question_indexes(questions: List[Dict[str, Any]]):
+    question_catalog.clear()
+    for question in questions:
+        catalog_add(question)
+    search_index.rebuild(questions)
+    reference_index.rebuild(questions)
+
+async def refresh_question_indexes():
+    """Rebuild the catalog, search and reference indexes from MongoDB, e.g. after a bulk import"""
+    questions = await db.questions.find({}, {"_id": 0}).to_list(None)
+    rebuild_question_indexes(questions)
+    if compact_progress.enabled():
+        await compact_progress.ordinals.load(db)
+    logger.info(f"Search index built with {len(search_index)} questions, "
+                f"{len(reference_index)} references")
+
+@api_router.get("/questions", response_model=List[QuestionWithProgress])
 async def get_questions(
     type: Optional[str] = None,
     category_id: Optional[str] = None,
+    with_progress: bool = False,
     user: User = Depends(require_user)
 ):
     query = {}
@@ -561,15 +768,34 @@ async def get_questions(
         query["category_id"] = category_id
     
     # Limit results for production performance
-    questions = await db.questions.find(query, {"_id": 0}).to_list(500)
-    return questions
+    questions = await db.questions.find(query, projection(Question)).to_list(500)
+    if with_progress:
+        progress = await lookup_progress(user.user_id, [q["question_id"] for q in questions])
+        for question in questions:
+            question["progress"] = progress.get(question["question_id"])
+    return trusted(QuestionWithProgress, questions)
+
+@api_router.get("/questions/search")
+async def search_questions(
+    q: str,
+    type: Optional[str] = None,
+    category_id: Optional[str] = None,
+    limit: int = 20,
+    user: User = Depends(require_user)
+):
+    """Full-text search (BM25, prefix matching) over the in-memory question index"""
+    started = time.perf_counter()
+    result = search_index.search(q, limit=max(1, min(limit, 100)), type=type, category_id=category_id)
+    result["query"] = q
+    result["took_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
 
 @api_router.get("/questions/{question_id}", response_model=Question)
 async def get_question(question_id: str, user: User = Depends(require_user)):
-    question = await db.questions.find_one({"question_id": question_id}, {"_id": 0})
+    question = await db.questions.find_one({"question_id": question_id}, projection(Question))
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
-    return question
+    return trusted(Question, question)
 
 @api_router.post("/questions", response_model=Question)
 async def create_question(question_data: QuestionCreate, user: User = Depends(require_admin)):
@@ -584,6 +810,11 @@ async def create_question(question_data: QuestionCreate, user: User = Depends(re
     )
     
     await db.questions.insert_one(question.model_dump())
+    search_index.add(question.model_dump())
+    catalog_add(question.model_dump())
+    reference_index.add(question.model_dump())
+    if compact_progress.enabled():
+        await compact_progress.ordinals.add_question(db, question_id, question.type)
     return question
 
 @api_router.put("/questions/{question_id}", response_model=Question)
@@ -605,6 +836,9 @@ async def update_question(
     )
     
     updated = await db.questions.find_one({"question_id": question_id}, {"_id": 0})
+    search_index.add(updated)
+    catalog_add(updated)
+    reference_index.add(updated)
     return Question(**updated)
 
 @api_router.delete("/questions/{question_id}")
@@ -612,59 +846,190 @@ async def delete_question(question_id: str, user: User = Depends(require_admin))
     result = await db.questions.delete_one({"question_id": question_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Question not found")
+    await record_deletes(db, "questions", [question_id])
+    search_index.remove(question_id)
+    question_catalog.pop(question_id, None)
+    reference_index.remove(question_id)
+    compact_progress.ordinals.remove_question(question_id)
     return {"message": "Question deleted"}
 
+# ========== REFERENCE ENDPOINTS ==========
+
+@api_router.get("/references")
+async def get_references(kind: Optional[str] = None, user: User = Depends(require_user)):
+    """Every statute, directive and case cited by the question bank, with question counts"""
+    return reference_index.listing(kind)
+
+@api_router.get("/references/{key:path}/questions", response_model=ReferenceQuestions,
+                response_class=FastJSONResponse)
+async def get_reference_questions(
+    key: str,
+    include_children: bool = True,
+    type: Optional[str] = None,
+    user: User = Depends(require_user)
+):
+    """
+    All questions citing a reference. ``key`` is a canonical key
+    (ilcs:720:5:12-3, directive:G03-02) or a citation as written
+    ("720 ILCS 5/12-3", "G03-02"). Parent keys include their subsections
+    unless include_children=false.
+    """
+    canonical = normalize_key(key)
+    if not canonical:
+        raise HTTPException(status_code=400, detail="Unrecognized reference")
+    question_ids = reference_index.lookup(canonical, include_children=include_children)
+    if not question_ids:
+        raise HTTPException(status_code=404, detail="No questions cite this reference")
+    
+    query: Dict[str, Any] = {"question_id": {"$in": list(question_ids)}}
+    if type:
+        query["type"] = type
+    questions = await db.questions.find(query, projection(Question)).sort("question_id", 1).to_list(None)
+    
+    # Trusted read: the shape is ReferenceQuestions, without validating it again
+    return FastJSONResponse({
+        "key": canonical,
+        "label": reference_label(canonical),
+        "total": len(questions),
+        "questions": [with_defaults(Question, q) for q in questions],
+        "related": reference_index.related(question_ids, exclude=[canonical])[:10],
+    })
+
 # ========== BOOKMARK ENDPOINTS ==========
 
 @api_router.post("/bookmarks/toggle")
 async def toggle_bookmark(data: BookmarkToggle, user: User = Depends(require_user)):
-    # Check if progress entry exists
-    progress = await db.user_progress.find_one(
-        {"user_id": user.user_id, "question_id": data.question_id},
-        {"_id": 0}
-    )
-    
-    if progress:
-        # Toggle bookmark
-        new_value = not progress.get("bookmarked", False)
-        await db.user_progress.update_one(
-            {"user_id": user.user_id, "question_id": data.question_id},
-            {"$set": {"bookmarked": new_value}}
+    # Flip the flag server-side in one atomic upsert, so rapid taps cannot race
+    now = datetime.now(timezone.utc)
+    toggle = [{"$set": {
+        "bookmarked": {"$not": [{"$ifNull": ["$bookmarked", False]}]},
+        "bookmarked_at": {"$cond": [{"$ifNull": ["$bookmarked", False]}, None, now]},
+        "progress_id": {"$ifNull": ["$progress_id", f"prog_{uuid.uuid4().hex[:12]}"]},
+        "attempts": {"$ifNull": ["$attempts", 0]},
+        "created_at": {"$ifNull": ["$created_at", now]},
+        "updated_at": now,
+    }}]
+    query = {"user_id": user.user_id, "question_id": data.question_id}
+    try:
+        progress = await db.user_progress.find_one_and_update(
+            query, toggle, projection={"_id": 0, "bookmarked": 1},
+            upsert=True, return_document=ReturnDocument.AFTER
         )
-        return {"bookmarked": new_value}
-    else:
-        # Create new progress entry
-        progress_id = f"prog_{uuid.uuid4().hex[:12]}"
-        new_progress = UserProgress(
-            progress_id=progress_id,
-            user_id=user.user_id,
-            question_id=data.question_id,
-            bookmarked=True,
-            created_at=datetime.now(timezone.utc)
+    except DuplicateKeyError:
+        # Two first-ever toggles raced on the upsert; the loser now finds the document
+        progress = await db.user_progress.find_one_and_update(
+            query, toggle, projection={"_id": 0, "bookmarked": 1},
+            return_document=ReturnDocument.AFTER
         )
-        await db.user_progress.insert_one(new_progress.model_dump())
-        return {"bookmarked": True}
+    
+    await compact_progress.record(db, user.user_id, {data.question_id: {"bookmarked": progress["bookmarked"]}})
+    return {"bookmarked": progress["bookmarked"]}
 
-@api_router.get("/bookmarks", response_model=List[Question])
-async def get_bookmarks(user: User = Depends(require_user)):
-    # Get bookmarked question IDs - only fetch question_id field for performance
-    bookmarks = await db.user_progress.find(
-        {"user_id": user.user_id, "bookmarked": True},
-        {"_id": 0, "question_id": 1}
-    ).to_list(500)
+@api_router.put("/bookmarks")
+async def set_bookmarks(data: BookmarkBulk, user: User = Depends(require_user)):
+    """Bookmark (or un-bookmark) many questions in one bulk write"""
+    known = [qid for qid in dict.fromkeys(data.question_ids) if qid in search_index.docs]
+    unknown = [qid for qid in data.question_ids if qid not in search_index.docs]
+    if not known:
+        return {"updated": 0, "unknown": unknown}
     
-    question_ids = [b["question_id"] for b in bookmarks]
+    now = datetime.now(timezone.utc)
+    ops = [
+        UpdateOne(
+            {"user_id": user.user_id, "question_id": qid},
+            {
+                "$set": {"bookmarked": data.bookmarked, "bookmarked_at": now if data.bookmarked else None,
+                         "updated_at": now},
+                "$setOnInsert": {"progress_id": f"prog_{uuid.uuid4().hex[:12]}", "attempts": 0,
+                                 "created_at": now},
+            },
+            # Clearing a bookmark never needs a new progress document
+            upsert=data.bookmarked
+        )
+        for qid in known
+    ]
+    result = await db.user_progress.bulk_write(ops, ordered=False)
+    await compact_progress.record(db, user.user_id, {qid: {"bookmarked": data.bookmarked} for qid in known})
+    return {"updated": result.modified_count + result.upserted_count, "unknown": unknown}
+
+@api_router.get("/bookmarks", response_model=Union[List[Question], List[str]],
+                response_class=FastJSONResponse)
+async def get_bookmarks(
+    response: Response,
+    limit: int = 500,
+    cursor: Optional[str] = None,
+    ids_only: bool = False,
+    user: User = Depends(require_user)
+):
+    """
+    Bookmarked questions, most recently bookmarked first. Questions come from
+    the in-memory catalog, so the only query is a covered scan of the
+    bookmark index. When more remain, X-Next-Cursor carries the cursor for
+    the next page; ids_only=true returns question ids instead of questions.
+    """
+    query: Dict[str, Any] = {"user_id": user.user_id, "bookmarked": True}
+    if cursor:
+        try:
+            last = decode_cursor(cursor)
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        # Bookmarks from before bookmarked_at existed sort last
+        if last.get("t") is None:
+            query["bookmarked_at"] = None
+            query["question_id"] = {"$lt": last.get("id")}
+        else:
+            query["$or"] = [
+                {"bookmarked_at": {"$lt": last["t"]}},
+                {"bookmarked_at": last["t"], "question_id": {"$lt": last.get("id")}},
+                {"bookmarked_at": None},
+            ]
+    
+    limit = max(1, min(limit, 500))
+    bookmarks = await db.user_progress.find(
+        query, {"_id": 0, "question_id": 1, "bookmarked_at": 1}
+    ).sort([("bookmarked_at", -1), ("question_id", -1)]).limit(limit + 1).to_list(limit + 1)
+    
+    if len(bookmarks) > limit:
+        bookmarks = bookmarks[:limit]
+        last = bookmarks[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            {"t": last.get("bookmarked_at"), "id": last["question_id"]}
+        )
     
+    question_ids = [b["question_id"] for b in bookmarks if b["question_id"] in question_catalog]
+    if ids_only:
+        return question_ids
+    # Catalog entries are Question.model_dump() output, validated when the
+    # catalog is built; returning a response directly skips validating and
+    # encoding them again (headers set above kept)
+    return FastJSONResponse([question_catalog[qid] for qid in question_ids], headers=response.headers)
+
+# Progress fields clients render next to a card
+PROGRESS_FIELDS = ("bookmarked", "attempts", "last_score", "last_attempted",
+                   "last_correct", "correct_count", "due_at")
+
+async def lookup_progress(user_id: str, question_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """question_id -> progress for the given questions, in one query on the (user_id, question_id) index"""
     if not question_ids:
-        return []
-    
-    # Get questions
-    questions = await db.questions.find(
-        {"question_id": {"$in": question_ids}},
-        {"_id": 0}
-    ).to_list(500)
-    
-    return questions
+        return {}
+    rows = await db.user_progress.find(
+        {"user_id": user_id, "question_id": {"$in": question_ids}},
+        {"_id": 0, "question_id": 1, **{field: 1 for field in PROGRESS_FIELDS}}
+    ).to_list(None)
+    return {row.pop("question_id"): row for row in rows}
+
+@api_router.post("/progress/lookup")
+async def lookup_progress_batch(data: ProgressLookup, user: User = Depends(require_user)):
+    """
+    Progress for many questions at once, given explicit question_ids or a
+    category_id. Questions without progress are left out of the map.
+    """
+    if data.question_ids is None and not data.category_id:
+        raise HTTPException(status_code=400, detail="Give question_ids or category_id")
+    question_ids = list(data.question_ids or [])
+    if data.category_id:
+        question_ids += [qid for qid, q in question_catalog.items() if q["category_id"] == data.category_id]
+    return {"progress": await lookup_progress(user.user_id, list(dict.fromkeys(question_ids)))}
 
 @api_router.get("/progress/{question_id}")
 async def get_progress(question_id: str, user: User = Depends(require_user)):
@@ -674,8 +1039,147 @@ async def get_progress(question_id: str, user: User = Depends(require_user)):
     )
     return progress or {"bookmarked": False}
 
+# ========== REVIEW ENDPOINTS ==========
+
+@api_router.get("/review/next")
+async def get_next_review(n: int = 10, user: User = Depends(require_user)):
+    """The next cards to study: overdue ones first, then questions never reviewed"""
+    n = max(1, min(n, 100))
+    now = datetime.now(timezone.utc)
+    cards = await due_cards(db, user.user_id, n, catalog=list(search_index.docs), now=now)
+    
+    questions = await db.questions.find(
+        {"question_id": {"$in": [c["question_id"] for c in cards]}},
+        {"_id": 0}
+    ).to_list(None)
+    by_id = {q["question_id"]: q for q in questions}
+    
+    due_count = await db.user_progress.count_documents(
+        {"user_id": user.user_id, "due_at": {"$lte": now}}
+    )
+    return {
+        "due": due_count,
+        "cards": [
+            {"question": by_id[c["question_id"]], "due_at": c["due_at"], "new": c["new"]}
+            for c in cards if c["question_id"] in by_id
+        ]
+    }
+
+@api_router.post("/review/{question_id}")
+async def submit_review(question_id: str, data: ReviewSubmit, user: User = Depends(require_user)):
+    """Grade one card and reschedule it (SM-2)"""
+    if not await db.questions.find_one({"question_id": question_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Question not found")
+    return await record_review(db, user.user_id, question_id, data.quality)
+
+# ========== ATTEMPT ENDPOINTS ==========
+
+@api_router.post("/attempts/batch")
+async def record_attempt_batch(data: AttemptBatch, user: User = Depends(require_user)):
+    """
+    Record a whole quiz / MCQ test in one request. MCQs are scored against
+    correct_answers and practice-exam items against their answer here;
+    progress, review schedules and the user's totals are updated with one
+    bulk write.
+    """
+    attempts = [a.model_dump() for a in data.attempts]
+    questions = await db.questions.find(
+        {"question_id": {"$in": list({a["question_id"] for a in attempts})}},
+        {"_id": 0, "question_id": 1, "type": 1, "correct_answers": 1, "answer": 1}
+    ).to_list(None)
+    
+    results = grade_attempts({q["question_id"]: q for q in questions}, attempts)
+    totals = await record_attempts(db, user.user_id, results)
+    
+    graded = [r for r in results if "error" not in r]
+    correct = sum(1 for r in graded if r["correct"])
+    return {
+        "recorded": len(graded),
+        "correct": correct,
+        "score": round(correct / len(graded) * 100, 1) if graded else None,
+        "results": results,
+        "totals": totals,
+    }
+
+# ========== EXAM ENDPOINTS ==========
+
+@api_router.post("/exams")
+async def start_exam(data: ExamCreate, user: User = Depends(require_user)):
+    """Start a practice exam; the sampled questions are frozen for the session"""
+    try:
+        session = await create_exam(db, user.user_id, data.count, data.category_id, data.duration_minutes)
+        return await get_exam(db, user.user_id, session["exam_id"])
+    except ExamError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@api_router.get("/exams")
+async def get_exams(limit: int = 20, user: User = Depends(require_user)):
+    return await list_exams(db, user.user_id, max(1, min(limit, 100)))
+
+@api_router.get("/exams/{exam_id}")
+async def resume_exam(exam_id: str, user: User = Depends(require_user)):
+    try:
+        return await get_exam(db, user.user_id, exam_id)
+    except ExamError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@api_router.patch("/exams/{exam_id}/answers")
+async def save_exam_answers(exam_id: str, data: ExamAnswers, user: User = Depends(require_user)):
+    """Save any number of answers at once (clients batch changes between saves)"""
+    try:
+        return await save_answers(db, user.user_id, exam_id, data.answers)
+    except ExamError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@api_router.post("/exams/{exam_id}/finish")
+async def finish_exam_session(exam_id: str, user: User = Depends(require_user)):
+    try:
+        return await finish_exam(db, user.user_id, exam_id)
+    except ExamError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+# ========== SYNC ENDPOINTS ==========
+
+@api_router.get("/sync")
+async def sync_changes(
+    since: Optional[str] = None,
+    limit: int = 500,
+    user: User = Depends(require_user)
+):
+    """
+    Everything changed since the cursor returned by the previous sync (all of
+    it without one): questions, categories, the user's progress, bookmarks and
+    scenario responses, plus deleted keys. Collections listed in "reset" were
+    replaced wholesale and are sent in full.
+
+    Progress and responses come at most ``limit`` at a time; while
+    "next_cursor" is set, pass it back as ``since`` for the rest. The last
+    page's "cursor" starts the next sync.
+    """
+    try:
+        changes = await changes_since(db, user.user_id, since, limit)
+    except CursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Large and read straight from our collections: skip jsonable_encoder
+    return FastJSONResponse(changes)
+
 # ========== SCENARIO ENDPOINTS ==========
 
+def parse_grading(ai_response: str):
+    """(grade, feedback) from a "GRADE: n FEEDBACK: text" reply; no grade and the whole reply otherwise"""
+    grade = None
+    feedback = ai_response
+    
+    if "GRADE:" in ai_response:
+        parts = ai_response.split("GRADE:", 1)[1].split("FEEDBACK:", 1)
+        if len(parts) == 2:
+            try:
+                grade = float(parts[0].strip())
+                feedback = parts[1].strip()
+            except (ValueError, IndexError):
+                pass
+    return grade, feedback
+
 @api_router.post("/scenarios/submit")
 async def submit_scenario(data: ScenarioSubmit, user: User = Depends(require_user)):
     # Get the question
@@ -694,7 +1198,7 @@ async def submit_scenario(data: ScenarioSubmit, user: User = Depends(require_use
         
         client = AsyncOpenAI(
             api_key=api_key,
-            base_url="https://api.openai.com/v1"
+            base_url=OPENAI_BASE_URL
         )
         
         prompt = f"""Grade this detective exam scenario response:
@@ -712,10 +1216,11 @@ Provide your response in this exact format:
 GRADE: [number 0-100]
 FEEDBACK: [detailed feedback explaining the grade, what was correct, what was missing, and how to improve]"""
         
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": """You are an expert grader for Chicago Police Department detective exam scenarios. 
+        with metrics.timer("llm"):
+            response = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": """You are an expert grader for Chicago Police Department detective exam scenarios. 
 Your job is to evaluate responses based on:
 - Knowledge of relevant laws and procedures
 - Proper application of Chicago PD directives
@@ -723,26 +1228,14 @@ Your job is to evaluate responses based on:
 - Clarity and completeness of response
 
 Provide a grade from 0-100 and detailed feedback."""},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=500
-        )
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500
+            )
         
         ai_response = response.choices[0].message.content
-        
-        # Parse AI response
-        grade = None
-        feedback = ai_response
-        
-        if "GRADE:" in ai_response:
-            parts = ai_response.split("GRADE:", 1)[1].split("FEEDBACK:", 1)
-            if len(parts) == 2:
-                try:
-                    grade = float(parts[0].strip())
-                    feedback = parts[1].strip()
-                except (ValueError, IndexError):
-                    pass
+        grade, feedback = parse_grading(ai_response)
         
     except Exception as e:
         logging.error(f"AI grading error: {e}")
@@ -762,7 +1255,8 @@ Provide a grade from 0-100 and detailed feedback."""},
         submitted_at=datetime.now(timezone.utc)
     )
     
-    await db.scenario_responses.insert_one(scenario_response.model_dump())
+    # Long answer and feedback text goes to a compressed side collection
+    await insert_response(db, scenario_response.model_dump())
     
     # Update user progress
     await db.user_progress.update_one(
@@ -770,7 +1264,8 @@ Provide a grade from 0-100 and detailed feedback."""},
         {
             "$set": {
                 "last_score": grade,
-                "last_attempted": datetime.now(timezone.utc)
+                "last_attempted": datetime.now(timezone.utc),
+                "updated_at": datetime.now(timezone.utc)
             },
             "$inc": {"attempts": 1},
             "$setOnInsert": {
@@ -783,6 +1278,12 @@ Provide a grade from 0-100 and detailed feedback."""},
         },
         upsert=True
     )
+    if grade is not None:
+        await record_review(db, user.user_id, data.question_id, quality_from_score(grade))
+    await compact_progress.record(
+        db, user.user_id, {data.question_id: {"attempted": True, "score": grade}},
+        inc={"graded_count": int(grade is not None), "score_sum": grade or 0}
+    )
     
     return {
         "response_id": response_id,
@@ -790,26 +1291,68 @@ Provide a grade from 0-100 and detailed feedback."""},
         "feedback": feedback
     }
 
+# What a history list shows; the response and feedback text come from the detail endpoint
+HISTORY_SUMMARY_FIELDS = ("response_id", "question_id", "ai_grade", "time_taken", "submitted_at")
+
 @api_router.get("/scenarios/history")
-async def get_scenario_history(user: User = Depends(require_user)):
+async def get_scenario_history(
+    response: Response,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    user: User = Depends(require_user)
+):
+    """
+    The user's scenario responses, newest first, as small summaries (question
+    title, grade, time taken). When more remain, X-Next-Cursor carries the
+    cursor for the next page.
+    """
+    query: Dict[str, Any] = {"user_id": user.user_id}
+    if cursor:
+        try:
+            last = decode_cursor(cursor)
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query["$or"] = [
+            {"submitted_at": {"$lt": last.get("t")}},
+            {"submitted_at": last.get("t"), "response_id": {"$lt": last.get("id")}},
+        ]
+    
+    limit = max(1, min(limit, 100))
     responses = await db.scenario_responses.find(
-        {"user_id": user.user_id},
-        {"_id": 0}
-    ).sort("submitted_at", -1).to_list(100)
-    
-    return responses
+        query, {"_id": 0, **{field: 1 for field in HISTORY_SUMMARY_FIELDS}}
+    ).sort([("submitted_at", -1), ("response_id", -1)]).limit(limit + 1).to_list(limit + 1)
+    
+    if len(responses) > limit:
+        responses = responses[:limit]
+        last = responses[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"t": last["submitted_at"], "id": last["response_id"]})
+    
+    for item in responses:
+        question = question_catalog.get(item["question_id"]) or {}
+        item["question_title"] = question.get("title") or question.get("question")
+    return FastJSONResponse(responses, headers=response.headers)
+
+@api_router.get("/scenarios/history/{response_id}")
+async def get_scenario_response(response_id: str, user: User = Depends(require_user)):
+    """One scenario response in full, with the answer and grading feedback"""
+    scenario_response = await db.scenario_responses.find_one(
+        {"response_id": response_id, "user_id": user.user_id}, {"_id": 0}
+    )
+    if not scenario_response:
+        raise HTTPException(status_code=404, detail="Response not found")
+    return (await attach_bodies(db, [scenario_response]))[0]
 
 # ========== STATS ENDPOINTS ==========
 
-@api_router.get("/stats")
-async def get_stats(user: User = Depends(require_user)):
+async def _progress_stats(user_id: str) -> Dict[str, Any]:
+    """Progress counts from the per-question user_progress documents"""
     # Get total questions by type
     total_flashcards = await db.questions.count_documents({"type": "flashcard"})
     total_scenarios = await db.questions.count_documents({"type": "scenario"})
     
     # Get user progress - only fetch needed fields for performance
     progress = await db.user_progress.find(
-        {"user_id": user.user_id}, 
+        {"user_id": user_id}, 
         {"_id": 0, "attempts": 1, "last_score": 1}
     ).to_list(500)
     
@@ -817,12 +1360,12 @@ async def get_stats(user: User = Depends(require_user)):
     attempted_scenarios = len([p for p in progress if p.get("last_score") is not None])
     
     bookmarks_count = await db.user_progress.count_documents(
-        {"user_id": user.user_id, "bookmarked": True}
+        {"user_id": user_id, "bookmarked": True}
     )
     
     # Get average score for scenarios
     responses = await db.scenario_responses.find(
-        {"user_id": user.user_id, "ai_grade": {"$ne": None}},
+        {"user_id": user_id, "ai_grade": {"$ne": None}},
         {"_id": 0, "ai_grade": 1}
     ).to_list(500)
     
@@ -842,6 +1385,26 @@ async def get_stats(user: User = Depends(require_user)):
         "total_responses": len(responses)
     }
 
+@api_router.get("/stats")
+async def get_stats(user: User = Depends(require_user)):
+    if compact_progress.enabled():
+        # One small per-user document, counted with popcounts
+        stats = await compact_progress.stats(db, user.user_id)
+    else:
+        stats = await _progress_stats(user.user_id)
+    
+    # Quiz / MCQ totals maintained by /attempts/batch
+    totals = await db.user_stats.find_one({"user_id": user.user_id}, {"_id": 0}) or {}
+    mcq_answered = totals.get("mcq_answered", 0)
+    
+    return {
+        **stats,
+        "mcq_answered": mcq_answered,
+        "mcq_correct": totals.get("mcq_correct", 0),
+        "mcq_accuracy": round(totals.get("mcq_correct", 0) / mcq_answered * 100, 1) if mcq_answered else None,
+        "flashcards_reviewed": totals.get("flashcard_answered", 0)
+    }
+
 # Leaderboard endpoint - shows ranking for registered users
 @api_router.get("/leaderboard")
 async def get_leaderboard(user: User = Depends(require_user)):
@@ -920,12 +1483,17 @@ async def reset_scores(user: User = Depends(require_user)):
     
     # Delete all scenario responses for this user
     responses_result = await db.scenario_responses.delete_many({"user_id": user.user_id})
+    await delete_bodies(db, user.user_id)
     
     # Reset progress records (but keep bookmarks)
     progress_result = await db.user_progress.update_many(
         {"user_id": user.user_id},
-        {"$set": {"attempts": 0, "last_score": None}}
+        {"$set": {"attempts": 0, "last_score": None, "correct_count": 0, "last_correct": None,
+                  "updated_at": datetime.now(timezone.utc)}}
     )
+    await record_reset(db, "scenario_responses", user_id=user.user_id)
+    await db.user_stats.delete_one({"user_id": user.user_id})
+    await compact_progress.reset_scores(db, user.user_id)
     
     return {
         "message": "Your scores have been reset successfully!",
@@ -951,21 +1519,23 @@ async def get_admin_analytics(user: User = Depends(require_admin)):
     
     # User Statistics
     total_registered_users = await db.users.count_documents({"role": {"$ne": "guest"}})
-    total_guest_sessions = await db.user_sessions.count_documents({"is_guest": True})
+    # Guest identities (one per device); signed guest tokens have no session row
+    total_guest_sessions = await db.users.count_documents({"role": "guest"})
     
-    # Active users (users with sessions in last 24 hours)
-    active_today = await db.user_sessions.count_documents({
-        "last_activity": {"$gte": today_start}
+    # Active users: distinct users seen since the start of the period
+    # (users.last_active_at, see user_activity.py), not sessions
+    active_today = await db.users.count_documents({
+        "last_active_at": {"$gte": today_start}
     })
     
     # Active users this week
-    active_this_week = await db.user_sessions.count_documents({
-        "last_activity": {"$gte": week_ago}
+    active_this_week = await db.users.count_documents({
+        "last_active_at": {"$gte": week_ago}
     })
     
     # Active users this month
-    active_this_month = await db.user_sessions.count_documents({
-        "last_activity": {"$gte": month_ago}
+    active_this_month = await db.users.count_documents({
+        "last_active_at": {"$gte": month_ago}
     })
     
     # New registrations this week
@@ -1031,13 +1601,14 @@ async def get_admin_analytics(user: User = Depends(require_admin)):
         user_doc = activity_users_map.get(activity["user_id"])
         activity["user_name"] = user_doc.get("name", "Guest") if user_doc else "Guest"
     
-    # Daily active users for the past 7 days
+    # Users last seen on each of the past 7 days (only the latest visit is kept,
+    # so a user active on several days counts on the most recent one)
     daily_stats = []
     for i in range(7):
         day_start = (now - timedelta(days=i)).replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
-        day_count = await db.user_sessions.count_documents({
-            "last_activity": {"$gte": day_start, "$lt": day_end}
+        day_count = await db.users.count_documents({
+            "last_active_at": {"$gte": day_start, "$lt": day_end}
         })
         daily_stats.append({
             "date": day_start.strftime("%Y-%m-%d"),
@@ -1071,7 +1642,8 @@ async def get_admin_analytics(user: User = Depends(require_admin)):
             for cat in popular_categories
         ],
         "recent_activity": recent_activity,
-        "daily_active_users": daily_stats
+        "daily_active_users": daily_stats,
+        "sessions": await session_metrics()
     }
 
 # Include the router in the main app
@@ -1079,7 +1651,7 @@ async def get_admin_analytics(user: User = Depends(require_admin)):
 
 # ========== ADMIN DATA MIGRATION ENDPOINT ==========
 @api_router.post("/admin/import-data")
-async def import_data(data: Dict[str, List[Dict[str, Any]]]):
+async def import_data(data: Dict[str, List[Dict[str, Any]]], force: bool = False):
     """
     Import bulk data into the database
     Expected format: {
@@ -1087,37 +1659,113 @@ async def import_data(data: Dict[str, List[Dict[str, Any]]]):
         "categories": [...],
         "users": [...]
     }
+    Questions and categories are replaced via a staging collection that is
+    swapped in atomically (refused with 409 when it would shrink the
+    collection too far, unless ?force=true); users are upserted by email and
+    existing ones left untouched. For large datasets use /admin/import-stream.
     """
     try:
         results = {}
         
-        # Import questions
-        if "questions" in data and data["questions"]:
-            await db.questions.delete_many({})
-            result = await db.questions.insert_many(data["questions"])
-            results["questions"] = len(result.inserted_ids)
+        for collection in ("questions", "categories", "users"):
+            if data.get(collection):
+                stats = await import_stream(db, data[collection], collection=collection,
+                                            on_progress=log_progress, force=force)
+                results[collection] = stats[collection]["read"]
         
-        # Import categories
-        if "categories" in data and data["categories"]:
-            await db.categories.delete_many({})
-            result = await db.categories.insert_many(data["categories"])
-            results["categories"] = len(result.inserted_ids)
-        
-        # Import users (optional - might want to skip to preserve Railway users)
-        if "users" in data and data["users"]:
-            # Don't delete all users, just insert if not exists
-            for user in data["users"]:
-                existing = await db.users.find_one({"email": user.get("email")})
-                if not existing:
-                    await db.users.insert_one(user)
+        if "users" in results:
             results["users"] = "imported (duplicates skipped)"
+        if "questions" in results:
+            await refresh_question_indexes()
         
         return {"status": "success", "imported": results}
     
+    except BulkImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SwapValidationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
+@api_router.post("/admin/import-stream")
+async def import_data_stream(
+    request: Request,
+    collection: Optional[str] = None,
+    mode: Optional[str] = None,
+    force: bool = False,
+    user: User = Depends(require_admin)
+):
+    """
+    Stream an NDJSON body into the database in bounded chunks.
+    With ?collection= every line is a document for that collection;
+    otherwise each line is {"collection": ..., "document": {...}}.
+    Replacements are staged and swapped in only after the whole body has
+    been read and validated. Send /admin/export output as it is, with
+    Content-Encoding: gzip; a resumed part is upserted unless ?mode= is given.
+    """
+    body = request.stream()
+    if request.headers.get("content-encoding", "").lower() == "gzip":
+        body = gunzip_chunks(body)
+    try:
+        results = await import_stream(
+            db, iter_lines(body), collection=collection, mode=mode,
+            on_progress=log_progress, force=force
+        )
+    except BulkImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SwapValidationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if "questions" in results:
+        await refresh_question_indexes()
+    if "user_progress" in results or "scenario_responses" in results:
+        await compact_progress.invalidate(db)
+    return {"status": "success", "imported": results}
+
+
+@api_router.get("/admin/export")
+async def export_data(
+    collections: Optional[str] = None,
+    resume: Optional[str] = None,
+    user: User = Depends(require_admin)
+):
+    """
+    Stream collections as gzip-compressed NDJSON, which /admin/import-stream
+    accepts with Content-Encoding: gzip. A {"checkpoint": ...} line follows
+    every chunk; pass the last one received as ?resume= to continue an
+    interrupted export. The resumed part imports as an upsert.
+    """
+    try:
+        names = parse_collections(collections)
+        if resume and decode_checkpoint(resume)[0] not in names:
+            raise ExportError("Resume token does not match the requested collections")
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(
+        gzip_stream(db, names, resume=resume),
+        media_type="application/gzip",
+        headers={"Content-Disposition": 'attachment; filename="export.ndjson.gz"'}
+    )
+
+
+@api_router.post("/admin/rollback/{collection}")
+async def rollback_import(collection: str, user: User = Depends(require_admin)):
+    """Restore the version of a collection that the last replacement swapped out"""
+    if collection not in IMPORT_KEYS:
+        raise HTTPException(status_code=400, detail="Collection cannot be rolled back")
+    try:
+        result = await rollback(db, collection)
+    except SwapValidationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if collection == "questions":
+        await refresh_question_indexes()
+    elif collection in ("user_progress", "scenario_responses"):
+        await compact_progress.invalidate(db)
+    return {"status": "success", "restored": result}
+
+
 @api_router.get("/admin/data-counts")
 async def get_data_counts():
     """Get counts of all collections for verification"""
@@ -1134,25 +1782,45 @@ async def get_data_counts():
 @api_router.post("/admin/promote-to-admin")
 async def promote_to_admin(email: str):
     """Promote a user to admin role"""
-    result = await db.users.update_one(
-        {"email": email.lower()},
-        {"$set": {"role": "admin"}}
+    user_doc = await db.users.find_one_and_update(
+        {"email": email.lower(), "role": {"$ne": "admin"}},
+        {"$set": {"role": "admin"}},
+        projection={"_id": 0, "user_id": 1}
     )
     
-    if result.modified_count > 0:
+    if user_doc:
+        # Signed tokens carry the old role; the user logs in again to pick up the new one
+        if session_tokens.enabled():
+            await session_tokens.revocations.revoke_user(db, user_doc["user_id"])
         return {"status": "success", "message": f"User {email} promoted to admin"}
     else:
         raise HTTPException(status_code=404, detail="User not found")
 
+# ========== METRICS ENDPOINT ==========
+
+SESSION_DOCUMENTS = metrics.Gauge("user_sessions_documents", "Documents in user_sessions")
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus scrape endpoint; protected by METRICS_TOKEN when it is set"""
+    token = os.environ.get("METRICS_TOKEN")
+    if token and authorization != f"Bearer {token}":
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    SESSION_DOCUMENTS.set(value=await db.user_sessions.estimated_document_count())
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # Include the router in the main app
 app.include_router(api_router)
 
+app.add_middleware(metrics.MetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Retry-After"],
 )
 
 # Configure logging
@@ -1162,8 +1830,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def sync_content_packs():
+    """Bring the question bank in line with content/packs"""
+    try:
+        for stats in await apply_all_packs(db):
+            logger.info(f"Content pack {stats['pack']} v{stats['version']}: "
+                        f"{stats['inserted']} inserted, {stats['updated'] + stats['adopted']} updated, "
+                        f"{stats['deleted']} deleted, {stats['unchanged']} unchanged")
+    except Exception as e:
+        logger.error(f"Content pack sync failed: {e}")
+
+@app.on_event("startup")
+async def start_mongo_monitor():
+    """Let the slow-query log and MONGO_DEBUG_COLLSCAN run explains on this loop"""
+    mongo_monitor.monitor.bind(client)
+
+@app.on_event("startup")
+async def load_question_bank():
+    """
+    Create indexes, sync content packs when SYNC_CONTENT_PACKS is set, then
+    build the in-memory indexes. If MongoDB cannot be reached or read, they
+    are built from the packs instead, so search and references work until
+    the next refresh; one ping decides, so an unreachable server costs a
+    single server-selection timeout rather than one per index build.
+    """
+    try:
+        await db.command("ping")
+        await ensure_indexes(db)
+        if os.environ.get("SYNC_CONTENT_PACKS", "").lower() in ("1", "true", "yes"):
+            await sync_content_packs()
+        await refresh_question_indexes()
+    except Exception as e:
+        logger.error(f"Question index build failed: {e}; building it from the content packs")
+        try:
+            rebuild_question_indexes(list(load_catalog()["questions"].values()))
+        except Exception as e:
+            logger.error(f"Building the question indexes from content packs failed: {e}")
+
+@app.on_event("startup")
+async def load_token_revocations():
+    """Revoked signed session tokens, when SESSION_SIGNING_KEY is set"""
+    if session_tokens.enabled():
+        await session_tokens.revocations.load(db)
+
+activity_flush: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def start_activity_flush():
+    """Write users.last_active_at in batches (see user_activity.py)"""
+    global activity_flush
+    activity_flush = asyncio.create_task(user_activity.buffer.run(db))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if activity_flush:
+        activity_flush.cancel()
+        try:
+            await user_activity.buffer.flush(db)
+        except Exception as e:
+            logger.warning(f"Recording user activity failed: {e}")
     client.close()
 # 1769751098
 # Trigger 1769753571
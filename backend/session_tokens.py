@@ -0,0 +1,199 @@
+"""
+Optional stateless session tokens.
+
+With ``SESSION_SIGNING_KEY`` set, new sessions get an HMAC-SHA256 signed
+token instead of a ``session_<uuid>`` row in ``user_sessions``:
+
+    st1.<base64url claims>.<base64url signature>
+    claims: {uid, role, email, name, picture, cat (user created_at), iat, exp, jti}
+
+``get_current_user`` checks the signature and expiry in memory, so an
+authenticated request no longer costs a database round-trip. Existing
+``session_`` tokens keep working through the old lookup.
+
+Revocation (logout, password reset, role changes) is what needs state:
+
+    token_revocations: {jti, created_at, expires_at}                      # one token
+                       {user_id, revoked_before, created_at, expires_at}  # every token issued earlier
+
+Revoked token ids are held in a bloom filter, so the common "not revoked"
+answer is a few bit tests; a filter hit is confirmed against MongoDB.
+Per-user cut-offs are few and kept in a dict. Each worker pulls
+revocations made by other workers every ``REFRESH_SECONDS``, which bounds
+how long a revoked token can still be used elsewhere. Entries expire
+(TTL index) once the tokens they cover would have expired anyway.
+
+Several comma-separated keys may be given to rotate: the first signs, all
+verify.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+PREFIX = "st1."
+REFRESH_SECONDS = 30
+PULL_OVERLAP = timedelta(seconds=5)
+BLOOM_BITS = 1 << 20  # 128 KiB, ~1% false positives at 100k revoked tokens
+BLOOM_HASHES = 7
+
+
+def _keys() -> List[bytes]:
+    raw = os.environ.get("SESSION_SIGNING_KEY", "")
+    return [key.strip().encode("utf-8") for key in raw.split(",") if key.strip()]
+
+
+def enabled() -> bool:
+    return bool(_keys())
+
+
+def is_signed(token: str) -> bool:
+    return token.startswith(PREFIX)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(key: bytes, payload: str) -> str:
+    return _b64encode(hmac.new(key, payload.encode("ascii"), hashlib.sha256).digest())
+
+
+# ========== TOKENS ==========
+
+def issue(user: Dict[str, Any], days: int) -> str:
+    """A signed token for ``user`` (a users document) valid for ``days``"""
+    now = time.time()
+    created_at = user.get("created_at")
+    claims = {
+        "uid": user["user_id"],
+        "role": user.get("role", "user"),
+        "email": user.get("email"),
+        "name": user.get("name"),
+        "picture": user.get("picture"),
+        "cat": int(created_at.timestamp() if isinstance(created_at, datetime) else now),
+        "iat": round(now, 3),
+        "exp": int(now) + days * 86400,
+        "jti": uuid.uuid4().hex,
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    return f"{PREFIX}{payload}.{_sign(_keys()[0], payload)}"
+
+
+def verify(token: str) -> Optional[Dict[str, Any]]:
+    """The token's claims if it is well-formed, correctly signed and unexpired"""
+    try:
+        payload, signature = token[len(PREFIX):].split(".")
+    except ValueError:
+        return None
+    if not any(hmac.compare_digest(_sign(key, payload), signature) for key in _keys()):
+        return None
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        return None
+    if claims.get("exp", 0) <= time.time():
+        return None
+    return claims
+
+
+# ========== REVOCATION ==========
+
+class BloomFilter:
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray(bits // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        for i in range(self.hashes):
+            yield int.from_bytes(digest[i * 4:i * 4 + 4], "little") % self.bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.array[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationSet:
+    """Revoked token ids (bloom filter) and per-user cut-offs, refreshed from MongoDB"""
+
+    def __init__(self):
+        self.tokens = BloomFilter()
+        self.users: Dict[str, float] = {}  # user_id -> tokens issued before this (epoch) are revoked
+        self.loaded_through: Optional[datetime] = None
+        self.next_refresh = 0.0
+
+    async def load(self, db):
+        """(Re)load every revocation that is still relevant"""
+        self.__init__()
+        await self._pull(db, {})
+
+    async def refresh(self, db):
+        """Pull revocations other workers made since the last pull, at most every REFRESH_SECONDS"""
+        if time.monotonic() < self.next_refresh:
+            return
+        # Overlap a little: entries from other workers may commit out of order
+        query = {"created_at": {"$gt": self.loaded_through - PULL_OVERLAP}} if self.loaded_through else {}
+        await self._pull(db, query)
+
+    async def _pull(self, db, query: Dict[str, Any]):
+        self.next_refresh = time.monotonic() + REFRESH_SECONDS
+        async for entry in db.token_revocations.find(query, {"_id": 0}):
+            self._remember(entry)
+
+    def _remember(self, entry: Dict[str, Any]):
+        if entry.get("jti"):
+            self.tokens.add(entry["jti"])
+        if entry.get("user_id"):
+            self.users[entry["user_id"]] = max(self.users.get(entry["user_id"], 0), entry["revoked_before"])
+        created_at = entry.get("created_at")
+        if created_at and created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        if created_at and (self.loaded_through is None or created_at > self.loaded_through):
+            self.loaded_through = created_at
+
+    async def is_revoked(self, db, claims: Dict[str, Any]) -> bool:
+        await self.refresh(db)
+        if claims["iat"] < self.users.get(claims["uid"], 0):
+            return True
+        if claims["jti"] not in self.tokens:
+            return False
+        # Possible false positive: confirm
+        return await db.token_revocations.find_one({"jti": claims["jti"]}, {"_id": 1}) is not None
+
+    async def revoke_token(self, db, claims: Dict[str, Any]):
+        entry = {
+            "jti": claims["jti"],
+            "created_at": datetime.now(timezone.utc),
+            "expires_at": datetime.fromtimestamp(claims["exp"], timezone.utc),
+        }
+        await db.token_revocations.insert_one(dict(entry))
+        self.tokens.add(entry["jti"])
+
+    async def revoke_user(self, db, user_id: str, max_days: int = 30):
+        """Revoke every token issued to ``user_id`` so far"""
+        now = datetime.now(timezone.utc)
+        entry = {
+            "user_id": user_id,
+            "revoked_before": now.timestamp(),
+            "created_at": now,
+            "expires_at": now + timedelta(days=max_days),
+        }
+        await db.token_revocations.insert_one(dict(entry))
+        self.users[user_id] = max(self.users.get(user_id, 0), entry["revoked_before"])
+
+
+revocations = RevocationSet()
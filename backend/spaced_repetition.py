@@ -0,0 +1,145 @@
+"""
+SM-2 spaced-repetition scheduling on top of ``user_progress``.
+
+Each (user, question) progress document carries its own schedule:
+
+    ease            growth factor of the interval, >= 1.3 (starts at 2.5)
+    interval_days   days until the next review
+    repetitions     consecutive successful reviews
+    lapses          times the card was forgotten after being learned
+    due_at          when the card is next due
+    last_reviewed   time of the last review
+
+A review is graded 0-5 (SM-2 "quality": 0-2 forgotten, 3 hard, 4 good,
+5 easy). Scenario and MCQ results are mapped onto that scale with
+``quality_from_score``.
+
+The due queue is a range scan over the ``(user_id, due_at)`` index (see
+db_indexes.py); cards the user has never reviewed are drawn from the
+question bank afterwards.
+"""
+import math
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_QUALITY = 3
+FIRST_INTERVALS = (1, 6)  # days after the first and second successful review
+
+# Fields owned by the scheduler
+SCHEDULE_FIELDS = ("ease", "interval_days", "repetitions", "lapses", "due_at", "last_reviewed")
+
+
+def quality_from_score(score: Optional[float]) -> Optional[int]:
+    """Map a 0-100 score onto the 0-5 SM-2 quality scale"""
+    if score is None:
+        return None
+    for threshold, quality in ((90, 5), (75, 4), (60, 3), (40, 2), (20, 1)):
+        if score >= threshold:
+            return quality
+    return 0
+
+
+def next_schedule(progress: Optional[Dict[str, Any]], quality: int,
+                  now: Optional[datetime] = None) -> Dict[str, Any]:
+    """The schedule fields after reviewing a card with the given quality"""
+    if not 0 <= quality <= 5:
+        raise ValueError("quality must be between 0 and 5")
+    now = now or datetime.now(timezone.utc)
+    progress = progress or {}
+    ease = progress.get("ease") or DEFAULT_EASE
+    repetitions = progress.get("repetitions") or 0
+    interval = progress.get("interval_days") or 0
+    lapses = progress.get("lapses") or 0
+
+    if quality < PASSING_QUALITY:
+        if repetitions:
+            lapses += 1
+        repetitions = 0
+        interval = 1
+    else:
+        repetitions += 1
+        if repetitions <= len(FIRST_INTERVALS):
+            interval = FIRST_INTERVALS[repetitions - 1]
+        else:
+            interval = math.ceil(interval * ease)
+
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    return {
+        "ease": round(ease, 4),
+        "interval_days": interval,
+        "repetitions": repetitions,
+        "lapses": lapses,
+        "due_at": now + timedelta(days=interval),
+        "last_reviewed": now,
+    }
+
+
+async def record_review(
+    db,
+    user_id: str,
+    question_id: str,
+    quality: int,
+    now: Optional[datetime] = None,
+    extra_set: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Reschedule one card and upsert its progress document; returns the new schedule"""
+    now = now or datetime.now(timezone.utc)
+    progress = await db.user_progress.find_one(
+        {"user_id": user_id, "question_id": question_id},
+        {"_id": 0, **{field: 1 for field in SCHEDULE_FIELDS}}
+    )
+    schedule = next_schedule(progress, quality, now)
+    await db.user_progress.update_one(
+        {"user_id": user_id, "question_id": question_id},
+        {
+            "$set": {**schedule, "updated_at": now, **(extra_set or {})},
+            "$setOnInsert": {
+                "progress_id": f"prog_{uuid.uuid4().hex[:12]}",
+                "bookmarked": False,
+                "attempts": 0,
+                "created_at": now,
+            },
+        },
+        upsert=True
+    )
+    return schedule
+
+
+async def due_cards(
+    db,
+    user_id: str,
+    n: int,
+    catalog: Iterable[str] = (),
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Up to ``n`` cards to review next: overdue cards first (oldest due date
+    first), then never-reviewed questions from ``catalog`` in its order.
+    Returns ``{"question_id", "due_at", "new"}`` entries.
+    """
+    now = now or datetime.now(timezone.utc)
+    due = await db.user_progress.find(
+        {"user_id": user_id, "due_at": {"$lte": now}},
+        {"_id": 0, "question_id": 1, "due_at": 1}
+    ).sort("due_at", 1).limit(n).to_list(n)
+    cards = [{"question_id": p["question_id"], "due_at": p["due_at"], "new": False} for p in due]
+
+    # Fill up with unseen cards, checking the catalog a batch at a time
+    catalog = iter(catalog)
+    while len(cards) < n:
+        batch = [qid for _, qid in zip(range(max(n * 2, 50)), catalog)]
+        if not batch:
+            break
+        scheduled = await db.user_progress.find(
+            {"user_id": user_id, "question_id": {"$in": batch}, "due_at": {"$ne": None}},
+            {"_id": 0, "question_id": 1}
+        ).to_list(None)
+        seen = {p["question_id"] for p in scheduled}
+        for qid in batch:
+            if qid not in seen and len(cards) < n:
+                cards.append({"question_id": qid, "due_at": None, "new": True})
+    return cards
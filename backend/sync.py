@@ -0,0 +1,217 @@
+"""
+Delta sync: everything a client's offline copy needs to catch up since its
+last sync, instead of refetching the question bank and its progress.
+
+Changes are found with range scans on ``updated_at``-style fields (see
+db_indexes.py); deletes leave a tombstone behind, because a removed
+document cannot be found by its timestamp:
+
+    tombstones: {
+        collection,                # "questions", "scenario_responses", ...
+        key,                       # question_id / response_id, None for a reset
+        user_id,                   # None for shared collections
+        reset: bool,               # the whole collection was replaced
+        deleted_at,                # TTL: dropped after TOMBSTONE_RETENTION
+    }
+
+A collection replaced wholesale (bulk import, rollback, fresh seed) gets a
+single reset marker rather than a tombstone per document; clients drop
+their copy of that collection and take the full contents sent with it.
+Clients whose cursor is older than the tombstone retention get a full sync.
+
+The user's own changes (progress, then scenario responses) are paged,
+``limit`` documents at a time, in keyset order. While more remain a page
+carries ``next_cursor``; the questions, categories, resets and deletions
+come with the first page only. The last page carries the ``cursor`` for
+the next sync, taken when the first page was served.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import InsertOne
+
+from pagination import CursorError, decode_cursor, encode_cursor
+from response_bodies import attach_bodies
+
+TOMBSTONE_RETENTION = timedelta(days=90)
+
+# The next cursor starts this far back, so writes committed out of
+# timestamp order around the time of a sync are not missed
+CURSOR_OVERLAP = timedelta(seconds=5)
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+# Pack bookkeeping the app has no use for
+QUESTION_PROJECTION = {"_id": 0, "pack": 0, "pack_key": 0, "pack_version": 0, "content_hash": 0}
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Motor returns naive datetimes unless the client is tz_aware
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+# ========== TOMBSTONES ==========
+
+async def record_deletes(db, collection: str, keys: Iterable[str], user_id: Optional[str] = None):
+    """Leave a tombstone for each deleted document"""
+    now = datetime.now(timezone.utc)
+    ops = [
+        InsertOne({"collection": collection, "key": key, "user_id": user_id,
+                   "reset": False, "deleted_at": now})
+        for key in keys
+    ]
+    if ops:
+        await db.tombstones.bulk_write(ops, ordered=False)
+
+
+async def record_reset(db, collection: str, user_id: Optional[str] = None):
+    """Mark a collection (or one user's part of it) as replaced wholesale"""
+    await db.tombstones.insert_one({
+        "collection": collection, "key": None, "user_id": user_id,
+        "reset": True, "deleted_at": datetime.now(timezone.utc),
+    })
+
+
+# ========== CURSORS ==========
+
+def parse_since(cursor: Optional[str], now: datetime) -> Optional[datetime]:
+    """
+    The time a client last synced, or None for a full sync (no cursor, or
+    one older than the tombstones that would be needed to catch up).
+    """
+    if not cursor:
+        return None
+    since = decode_cursor(cursor).get("t")
+    if not isinstance(since, datetime):
+        raise CursorError("Invalid cursor")
+    since = _as_utc(since)
+    if since < now - TOMBSTONE_RETENTION:
+        return None
+    return since
+
+
+# ========== CHANGES ==========
+
+def _changed(field: str, since: Optional[datetime]) -> Dict[str, Any]:
+    return {field: {"$gt": since}} if since else {}
+
+
+async def _user_changes(db, user_id: str, windows: Dict[str, Dict[str, Any]],
+                        position: Dict[str, Any], limit: int):
+    """
+    Up to ``limit`` of the user's changed progress documents, then scenario
+    responses, after ``position``; returns (progress, responses, next position
+    or None when nothing remains)
+    """
+    progress: List[Dict[str, Any]] = []
+    responses: List[Dict[str, Any]] = []
+    if position.get("p", "user_progress") == "user_progress":
+        query = {"user_id": user_id, **windows["user_progress"]}
+        if position.get("k") is not None:
+            query["question_id"] = {"$gt": position["k"]}
+        progress = await db.user_progress.find(query, {"_id": 0}).sort("question_id", 1) \
+            .limit(limit + 1).to_list(limit + 1)
+        if len(progress) > limit:
+            progress = progress[:limit]
+            return progress, responses, {"p": "user_progress", "k": progress[-1]["question_id"]}
+        position = {}
+
+    # With the page already full of progress this only checks for more
+    room = limit - len(progress)
+    query = {"user_id": user_id, **windows["scenario_responses"]}
+    last = position.get("k")
+    if last:
+        query["$or"] = [
+            {"submitted_at": {"$gt": last["t"]}},
+            {"submitted_at": last["t"], "response_id": {"$gt": last["id"]}},
+        ]
+    responses = await db.scenario_responses.find(query, {"_id": 0}) \
+        .sort([("submitted_at", 1), ("response_id", 1)]).limit(room + 1).to_list(room + 1)
+    if len(responses) > room:
+        responses = responses[:room]
+        if responses:
+            last = {"t": responses[-1]["submitted_at"], "id": responses[-1]["response_id"]}
+        return progress, responses, {"p": "scenario_responses", "k": last}
+    return progress, responses, None
+
+
+async def changes_since(db, user_id: str, cursor: Optional[str] = None,
+                        limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+    """
+    Questions, categories, progress and scenario responses changed since
+    ``cursor``, plus deletions, one page at a time (see the module
+    docstring). ``cursor`` is either the previous sync's ``cursor`` or a
+    page's ``next_cursor``. Raises CursorError for a malformed cursor.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    page = decode_cursor(cursor) if cursor else {}
+    if "p" in page:
+        # A later page of a sync already under way
+        started, since, resets = page.get("t"), page.get("s"), set(page.get("r") or [])
+        if not isinstance(started, datetime) or not (since is None or isinstance(since, datetime)):
+            raise CursorError("Invalid cursor")
+        started, since = _as_utc(started), since and _as_utc(since)
+    else:
+        started = datetime.now(timezone.utc)
+        since = parse_since(cursor, started)
+        resets = set()
+        if since:
+            async for marker in db.tombstones.find(
+                {"deleted_at": {"$gt": since}, "reset": True, "user_id": {"$in": [None, user_id]}},
+                {"_id": 0, "collection": 1}
+            ):
+                resets.add(marker["collection"])
+
+    # A replaced collection is sent in full
+    def window(collection: str, field: str) -> Dict[str, Any]:
+        return {} if collection in resets else _changed(field, since)
+
+    first_page = "p" not in page
+    questions: List[Dict[str, Any]] = []
+    categories: List[Dict[str, Any]] = []
+    deleted: Dict[str, List[str]] = {}
+    if first_page:
+        questions = await db.questions.find(
+            window("questions", "updated_at"), QUESTION_PROJECTION
+        ).to_list(None)
+        categories = await db.categories.find(
+            window("categories", "updated_at"), {"_id": 0}
+        ).sort("order", 1).to_list(None)
+        if since:
+            async for tombstone in db.tombstones.find(
+                {"deleted_at": {"$gt": since}, "reset": False, "user_id": {"$in": [None, user_id]}},
+                {"_id": 0, "collection": 1, "key": 1}
+            ):
+                if tombstone["collection"] not in resets:
+                    deleted.setdefault(tombstone["collection"], []).append(tombstone["key"])
+
+    windows = {
+        "user_progress": window("user_progress", "updated_at"),
+        "scenario_responses": window("scenario_responses", "submitted_at"),
+    }
+    progress, responses, position = await _user_changes(db, user_id, windows, page, limit)
+    await attach_bodies(db, responses)
+
+    # Bookmarks live on the progress documents; listed separately for convenience
+    bookmarks = {
+        "added": [p["question_id"] for p in progress if p.get("bookmarked")],
+        "removed": [p["question_id"] for p in progress if since and not p.get("bookmarked")],
+    }
+
+    next_cursor = None
+    if position is not None:
+        next_cursor = encode_cursor({"t": started, "s": since, "r": sorted(resets), **position})
+
+    return {
+        "cursor": None if next_cursor else encode_cursor({"t": started - CURSOR_OVERLAP}),
+        "next_cursor": next_cursor,
+        "full": since is None,
+        "reset": sorted(resets),
+        "questions": questions,
+        "categories": categories,
+        "progress": progress,
+        "bookmarks": bookmarks,
+        "scenario_responses": responses,
+        "deleted": deleted,
+    }
@@ -0,0 +1,72 @@
+"""
+Last-activity stamps on users, written in batches.
+
+Signed session tokens have no ``user_sessions`` row to touch, so activity
+is kept on the user for both kinds of token:
+
+    users: {..., last_active_at}
+
+``get_current_user`` only notes the user id in memory; a background task
+stamps every id noted in the last ``FLUSH_SECONDS`` with one
+``update_many`` per ``BATCH_SIZE`` ids. An authenticated request never
+waits on a write, and a busy user costs one write per interval per worker.
+
+At most ``MAX_PENDING`` ids wait between flushes. Further ids are dropped,
+and those users are stamped on their first request after the next flush.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Set
+
+FLUSH_SECONDS = 60
+BATCH_SIZE = 1000
+MAX_PENDING = 50_000
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """User ids seen since the last flush"""
+
+    def __init__(self):
+        self.pending: Set[str] = set()
+        self.dropped = 0
+
+    def seen(self, user_id: str):
+        if len(self.pending) < MAX_PENDING:
+            self.pending.add(user_id)
+        elif user_id not in self.pending:
+            self.dropped += 1
+
+    async def flush(self, db) -> int:
+        """Stamp every pending user; returns how many were written"""
+        ids, self.pending = sorted(self.pending), set()
+        now = datetime.now(timezone.utc)
+        for start in range(0, len(ids), BATCH_SIZE):
+            try:
+                await db.users.update_many(
+                    {"user_id": {"$in": ids[start:start + BATCH_SIZE]}},
+                    {"$set": {"last_active_at": now}}
+                )
+            except Exception:
+                # Retry the rest with the next flush
+                for user_id in ids[start:]:
+                    self.seen(user_id)
+                raise
+        if self.dropped:
+            logger.warning(f"Activity buffer full: {self.dropped} stamps dropped")
+            self.dropped = 0
+        return len(ids)
+
+    async def run(self, db):
+        """Flush every FLUSH_SECONDS until cancelled"""
+        while True:
+            await asyncio.sleep(FLUSH_SECONDS)
+            try:
+                await self.flush(db)
+            except Exception as e:
+                logger.warning(f"Recording user activity failed: {e}")
+
+
+buffer = ActivityBuffer()
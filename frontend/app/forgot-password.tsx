@@ -73,6 +73,7 @@ export default function ForgotPassword() {
       await api.post('/auth/reset-password', {
         token: resetCode,
         new_password: newPassword,
+        email,
       });
       setStep('success');
     } catch (err: any) {
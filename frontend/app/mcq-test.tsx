@@ -11,7 +11,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { Ionicons } from '@expo/vector-icons';
 import { useRouter, useLocalSearchParams } from 'expo-router';
 import { useAuth } from '../contexts/AuthContext';
-import { questionService } from '../services/api';
+import { questionService, attemptService } from '../services/api';
 
 export default function MultipleChoiceTest() {
   const router = useRouter();
@@ -60,6 +60,13 @@ export default function MultipleChoiceTest() {
       setCurrentIndex(currentIndex + 1);
     } else {
       setTestCompleted(true);
+      attemptService.recordBatch(
+        Object.entries(answers).map(([index, a]) => ({
+          question_id: questions[Number(index)].question_id,
+          selected: [a.selected],
+        })),
+        sessionToken || undefined
+      ).catch(error => console.error('Failed to record test results:', error));
     }
   };
 
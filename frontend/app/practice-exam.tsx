@@ -12,24 +12,31 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { Ionicons } from '@expo/vector-icons';
 import { useRouter } from 'expo-router';
 import { useAuth } from '../contexts/AuthContext';
-import { questionService } from '../services/api';
+import { examService } from '../services/api';
 
+const EXAM_QUESTION_COUNT = 50;
 const EXAM_DURATION = 90 * 60; // 90 minutes in seconds
 
 export default function PracticeExam() {
   const router = useRouter();
   const { sessionToken } = useAuth();
+  const token = sessionToken || undefined;
+  // The exam lives on the server (exam session), so a reload or another
+  // device picks it up where it was left
+  const [exam, setExam] = useState<any | null>(null);
+  const [resumable, setResumable] = useState<any | null>(null);
   const [questions, setQuestions] = useState<any[]>([]);
   const [currentIndex, setCurrentIndex] = useState(0);
-  const [answers, setAnswers] = useState<{[key: number]: string}>({});
+  const [answers, setAnswers] = useState<{[questionId: string]: string[]}>({});
   const [timeRemaining, setTimeRemaining] = useState(EXAM_DURATION);
   const [examStarted, setExamStarted] = useState(false);
   const [examCompleted, setExamCompleted] = useState(false);
+  const [submitting, setSubmitting] = useState(false);
   const [loading, setLoading] = useState(true);
   const [score, setScore] = useState<number | null>(null);
 
   useEffect(() => {
-    loadQuestions();
+    findRunningExam();
   }, []);
 
   useEffect(() => {
@@ -47,25 +54,56 @@ export default function PracticeExam() {
     }
   }, [examStarted, examCompleted, timeRemaining]);
 
-  const loadQuestions = async () => {
+  const findRunningExam = async () => {
     try {
-      const data = await questionService.getQuestions('practice_exam', undefined, sessionToken || undefined);
-      setQuestions(data);
+      const exams = await examService.listExams(5, token);
+      setResumable(exams.find((e: any) => e.status === 'in_progress') || null);
     } catch (error) {
-      console.error('Failed to load practice exam:', error);
-      Alert.alert('Error', 'Failed to load practice exam questions');
+      console.error('Failed to look up practice exams:', error);
     } finally {
       setLoading(false);
     }
   };
 
-  const handleStart = () => {
-    // Skip confirmation and start immediately for web compatibility
+  const enterExam = (session: any) => {
+    setExam(session);
+    setQuestions(session.questions);
+    setAnswers(session.answers || {});
+    setTimeRemaining(session.remaining_seconds);
+    setCurrentIndex(0);
+    setExamCompleted(false);
     setExamStarted(true);
   };
 
+  const handleStart = async () => {
+    // Skip confirmation and start immediately for web compatibility
+    setLoading(true);
+    try {
+      const session = resumable
+        ? await examService.getExam(resumable.exam_id, token)
+        : await examService.startExam({ count: EXAM_QUESTION_COUNT, durationMinutes: EXAM_DURATION / 60 }, token);
+      setResumable(null);
+      if (session.status === 'finished') {
+        showResults(session);
+      } else if (session.remaining_seconds === 0) {
+        // Time ran out while the app was closed: score what was saved
+        showResults(await examService.finishExam(session.exam_id, token));
+      } else {
+        enterExam(session);
+      }
+    } catch (error) {
+      console.error('Failed to start practice exam:', error);
+      Alert.alert('Error', 'Failed to start the practice exam');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleAnswer = (answer: string) => {
-    setAnswers({ ...answers, [currentIndex]: answer });
+    const questionId = questions[currentIndex].question_id;
+    setAnswers({ ...answers, [questionId]: [answer] });
+    examService.saveAnswers(exam.exam_id, { [questionId]: [answer] }, token)
+      .catch(error => console.error('Failed to save answer:', error));
   };
 
   const handleNext = () => {
@@ -80,21 +118,36 @@ export default function PracticeExam() {
     }
   };
 
-  const handleSubmit = () => {
+  const showResults = (session: any) => {
+    setExam(session);
+    setQuestions(session.questions);
+    setAnswers(session.answers || {});
+    setScore(session.score);
+    setExamStarted(true);
     setExamCompleted(true);
-    calculateScore();
   };
 
-  const calculateScore = () => {
-    let correct = 0;
-    questions.forEach((q, idx) => {
-      if (answers[idx] === q.answer) {
-        correct++;
+  const handleSubmit = async () => {
+    if (submitting || !exam) return;
+    setSubmitting(true);
+    try {
+      // Re-send every answer in case a save was still in flight or failed
+      if (Object.keys(answers).length > 0) {
+        await examService.saveAnswers(exam.exam_id, answers, token)
+          .catch(error => console.error('Failed to save answers:', error));
       }
-    });
-    setScore(Math.round((correct / questions.length) * 100));
+      // Scored and recorded in the user's progress on the server
+      showResults(await examService.finishExam(exam.exam_id, token));
+    } catch (error) {
+      console.error('Failed to submit practice exam:', error);
+      Alert.alert('Error', 'Failed to submit the exam; please try again');
+    } finally {
+      setSubmitting(false);
+    }
   };
 
+  const answerText = (questionId: string) => (answers[questionId] || []).join(', ');
+
   const formatTime = (seconds: number) => {
     const hrs = Math.floor(seconds / 3600);
     const mins = Math.floor((seconds % 3600) / 60);
@@ -129,7 +182,7 @@ export default function PracticeExam() {
             
             <View style={styles.examStats}>
               <View style={styles.statItem}>
-                <Text style={styles.statNumber}>{questions.length}</Text>
+                <Text style={styles.statNumber}>{EXAM_QUESTION_COUNT}</Text>
                 <Text style={styles.statLabel}>Questions</Text>
               </View>
               <View style={styles.statItem}>
@@ -151,14 +204,14 @@ export default function PracticeExam() {
               <View style={styles.instructionItem}>
                 <Ionicons name="time" size={20} color="#f59e0b" />
                 <Text style={styles.instructionText}>
-                  You have 90 minutes (1.5 hours) to complete all {questions.length} questions
+                  You have 90 minutes (1.5 hours) to complete all {EXAM_QUESTION_COUNT} questions
                 </Text>
               </View>
 
               <View style={styles.instructionItem}>
                 <Ionicons name="alert-circle" size={20} color="#ef4444" />
                 <Text style={styles.instructionText}>
-                  Once started, the timer CANNOT be paused
+                  Once started, the timer CANNOT be paused, but your answers are saved as you go
                 </Text>
               </View>
 
@@ -179,7 +232,9 @@ export default function PracticeExam() {
 
             <TouchableOpacity style={styles.startButton} onPress={handleStart}>
               <Ionicons name="play-circle" size={24} color="#fff" />
-              <Text style={styles.startButtonText}>Start Practice Exam</Text>
+              <Text style={styles.startButtonText}>
+                {resumable ? 'Resume Practice Exam' : 'Start Practice Exam'}
+              </Text>
             </TouchableOpacity>
 
             <Text style={styles.disclaimer}>
@@ -196,14 +251,19 @@ export default function PracticeExam() {
     const answeredCount = Object.keys(answers).length;
     const passingScore = 70;
     const passed = score! >= passingScore;
+    const timeUsed = Math.min(
+      exam?.duration_seconds ?? EXAM_DURATION,
+      Math.round((Date.parse(exam?.finished_at) - Date.parse(exam?.created_at)) / 1000) || 0
+    );
+    const correctIds = new Set((exam?.results || []).filter((r: any) => r.correct).map((r: any) => r.question_id));
     
     // Calculate wrong answers
     const wrongAnswers = questions
       .map((q, idx) => ({
         question: q,
         index: idx,
-        userAnswer: answers[idx],
-        isCorrect: answers[idx] === q.answer,
+        userAnswer: answerText(q.question_id),
+        isCorrect: correctIds.has(q.question_id),
       }))
       .filter(item => !item.isCorrect);
 
@@ -230,7 +290,7 @@ export default function PracticeExam() {
               <View style={styles.statRow}>
                 <Text style={styles.statLabel}>Correct Answers:</Text>
                 <Text style={styles.statValue}>
-                  {Math.round((score! / 100) * questions.length)} / {questions.length}
+                  {exam?.correct ?? 0} / {exam?.total ?? questions.length}
                 </Text>
               </View>
               <View style={styles.statRow}>
@@ -239,7 +299,7 @@ export default function PracticeExam() {
               </View>
               <View style={styles.statRow}>
                 <Text style={styles.statLabel}>Time Used:</Text>
-                <Text style={styles.statValue}>{formatTime(EXAM_DURATION - timeRemaining)}</Text>
+                <Text style={styles.statValue}>{formatTime(timeUsed)}</Text>
               </View>
             </View>
 
@@ -257,7 +317,7 @@ export default function PracticeExam() {
                       Question {item.index + 1}
                     </Text>
                     <Text style={styles.reviewQuestionText}>
-                      {item.question.content}
+                      {item.question.question || item.question.content}
                     </Text>
 
                     <View style={styles.answerComparison}>
@@ -271,7 +331,7 @@ export default function PracticeExam() {
                       <View style={styles.correctAnswerBox}>
                         <Text style={styles.answerLabel}>Correct Answer:</Text>
                         <Text style={styles.correctAnswerText}>
-                          ✅ {item.question.answer}
+                          ✅ {(item.question.correct_answers || []).join(', ')}
                         </Text>
                       </View>
                     </View>
@@ -298,8 +358,10 @@ export default function PracticeExam() {
             <TouchableOpacity 
               style={styles.reviewButton}
               onPress={() => {
+                setExam(null);
                 setExamStarted(false);
                 setExamCompleted(false);
+                setQuestions([]);
                 setAnswers({});
                 setCurrentIndex(0);
                 setTimeRemaining(EXAM_DURATION);
@@ -321,6 +383,7 @@ export default function PracticeExam() {
 
   // Active exam
   const currentQuestion = questions[currentIndex];
+  const selected = answers[currentQuestion?.question_id] || [];
   const timeColor = timeRemaining < 600 ? '#ef4444' : timeRemaining < 1800 ? '#f59e0b' : '#10b981';
 
   return (
@@ -342,7 +405,7 @@ export default function PracticeExam() {
       <ScrollView style={styles.questionContainer}>
         <View style={styles.questionCard}>
           <Text style={styles.questionNumber}>Question {currentIndex + 1}</Text>
-          <Text style={styles.questionText}>{currentQuestion?.content}</Text>
+          <Text style={styles.questionText}>{currentQuestion?.question || currentQuestion?.content}</Text>
 
           <View style={styles.optionsContainer}>
             {currentQuestion?.options?.map((option: string, idx: number) => (
@@ -350,21 +413,21 @@ export default function PracticeExam() {
                 key={idx}
                 style={[
                   styles.optionButton,
-                  answers[currentIndex] === option && styles.optionSelected,
+                  selected.includes(option) && styles.optionSelected,
                 ]}
                 onPress={() => handleAnswer(option)}
               >
                 <View style={[
                   styles.optionCircle,
-                  answers[currentIndex] === option && styles.optionCircleSelected
+                  selected.includes(option) && styles.optionCircleSelected
                 ]}>
-                  {answers[currentIndex] === option && (
+                  {selected.includes(option) && (
                     <Ionicons name="checkmark" size={16} color="#fff" />
                   )}
                 </View>
                 <Text style={[
                   styles.optionText,
-                  answers[currentIndex] === option && styles.optionTextSelected
+                  selected.includes(option) && styles.optionTextSelected
                 ]}>
                   {option}
                 </Text>
@@ -388,7 +451,7 @@ export default function PracticeExam() {
         </TouchableOpacity>
 
         {currentIndex === questions.length - 1 ? (
-          <TouchableOpacity style={styles.submitButton} onPress={handleSubmit}>
+          <TouchableOpacity style={styles.submitButton} onPress={handleSubmit} disabled={submitting}>
             <Ionicons name="checkmark-done" size={24} color="#fff" />
             <Text style={styles.submitButtonText}>Submit Exam</Text>
           </TouchableOpacity>
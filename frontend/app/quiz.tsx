@@ -12,7 +12,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { Ionicons } from '@expo/vector-icons';
 import { useAuth } from '../contexts/AuthContext';
 import { useRouter, useLocalSearchParams } from 'expo-router';
-import { questionService } from '../services/api';
+import { questionService, attemptService } from '../services/api';
 
 export default function Quiz() {
   const { sessionToken } = useAuth();
@@ -102,6 +102,10 @@ export default function Quiz() {
       setShowResult(false);
     } else {
       setQuizComplete(true);
+      attemptService.recordBatch(
+        answers.map(a => ({ question_id: a.questionId, selected: a.selected })),
+        sessionToken || undefined
+      ).catch(error => console.error('Failed to record quiz results:', error));
     }
   };
 
@@ -29,6 +29,18 @@ const api = axios.create({
 // Flag to prevent infinite retry loops
 let isRefreshing = false;
 
+// Random per-install id; lets the backend reuse one guest session per device
+let deviceId: string | null = null;
+const getDeviceId = async () => {
+  if (deviceId) return deviceId;
+  deviceId = await AsyncStorage.getItem('device_id');
+  if (!deviceId) {
+    deviceId = `dev_${Date.now().toString(36)}${Math.random().toString(36).slice(2, 12)}`;
+    await AsyncStorage.setItem('device_id', deviceId);
+  }
+  return deviceId;
+};
+
 // Request interceptor to add auth token to all requests
 api.interceptors.request.use(
   async (config) => {
@@ -40,6 +52,7 @@ api.interceptors.request.use(
       } else {
         console.log('No auth token found for request:', config.url);
       }
+      config.headers['X-Device-Id'] = await getDeviceId();
     } catch (error) {
       console.error('Error getting token from storage:', error);
     }
@@ -64,7 +77,9 @@ api.interceptors.response.use(
       try {
         // Try to get a new guest session
         console.log('Session expired, getting new guest session...');
-        const response = await axios.post(`${BACKEND_URL}/api/auth/guest`);
+        const response = await axios.post(`${BACKEND_URL}/api/auth/guest`, {}, {
+          headers: { 'X-Device-Id': await getDeviceId() },
+        });
         const newToken = response.data.session_token;
         
         if (newToken) {
@@ -206,6 +221,27 @@ export const questionService = {
     return response.data;
   },
 
+  async searchQuestions(q: string, options: { type?: string; categoryId?: string; limit?: number } = {}, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const params: any = { q };
+    if (options.type) params.type = options.type;
+    if (options.categoryId) params.category_id = options.categoryId;
+    if (options.limit) params.limit = options.limit;
+    
+    const response = await api.get('/questions/search', { headers, params });
+    return response.data;
+  },
+
+  async getQuestionsByReference(reference: string, options: { type?: string; includeChildren?: boolean } = {}, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const params: any = {};
+    if (options.type) params.type = options.type;
+    if (options.includeChildren === false) params.include_children = false;
+
+    const response = await api.get(`/references/${encodeURIComponent(reference)}/questions`, { headers, params });
+    return response.data;
+  },
+
   async getQuestion(questionId: string, token?: string) {
     const headers = token ? { Authorization: `Bearer ${token}` } : {};
     const response = await api.get(`/questions/${questionId}`, { headers });
@@ -247,17 +283,103 @@ export const bookmarkService = {
     return response.data;
   },
 
+  async setBookmarks(questionIds: string[], bookmarked = true, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.put('/bookmarks', { question_ids: questionIds, bookmarked }, { headers });
+    return response.data;
+  },
+
   async getBookmarks(token?: string) {
     const headers = token ? { Authorization: `Bearer ${token}` } : {};
     const response = await api.get('/bookmarks', { headers });
     return response.data;
   },
 
+  async getBookmarkPage(options: { limit?: number; cursor?: string; idsOnly?: boolean } = {}, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const params: any = { limit: options.limit || 50 };
+    if (options.cursor) params.cursor = options.cursor;
+    if (options.idsOnly) params.ids_only = true;
+
+    const response = await api.get('/bookmarks', { headers, params });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+  },
+
   async getProgress(questionId: string, token?: string) {
     const headers = token ? { Authorization: `Bearer ${token}` } : {};
     const response = await api.get(`/progress/${questionId}`, { headers });
     return response.data;
   },
+
+  async lookupProgress(query: { questionIds?: string[]; categoryId?: string }, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.post('/progress/lookup', {
+      question_ids: query.questionIds,
+      category_id: query.categoryId,
+    }, { headers });
+    return response.data.progress;
+  },
+};
+
+// Review Service (spaced repetition)
+export const reviewService = {
+  async getNext(n = 10, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.get('/review/next', { headers, params: { n } });
+    return response.data;
+  },
+
+  async submitReview(questionId: string, quality: number, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.post(`/review/${questionId}`, { quality }, { headers });
+    return response.data;
+  },
+};
+
+// Attempt Service
+export const attemptService = {
+  async recordBatch(attempts: { question_id: string; selected?: string[]; correct?: boolean }[], token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.post('/attempts/batch', { attempts }, { headers });
+    return response.data;
+  },
+};
+
+// Exam Service (server-side practice exam sessions)
+export const examService = {
+  async startExam(options: { count?: number; categoryId?: string; durationMinutes?: number } = {}, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.post('/exams', {
+      count: options.count,
+      category_id: options.categoryId,
+      duration_minutes: options.durationMinutes,
+    }, { headers });
+    return response.data;
+  },
+
+  async listExams(limit = 20, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.get('/exams', { headers, params: { limit } });
+    return response.data;
+  },
+
+  async getExam(examId: string, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.get(`/exams/${examId}`, { headers });
+    return response.data;
+  },
+
+  async saveAnswers(examId: string, answers: { [questionId: string]: string[] }, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.patch(`/exams/${examId}/answers`, { answers }, { headers });
+    return response.data;
+  },
+
+  async finishExam(examId: string, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.post(`/exams/${examId}/finish`, {}, { headers });
+    return response.data;
+  },
 };
 
 // Scenario Service
@@ -272,9 +394,18 @@ export const scenarioService = {
     return response.data;
   },
 
-  async getHistory(token?: string) {
+  async getHistory(options: { limit?: number; cursor?: string } = {}, token?: string) {
     const headers = token ? { Authorization: `Bearer ${token}` } : {};
-    const response = await api.get('/scenarios/history', { headers });
+    const params: any = { limit: options.limit || 20 };
+    if (options.cursor) params.cursor = options.cursor;
+
+    const response = await api.get('/scenarios/history', { headers, params });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+  },
+
+  async getResponse(responseId: string, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.get(`/scenarios/history/${responseId}`, { headers });
     return response.data;
   },
 };
@@ -298,6 +429,16 @@ export const statsService = {
   },
 };
 
+// Sync Service (delta sync for the offline copy)
+export const syncService = {
+  // Pass the cursor from the previous sync; without one everything is returned
+  async getChanges(since?: string, token?: string) {
+    const headers = token ? { Authorization: `Bearer ${token}` } : {};
+    const response = await api.get('/sync', { headers, params: since ? { since } : {} });
+    return response.data;
+  },
+};
+
 // Admin Service
 export const adminService = {
   async getAnalytics(token?: string) {
@@ -0,0 +1,111 @@
+"""
+Shared setup: the backend modules live in backend/ and server.py reads its
+MongoDB settings at import time (the client only connects on first use).
+
+The ``mongo`` fixture is an in-memory database with Motor's async API,
+backed by mongomock; tests that use it are skipped when mongomock is not
+installed.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "cpd_test")
+
+
+class AsyncCursor:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self.cursor = self.cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, n):
+        self.cursor = self.cursor.limit(n)
+        return self
+
+    def skip(self, n):
+        self.cursor = self.cursor.skip(n)
+        return self
+
+    def batch_size(self, n):
+        return self
+
+    async def to_list(self, length=None):
+        docs = list(self.cursor)
+        return docs if length is None else docs[:length]
+
+    def __aiter__(self):
+        self.iterator = iter(self.cursor)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncCollection:
+    def __init__(self, database, collection):
+        self.database = database
+        self.collection = collection
+
+    def find(self, *args, **kwargs):
+        return AsyncCursor(self.collection.find(*args, **kwargs))
+
+    def aggregate(self, pipeline, **kwargs):
+        return AsyncCursor(self.collection.aggregate(pipeline))
+
+    async def estimated_document_count(self):
+        return self.collection.count_documents({})
+
+    def __getattr__(self, name):
+        method = getattr(self.collection, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+class AsyncClient:
+    def __init__(self, client):
+        self.sync = client
+
+    def __getitem__(self, name):
+        return AsyncDatabase(self.sync[name])
+
+    async def drop_database(self, name):
+        self.sync.drop_database(name)
+
+
+class AsyncDatabase:
+    def __init__(self, database):
+        self.sync = database
+        self.name = database.name
+        self.client = AsyncClient(database.client)
+
+    def __getattr__(self, name):
+        return AsyncCollection(self, self.sync[name])
+
+    def __getitem__(self, name):
+        return AsyncCollection(self, self.sync[name])
+
+    async def list_collection_names(self):
+        return self.sync.list_collection_names()
+
+    async def command(self, *args, **kwargs):
+        return self.sync.command(*args, **kwargs)
+
+
+@pytest.fixture
+def mongo():
+    mongomock = pytest.importorskip("mongomock")
+    return AsyncDatabase(mongomock.MongoClient().cpd_test)
@@ -0,0 +1,58 @@
+"""Batch grading and recording of quiz, MCQ test and practice exam answers"""
+from datetime import datetime, timezone
+
+import pytest
+
+from attempts import grade_attempts
+
+QUESTIONS = {
+    "mcq": {"question_id": "mcq", "type": "multiple_choice", "correct_answers": ["A", "C"]},
+    "exam": {"question_id": "exam", "type": "practice_exam", "answer": "B"},
+    "card": {"question_id": "card", "type": "flashcard"},
+    "scenario": {"question_id": "scenario", "type": "scenario"},
+}
+
+
+def test_grading_by_question_type():
+    results = grade_attempts(QUESTIONS, [
+        {"question_id": "mcq", "selected": ["C", "A"]},
+        {"question_id": "exam", "selected": ["B"]},
+        {"question_id": "exam", "selected": ["B", "C"]},
+        {"question_id": "card", "correct": False},
+        {"question_id": "scenario", "selected": ["A"]},
+        {"question_id": "missing", "selected": ["A"]},
+    ])
+    assert [r.get("correct") for r in results] == [True, True, False, False, None, None]
+    assert results[1] == {"question_id": "exam", "type": "practice_exam", "correct": True, "correct_answers": ["B"]}
+    assert "error" in results[4] and "error" in results[5]
+
+
+@pytest.fixture
+def client(mongo, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    monkeypatch.setattr(server, "db", mongo)
+    now = datetime.now(timezone.utc)
+    server.app.dependency_overrides[server.require_user] = lambda: server.User(
+        user_id="user_1", email="a@example.com", name="A", role="user", created_at=now
+    )
+    for question in QUESTIONS.values():
+        mongo.sync.questions.insert_one(dict(question))
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+def test_practice_exam_batch_moves_stats_and_progress(client, mongo):
+    response = client.post("/api/attempts/batch", json={"attempts": [
+        {"question_id": "exam", "selected": ["B"]},
+        {"question_id": "mcq", "selected": ["A"]},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["recorded"] == 2 and body["correct"] == 1 and body["score"] == 50.0
+    assert body["totals"]["mcq_answered"] == 2 and body["totals"]["mcq_correct"] == 1
+
+    progress = mongo.sync.user_progress.find_one({"user_id": "user_1", "question_id": "exam"})
+    assert progress["attempts"] == 1 and progress["correct_count"] == 1 and progress["last_correct"]
+    assert mongo.sync.user_stats.find_one({"user_id": "user_1"})["mcq_answered"] == 2
@@ -0,0 +1,53 @@
+"""Atomic bookmark toggling"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+
+class FakeProgress:
+    """The find_one_and_update calls toggle_bookmark makes, failing the first upsert once"""
+
+    def __init__(self, race=False):
+        self.calls = []
+        self.race = race
+
+    async def find_one_and_update(self, query, update, projection=None, upsert=False, return_document=None):
+        self.calls.append({"query": query, "update": update, "upsert": upsert})
+        if self.race and upsert:
+            raise DuplicateKeyError("E11000 duplicate key error")
+        return {"bookmarked": True}
+
+
+@pytest.fixture
+def toggle(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    progress = FakeProgress()
+    monkeypatch.setattr(server, "db", SimpleNamespace(user_progress=progress))
+    server.app.dependency_overrides[server.require_user] = lambda: server.User(
+        user_id="user_1", email="a@example.com", name="A", role="user", created_at=datetime.now(timezone.utc)
+    )
+    client = TestClient(server.app)
+    yield progress, lambda: client.post("/api/bookmarks/toggle", json={"question_id": "q_1"})
+    server.app.dependency_overrides.clear()
+
+
+def test_a_toggle_is_one_server_side_update(toggle):
+    progress, post = toggle
+    assert post().json() == {"bookmarked": True}
+    [call] = progress.calls
+    assert call["query"] == {"user_id": "user_1", "question_id": "q_1"} and call["upsert"]
+    # An update pipeline reading the stored flag, not a value computed by the app
+    [stage] = call["update"]
+    assert stage["$set"]["bookmarked"] == {"$not": [{"$ifNull": ["$bookmarked", False]}]}
+
+
+def test_the_loser_of_a_first_toggle_race_updates_the_winner_document(toggle):
+    progress, post = toggle
+    progress.race = True
+    assert post().json() == {"bookmarked": True}
+    assert [call["upsert"] for call in progress.calls] == [True, False]
+    assert progress.calls[0]["update"] == progress.calls[1]["update"]
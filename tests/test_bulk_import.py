@@ -0,0 +1,98 @@
+"""NDJSON parsing, byte-stream helpers and import modes"""
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from bulk_import import BulkImportError, gunzip_chunks, import_stream, iter_lines, parse_line
+
+
+async def chunks_of(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def collect(lines):
+    return [line async for line in lines]
+
+
+# ========== PARSING ==========
+
+def test_parse_line_reads_plain_and_extended_json():
+    assert parse_line('{"question_id": "q_1"}') == {"question_id": "q_1"}
+    doc = parse_line(b'{"created_at": {"$date": "2024-01-02T00:00:00Z"}, "n": {"$numberLong": "5"}}\n')
+    assert doc["created_at"].year == 2024 and doc["n"] == 5
+    assert parse_line("   \n") is None
+
+
+@pytest.mark.parametrize("line", ['[1, 2]', '"text"', '{"unterminated": '])
+def test_parse_line_rejects_non_objects(line):
+    with pytest.raises(ValueError):
+        parse_line(line)
+
+
+def test_a_bad_line_is_reported_by_number(mongo):
+    lines = ['{"category_id": "a"}', '', '[1]']
+    with pytest.raises(BulkImportError, match="line 3"):
+        asyncio.run(import_stream(mongo, lines, collection="categories"))
+    assert mongo.sync.categories.count_documents({}) == 0
+
+
+# ========== BYTE STREAMS ==========
+
+def test_iter_lines_joins_lines_split_across_chunks():
+    data = b'{"a": 1}\n{"b": 2}\n\n{"c": 3}'
+    for size in (1, 3, 7, len(data)):
+        assert asyncio.run(collect(iter_lines(chunks_of(data, size)))) == [
+            b'{"a": 1}', b'{"b": 2}', b'', b'{"c": 3}']
+
+
+def test_gunzip_chunks_reads_concatenated_members():
+    body = gzip.compress(b'{"a": 1}\n') + gzip.compress(b'{"b": 2}\n') + gzip.compress(b'{"c": 3}')
+    for size in (5, 64, len(body)):
+        lines = asyncio.run(collect(iter_lines(gunzip_chunks(chunks_of(body, size)))))
+        assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+def test_gunzip_chunks_rejects_a_body_that_is_not_gzip():
+    with pytest.raises(BulkImportError, match="Invalid gzip"):
+        asyncio.run(collect(gunzip_chunks(chunks_of(b"not gzip at all", 4))))
+
+
+# ========== MODES ==========
+
+def envelope(collection, document):
+    return json.dumps({"collection": collection, "document": document})
+
+
+def test_a_resumed_export_is_upserted_rather_than_replaced(mongo):
+    mongo.sync.categories.insert_many([{"category_id": f"c_{i}", "name": "old"} for i in range(10)])
+    lines = [json.dumps({"resumed_from": "token"}), envelope("categories", {"category_id": "c_9", "name": "new"}),
+             json.dumps({"checkpoint": "next"}), envelope("categories", {"category_id": "c_10", "name": "new"})]
+    stats = asyncio.run(import_stream(mongo, lines))
+
+    assert stats["categories"]["mode"] == "upsert"
+    assert mongo.sync.categories.count_documents({}) == 11
+    assert mongo.sync.categories.find_one({"category_id": "c_9"})["name"] == "new"
+    assert mongo.sync.tombstones.find_one({"collection": "categories", "reset": True})
+
+
+def test_without_resumed_from_an_export_replaces(mongo):
+    mongo.sync.categories.insert_many([{"category_id": f"c_{i}"} for i in range(2)])
+    lines = [envelope("categories", {"category_id": "c_new"})]
+    stats = asyncio.run(import_stream(mongo, lines))
+    assert stats["categories"]["mode"] == "replace"
+    assert [c["category_id"] for c in mongo.sync.categories.find()] == ["c_new"]
+
+
+def test_users_are_only_added_and_unknown_collections_refused(mongo):
+    mongo.sync.users.insert_one({"email": "a@example.com", "name": "Kept"})
+    lines = [envelope("users", {"email": "A@example.com", "name": "Dropped"}),
+             envelope("users", {"email": "b@example.com", "name": "Added"})]
+    stats = asyncio.run(import_stream(mongo, lines))
+    assert stats["users"]["mode"] == "insert_missing"
+    assert sorted(u["name"] for u in mongo.sync.users.find()) == ["Added", "Kept"]
+
+    with pytest.raises(BulkImportError, match="cannot be imported"):
+        asyncio.run(import_stream(mongo, [envelope("user_sessions", {"session_token": "x"})]))
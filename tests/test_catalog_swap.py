@@ -0,0 +1,84 @@
+"""Staged replacements: the shrink check, force, rollback and concurrent runs"""
+import asyncio
+
+import pytest
+
+from catalog_swap import StagedCollection, SwapValidationError, rollback, staged_replace
+
+
+def categories(n, prefix="cat"):
+    return [{"category_id": f"{prefix}_{i}", "name": f"{prefix} {i}"} for i in range(n)]
+
+
+def live_ids(mongo, name="categories"):
+    return sorted(doc["category_id"] for doc in mongo.sync[name].find())
+
+
+def test_replacement_swaps_in_and_keeps_the_previous_version(mongo):
+    mongo.sync.categories.insert_many(categories(4))
+    stats = asyncio.run(staged_replace(mongo, "categories", categories(3, "new"), chunk_size=2))
+    assert stats == {"collection": "categories", "previous": 4, "current": 3}
+    assert live_ids(mongo) == ["new_0", "new_1", "new_2"]
+    assert mongo.sync["categories__previous"].count_documents({}) == 4
+    assert not [c for c in mongo.sync.list_collection_names() if "__staging" in c]
+
+    asyncio.run(rollback(mongo, "categories"))
+    assert live_ids(mongo) == [f"cat_{i}" for i in range(4)]
+
+
+def test_a_much_smaller_replacement_is_refused(mongo):
+    mongo.sync.categories.insert_many(categories(10))
+    with pytest.raises(SwapValidationError, match="refusing to swap"):
+        asyncio.run(staged_replace(mongo, "categories", categories(4, "new")))
+    assert live_ids(mongo) == sorted(f"cat_{i}" for i in range(10))
+    assert not [c for c in mongo.sync.list_collection_names() if "__staging" in c]
+
+
+def test_force_overrides_the_shrink_check(mongo):
+    mongo.sync.categories.insert_many(categories(10))
+    stats = asyncio.run(staged_replace(mongo, "categories", categories(4, "new"), force=True))
+    assert stats["current"] == 4 and len(live_ids(mongo)) == 4
+
+
+def test_concurrent_runs_stage_separately(mongo):
+    first, second = StagedCollection(mongo, "categories"), StagedCollection(mongo, "categories")
+    assert first.staging_name != second.staging_name
+
+    async def interleaved():
+        await first.begin()
+        await first.add({"category_id": "first"})
+        await first.flush()
+        await second.begin()  # must not drop the first run's documents
+        await second.add({"category_id": "second"})
+        await first.commit()
+        await second.commit()
+
+    asyncio.run(interleaved())
+    assert live_ids(mongo) == ["second"]
+    assert mongo.sync["categories__previous"].count_documents({"category_id": "first"}) == 1
+
+
+def test_stale_staging_collections_are_dropped(mongo):
+    mongo.sync["categories__staging_1000_deadbeef"].insert_one({"category_id": "left over"})
+    mongo.sync["questions__staging_1000_deadbeef"].insert_one({"question_id": "other target"})
+    asyncio.run(StagedCollection(mongo, "categories").begin())
+    names = mongo.sync.list_collection_names()
+    assert "categories__staging_1000_deadbeef" not in names
+    assert "questions__staging_1000_deadbeef" in names
+
+
+def test_import_data_answers_409_unless_forced(mongo, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    monkeypatch.setattr(server, "db", mongo)
+    mongo.sync.categories.insert_many(categories(10))
+    client = TestClient(server.app)
+
+    refused = client.post("/api/admin/import-data", json={"categories": categories(2, "new")})
+    assert refused.status_code == 409
+    assert len(live_ids(mongo)) == 10
+
+    forced = client.post("/api/admin/import-data?force=true", json={"categories": categories(2, "new")})
+    assert forced.status_code == 200
+    assert live_ids(mongo) == ["new_0", "new_1"]
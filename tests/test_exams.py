@@ -0,0 +1,54 @@
+"""Practice exam sessions: frozen questions, incremental answers, scoring once"""
+import asyncio
+
+import pytest
+
+from exams import ExamError, create_exam, finish_exam, get_exam, save_answers
+
+
+@pytest.fixture
+def bank(mongo):
+    mongo.sync.questions.insert_many([
+        {"question_id": f"mcq_{i}", "type": "multiple_choice", "question": f"Q{i}",
+         "options": ["A", "B", "C"], "correct_answers": ["B"], "explanation": "why"}
+        for i in range(3)
+    ])
+    return mongo
+
+
+def test_running_exams_hide_answers_and_resume_with_saved_answers(bank):
+    session = asyncio.run(create_exam(bank, "user_1", count=3))
+    asyncio.run(save_answers(bank, "user_1", session["exam_id"], {"mcq_0": ["B"]}))
+    asyncio.run(save_answers(bank, "user_1", session["exam_id"], {"mcq_1": ["A"]}))
+
+    resumed = asyncio.run(get_exam(bank, "user_1", session["exam_id"]))
+    assert resumed["question_ids"] == session["question_ids"]
+    assert resumed["answers"] == {"mcq_0": ["B"], "mcq_1": ["A"]}
+    assert all("correct_answers" not in q and "explanation" not in q for q in resumed["questions"])
+    assert 0 < resumed["remaining_seconds"] <= session["duration_seconds"]
+
+
+def test_answers_outside_the_exam_are_rejected(bank):
+    session = asyncio.run(create_exam(bank, "user_1", count=3))
+    with pytest.raises(ExamError) as raised:
+        asyncio.run(save_answers(bank, "user_1", session["exam_id"], {"other": ["A"]}))
+    assert raised.value.status_code == 400
+    with pytest.raises(ExamError) as raised:
+        asyncio.run(save_answers(bank, "user_2", session["exam_id"], {"mcq_0": ["A"]}))
+    assert raised.value.status_code == 404
+
+
+def test_finishing_scores_once_and_records_answered_questions(bank):
+    session = asyncio.run(create_exam(bank, "user_1", count=3))
+    asyncio.run(save_answers(bank, "user_1", session["exam_id"], {"mcq_0": ["B"], "mcq_1": ["A"]}))
+
+    finished = asyncio.run(finish_exam(bank, "user_1", session["exam_id"]))
+    assert (finished["status"], finished["correct"], finished["total"]) == ("finished", 1, 3)
+    assert all(q["correct_answers"] == ["B"] for q in finished["questions"])
+    assert asyncio.run(finish_exam(bank, "user_1", session["exam_id"]))["score"] == finished["score"]
+
+    stats = bank.sync.user_stats.find_one({"user_id": "user_1"})
+    assert (stats["mcq_answered"], stats["mcq_correct"]) == (2, 1)
+    with pytest.raises(ExamError) as raised:
+        asyncio.run(save_answers(bank, "user_1", session["exam_id"], {"mcq_2": ["B"]}))
+    assert raised.value.status_code == 409
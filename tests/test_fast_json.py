@@ -0,0 +1,74 @@
+"""FastJSONResponse rendering and TimedRoute's serialize phase"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+import metrics
+from fast_json import FastJSONResponse, TimedRoute, dumps
+
+VALIDATION_SECONDS = 0.05
+
+
+class Slow(BaseModel):
+    value: int
+
+    @field_validator("value")
+    @classmethod
+    def slow(cls, value):
+        time.sleep(VALIDATION_SECONDS)
+        return value
+
+
+def make_client() -> TestClient:
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/timed/async", response_model=List[Slow])
+    async def timed_async():
+        return [{"value": 1}]
+
+    @router.get("/timed/sync", response_model=List[Slow])
+    def timed_sync():
+        return [{"value": 2}]
+
+    @router.get("/timed/response")
+    async def timed_response():
+        return FastJSONResponse([3])
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(router)
+    app.add_middleware(metrics.MetricsMiddleware)
+    return TestClient(app)
+
+
+def serialize_seconds(route: str) -> float:
+    return metrics.PHASE_SECONDS.values.get((route, "serialize"), 0.0)
+
+
+def test_response_model_validation_is_serialize_time():
+    client = make_client()
+    for route, expected in (("/timed/async", [{"value": 1}]), ("/timed/sync", [{"value": 2}])):
+        before = serialize_seconds(route)
+        assert client.get(route).json() == expected
+        assert serialize_seconds(route) - before >= VALIDATION_SECONDS
+
+
+def test_returned_responses_are_only_timed_while_rendering():
+    client = make_client()
+    before = serialize_seconds("/timed/response")
+    assert client.get("/timed/response").json() == [3]
+    assert serialize_seconds("/timed/response") - before < VALIDATION_SECONDS
+
+
+def test_datetimes_render_as_pydantic_renders_them():
+    class Stamped(BaseModel):
+        at: datetime
+
+    for at in (datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+               datetime(2024, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+               datetime(2024, 1, 2, 3, 4, 5),
+               datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=-6)))):
+        assert dumps({"at": at}).decode() == Stamped(at=at).model_dump_json()
@@ -0,0 +1,96 @@
+"""Per-device guests, their sessions and merging a guest into a new account"""
+import asyncio
+
+import pytest
+
+from guests import SHARED_GUEST_ID, USER_COLLECTIONS, ensure_guest, guest_user_id, merge_into_new_account
+
+GUEST = guest_user_id("a1b2c3d4e5f6a7b8c9d0e1f2")
+OTHER_GUEST = guest_user_id("ffffffffffffffffffffffff")
+
+
+def seed(mongo):
+    for user_id in (GUEST, OTHER_GUEST):
+        asyncio.run(ensure_guest(mongo, user_id))
+        for name in USER_COLLECTIONS:
+            mongo.sync[name].insert_many([{"user_id": user_id, "n": i} for i in range(2)])
+        mongo.sync.user_sessions.insert_one({"user_id": user_id, "session_token": f"session_{user_id}"})
+        mongo.sync.user_progress_bits.insert_one({"user_id": user_id})
+
+
+def test_guests_are_created_once_per_device(mongo):
+    first = asyncio.run(ensure_guest(mongo, GUEST))
+    assert first["role"] == "guest" and first["email"] == f"{GUEST}@guest.cpd-study.app"
+    assert asyncio.run(ensure_guest(mongo, GUEST)) == first
+    assert mongo.sync.users.count_documents({"user_id": GUEST}) == 1
+
+
+def test_merge_moves_every_collection_and_removes_the_guest(mongo):
+    seed(mongo)
+    moved = asyncio.run(merge_into_new_account(mongo, GUEST, "user_new"))
+
+    assert moved == {name: 2 for name in USER_COLLECTIONS}
+    for name in USER_COLLECTIONS:
+        assert mongo.sync[name].count_documents({"user_id": "user_new"}) == 2
+        assert mongo.sync[name].count_documents({"user_id": GUEST}) == 0
+        assert mongo.sync[name].count_documents({"user_id": OTHER_GUEST}) == 2
+    # Moved progress shows up as changed for delta sync
+    assert all(p.get("updated_at") for p in mongo.sync.user_progress.find({"user_id": "user_new"}))
+
+    assert not mongo.sync.users.find_one({"user_id": GUEST})
+    assert not mongo.sync.user_sessions.find_one({"user_id": GUEST})
+    assert [b["user_id"] for b in mongo.sync.user_progress_bits.find()] == [OTHER_GUEST]
+
+
+def test_the_shared_guest_is_never_merged(mongo):
+    asyncio.run(ensure_guest(mongo, SHARED_GUEST_ID))
+    mongo.sync.user_progress.insert_one({"user_id": SHARED_GUEST_ID})
+    assert asyncio.run(merge_into_new_account(mongo, SHARED_GUEST_ID, "user_new")) == {}
+    assert mongo.sync.user_progress.count_documents({"user_id": SHARED_GUEST_ID}) == 1
+    assert mongo.sync.users.find_one({"user_id": SHARED_GUEST_ID})
+
+
+# ========== GUEST SESSIONS ==========
+
+@pytest.fixture
+def client(mongo, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    monkeypatch.setattr(server, "db", mongo)
+    monkeypatch.delenv("SESSION_SIGNING_KEY", raising=False)
+    return TestClient(server.app)
+
+
+def guest_login(client, device=None):
+    response = client.post("/api/auth/guest", headers={"X-Device-Id": device} if device else {})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_a_device_keeps_one_renewed_guest_session(client, mongo):
+    first = guest_login(client, "device-1")
+    expires = mongo.sync.user_sessions.find_one({"session_token": first["session_token"]})["expires_at"]
+    again = guest_login(client, "device-1")
+    other = guest_login(client, "device-2")
+
+    assert again["session_token"] == first["session_token"] and again["user_id"] == first["user_id"]
+    assert first["user_id"].startswith("guest_") and other["user_id"] != first["user_id"]
+    assert mongo.sync.user_sessions.count_documents({}) == 2
+    assert mongo.sync.user_sessions.find_one({"session_token": first["session_token"]})["expires_at"] >= expires
+    assert guest_login(client)["user_id"] == SHARED_GUEST_ID
+
+
+def test_signed_guest_tokens_leave_no_session_rows(client, mongo, monkeypatch):
+    import session_tokens
+    monkeypatch.setenv("SESSION_SIGNING_KEY", "test-key")
+    token = guest_login(client, "device-1")["session_token"]
+    assert session_tokens.is_signed(token)
+    assert mongo.sync.user_sessions.count_documents({}) == 0
+
+
+def test_expired_sessions_are_left_to_a_ttl_index():
+    from db_indexes import INDEXES
+
+    expiring = [index.document for index in INDEXES["user_sessions"] if "expireAfterSeconds" in index.document]
+    assert [(dict(i["key"]), i["expireAfterSeconds"]) for i in expiring] == [({"expires_at": 1}, 0)]
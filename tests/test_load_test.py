@@ -0,0 +1,52 @@
+"""Load test seeding and result comparison"""
+import asyncio
+import random
+
+import pytest
+
+import load_test
+
+SCALE = {"users": 7, "responses": 11, "progress_per_user": 3, "bookmarks_per_user": 1}
+
+
+def test_seed_writes_every_collection_in_batches(mongo, monkeypatch):
+    monkeypatch.setattr(load_test, "BATCH_SIZE", 4)
+    db = mongo.client["cpd_loadtest"]
+    batches = []
+
+    async def insert_many(self, docs, **kwargs):
+        batches.append((self.collection.name, len(docs)))
+        return self.collection.insert_many(docs, **kwargs)
+
+    monkeypatch.setattr(type(db.users), "insert_many", insert_many, raising=False)
+    asyncio.run(load_test.seed(db, SCALE, random.Random(1), log=lambda *_: None))
+
+    assert db.sync.users.count_documents({}) == 7
+    assert db.sync.user_progress.count_documents({}) == 21
+    assert db.sync.user_progress.count_documents({"bookmarked": True}) == 7
+    assert db.sync.user_stats.count_documents({}) == 7
+    assert db.sync.scenario_responses.count_documents({}) == 11
+    assert db.sync.load_test_meta.find_one({"_id": "seed"})["scale"] == SCALE
+    seeded = [n for name, n in batches if name in ("users", "user_progress", "scenario_responses")]
+    assert seeded and max(seeded) <= 4
+
+
+def test_seed_refuses_other_databases(mongo):
+    with pytest.raises(SystemExit, match="Refusing to seed"):
+        asyncio.run(load_test.seed(mongo, SCALE, random.Random(1)))
+
+
+def result(p95, throughput=100.0, error_rate=0.0):
+    return {"endpoints": {"questions": {"p95_ms": p95, "p99_ms": p95, "throughput": throughput,
+                                        "error_rate": error_rate}}}
+
+
+def test_compare_reports_only_regressions_beyond_the_tolerance():
+    assert load_test.compare(result(100), result(115), 0.2) == []
+    assert load_test.compare(result(10), result(14), 0.2) == []  # under MIN_REGRESSION_MS
+    assert load_test.compare(result(100), result(130), 0.2) == [
+        "questions: p95_ms 100.0 -> 130.0", "questions: p99_ms 100.0 -> 130.0"]
+    assert load_test.compare(result(100), result(100, throughput=70), 0.2) == [
+        "questions: throughput 100.0 -> 70.0 req/s"]
+    assert load_test.compare(result(100), result(100, error_rate=0.05), 0.2) == [
+        "questions: error rate 0.0% -> 5.0%"]
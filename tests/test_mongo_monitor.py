@@ -0,0 +1,39 @@
+"""The slow-query log must not leak query values"""
+import json
+
+import mongo_monitor
+
+
+SESSION_PLAN = {
+    "stage": "FETCH",
+    "filter": {"expires_at": {"$gt": "2026-01-01"}},
+    "inputStage": {
+        "stage": "IXSCAN",
+        "indexName": "token",
+        "keyPattern": {"session_token": 1},
+        "indexBounds": {"session_token": ['["session_secret", "session_secret"]']},
+    },
+}
+
+
+def test_shape_hides_values_and_collapses_lists():
+    assert mongo_monitor.shape({"email": "a@b.c", "id": {"$in": [1, 2, 3]}}) == {"email": "?", "id": {"$in": ["?"]}}
+
+
+def test_redact_plan_removes_literals():
+    logged = json.dumps(mongo_monitor.redact_plan(SESSION_PLAN))
+    assert "session_secret" not in logged
+    assert "2026-01-01" not in logged
+    assert '"indexName": "token"' in logged
+
+
+def test_redact_plan_drops_slot_based_plans():
+    redacted = mongo_monitor.redact_plan({"queryPlan": SESSION_PLAN, "slotBasedPlan": {"stages": "session_secret"}})
+    assert "slotBasedPlan" not in redacted
+    assert "session_secret" not in json.dumps(redacted)
+
+
+def test_summarize_and_collscan():
+    plans = mongo_monitor.winning_plans({"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}})
+    assert mongo_monitor.has_collscan(plans)
+    assert mongo_monitor.summarize_plan(SESSION_PLAN) == "FETCH < IXSCAN(token)"
@@ -0,0 +1,79 @@
+"""Keyset cursors and scenario history paging"""
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pagination import CursorError, decode_cursor, encode_cursor
+
+START = datetime(2024, 4, 1, 9)
+
+
+# ========== CURSORS ==========
+
+def test_cursors_round_trip_datetimes_and_ids():
+    values = {"t": datetime(2024, 4, 1, 9, 30, 15, 123000), "id": "resp_00ab"}
+    token = encode_cursor(values)
+    assert decode_cursor(token) == values
+    assert not set(token) & set("+/")
+
+
+def test_cursors_keep_a_missing_timestamp():
+    assert decode_cursor(encode_cursor({"t": None, "id": "q_1"})) == {"t": None, "id": "q_1"}
+
+
+@pytest.mark.parametrize("token", [
+    "garbage!",
+    base64.urlsafe_b64encode(b"[1, 2]").decode(),
+    base64.urlsafe_b64encode(b'{"t": ').decode(),
+    encode_cursor({"t": START, "id": "r_1"})[:-4],
+])
+def test_malformed_and_tampered_cursors_are_rejected(token):
+    with pytest.raises(CursorError):
+        decode_cursor(token)
+
+
+# ========== HISTORY ==========
+
+@pytest.fixture
+def client(mongo, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    monkeypatch.setattr(server, "db", mongo)
+    server.app.dependency_overrides[server.require_user] = lambda: server.User(
+        user_id="user_1", email="a@example.com", name="A", role="user", created_at=datetime.now(timezone.utc)
+    )
+    # Pairs share a timestamp, so pages must break ties on response_id
+    mongo.sync.scenario_responses.insert_many([
+        {"response_id": f"r_{i:02d}", "user_id": "user_1", "question_id": "q_1", "ai_grade": 70,
+         "time_taken": 60, "submitted_at": START + timedelta(minutes=i // 2), "user_response": "long text"}
+        for i in range(7)
+    ] + [{"response_id": "r_theirs", "user_id": "user_2", "question_id": "q_1", "submitted_at": START}])
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+def test_history_pages_newest_first_without_gaps_or_repeats(client):
+    seen, cursor = [], None
+    while True:
+        response = client.get("/api/scenarios/history", params={"limit": 3, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 3 and all("user_response" not in item for item in page)
+        seen += [item["response_id"] for item in page]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [f"r_{i:02d}" for i in reversed(range(7))]
+
+
+def test_history_rejects_a_bad_cursor(client):
+    assert client.get("/api/scenarios/history", params={"cursor": "garbage!"}).status_code == 400
+
+
+def test_an_edited_cursor_only_moves_within_the_users_own_history(client):
+    # Cursors are not signed: one made up by hand is a position, never a filter
+    edited = encode_cursor({"t": START + timedelta(days=1), "id": "r_theirs"})
+    page = client.get("/api/scenarios/history", params={"cursor": edited, "limit": 50}).json()
+    assert {item["response_id"] for item in page} == {f"r_{i:02d}" for i in range(7)}
@@ -0,0 +1,128 @@
+"""Sliding windows (memory and Mongo) and client address resolution"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import rate_limit
+from rate_limit import MemoryWindows, RateLimited, Rule
+
+RULE = Rule("test", 3, 10)
+
+
+class FakeRateLimits:
+    """The two calls _mongo_hit makes on db.rate_limits"""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one_and_update(self, query, update, upsert=False, return_document=None):
+        doc = self.docs.get(query["_id"])
+        if doc is None:
+            doc = self.docs[query["_id"]] = {"_id": query["_id"], "n": 0, **update["$setOnInsert"]}
+        doc["n"] += update["$inc"]["n"]
+        return dict(doc)
+
+    async def find_one(self, query):
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+
+def fake_db():
+    return SimpleNamespace(rate_limits=FakeRateLimits())
+
+
+# ========== MEMORY ==========
+
+def test_memory_window_allows_up_to_the_limit():
+    windows = MemoryWindows()
+    assert [windows.hit(RULE, "k", t) for t in (0, 1, 2)] == [0, 0, 0]
+    assert windows.hit(RULE, "k", 3) == 7  # until the hit at 0 leaves the window
+    assert windows.hit(RULE, "other", 3) == 0
+
+
+def test_memory_window_slides_and_does_not_count_rejections():
+    windows = MemoryWindows()
+    for t in (0, 1, 2):
+        windows.hit(RULE, "k", t)
+    for t in (3, 4, 5):
+        assert windows.hit(RULE, "k", t) > 0
+    assert windows.hit(RULE, "k", 10) == 0
+    assert windows.hit(RULE, "k", 10.5) == pytest.approx(0.5)
+
+
+def test_memory_sweep_drops_idle_keys(monkeypatch):
+    monkeypatch.setattr(rate_limit, "MAX_KEYS", 2)
+    windows = MemoryWindows()
+    windows.hit(RULE, "a", 0)
+    windows.hit(RULE, "b", 0)
+    windows.hit(RULE, "c", 100_000)
+    assert set(windows.hits) == {"test:c"}
+
+
+# ========== MONGO ==========
+
+def test_mongo_counts_hits_in_the_current_bucket():
+    db = fake_db()
+    results = [asyncio.run(rate_limit._mongo_hit(db, RULE, "k", 105)) for _ in range(4)]
+    assert results == [0, 0, 0, 5]
+    bucket = db.rate_limits.docs["test:k:10"]
+    assert bucket["n"] == 4
+    assert bucket["expires_at"].timestamp() == 120
+
+
+def test_mongo_weights_the_previous_bucket_by_its_overlap():
+    db = fake_db()
+    db.rate_limits.docs["test:k:9"] = {"_id": "test:k:9", "n": 4}
+    # Halfway through bucket 10, bucket 9 still counts for 4 * 0.5 = 2
+    assert asyncio.run(rate_limit._mongo_hit(db, RULE, "k", 105)) == 0
+    assert asyncio.run(rate_limit._mongo_hit(db, RULE, "k", 105)) == 5
+    # Later on less of it overlaps: 4 * 0.1 + 3 hits
+    assert asyncio.run(rate_limit._mongo_hit(db, RULE, "k", 109)) == 1
+
+
+# ========== CHECKS ==========
+
+def test_check_raises_with_whole_seconds(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_STORE", "memory")
+    monkeypatch.setattr(rate_limit, "memory_windows", MemoryWindows())
+    limit = rate_limit.RULES["forgot_email"].limit
+    for _ in range(limit):
+        asyncio.run(rate_limit.check(None, "forgot_email", "Someone@Example.com"))
+    with pytest.raises(RateLimited) as raised:
+        asyncio.run(rate_limit.check(None, "forgot_email", "someone@example.com"))
+    assert raised.value.rule.name == "forgot_email"
+    assert isinstance(raised.value.retry_after, int) and raised.value.retry_after >= 1
+
+
+def test_check_is_a_no_op_when_off_or_without_a_key(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_STORE", "off")
+    for _ in range(50):
+        asyncio.run(rate_limit.check(None, "forgot_email", "someone@example.com"))
+    monkeypatch.setenv("RATE_LIMIT_STORE", "memory")
+    asyncio.run(rate_limit.check(None, "forgot_email", None))
+
+
+# ========== CLIENT ADDRESS ==========
+
+def request(forwarded=None, peer="10.0.0.9"):
+    headers = {"x-forwarded-for": forwarded} if forwarded is not None else {}
+    return SimpleNamespace(headers=headers, client=SimpleNamespace(host=peer) if peer else None)
+
+
+@pytest.mark.parametrize("hops, expected", [
+    ("0", "10.0.0.9"),  # header ignored: anyone can send it
+    ("1", "10.0.0.1"),  # added by our proxy
+    ("2", "203.0.113.7"),
+    ("5", "198.51.100.1"),  # more hops than addresses: the leftmost
+])
+def test_client_ip_counts_trusted_hops_from_the_right(monkeypatch, hops, expected):
+    monkeypatch.setenv("TRUSTED_PROXY_HOPS", hops)
+    assert rate_limit.client_ip(request("198.51.100.1, 203.0.113.7 ,10.0.0.1")) == expected
+
+
+def test_client_ip_falls_back_to_the_peer(monkeypatch):
+    monkeypatch.setenv("TRUSTED_PROXY_HOPS", "1")
+    assert rate_limit.client_ip(request()) == "10.0.0.9"
+    assert rate_limit.client_ip(request(" , ")) == "10.0.0.9"
+    assert rate_limit.client_ip(request(peer=None)) == "unknown"
@@ -0,0 +1,63 @@
+"""Out-of-line compressed response bodies and their round trip"""
+import asyncio
+
+import pytest
+
+import response_bodies
+from response_bodies import INLINE_LIMIT, PREVIEW_LENGTH, attach_bodies, decompress, insert_response, split
+
+LONG_TEXT = "Secure the scene, separate the witnesses and notify the watch commander. " * 20
+
+
+def response(response_id="r_1", text=LONG_TEXT, feedback="Good structure."):
+    return {"response_id": response_id, "user_id": "user_1", "question_id": "q_1",
+            "user_response": text, "ai_feedback": feedback, "ai_grade": 80.0}
+
+
+@pytest.fixture(params=["zstd", "zlib"])
+def codec(request, monkeypatch):
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    else:
+        monkeypatch.setattr(response_bodies, "zstandard", None)
+    return request.param
+
+
+def test_short_responses_stay_inline():
+    short = response(text="x" * (INLINE_LIMIT - 20), feedback="y" * 20)
+    assert split(short) == (short, None)
+
+
+def test_split_round_trips_through_the_codec(codec):
+    hot, body = split(response())
+    assert body["codec"] == codec and body["size"] == len(LONG_TEXT) + len("Good structure.")
+    assert "user_response" not in hot and "ai_feedback" not in hot
+    assert hot["has_body"] and hot["preview"] == LONG_TEXT[:PREVIEW_LENGTH]
+    assert len(body["user_response"]) < len(LONG_TEXT) / 4
+    assert decompress(body["user_response"], codec) == LONG_TEXT
+    assert decompress(body["ai_feedback"], codec) == "Good structure."
+
+
+def test_zlib_bodies_stay_readable_with_zstd_installed(monkeypatch):
+    monkeypatch.setattr(response_bodies, "zstandard", None)
+    _, body = split(response())
+    monkeypatch.undo()
+    assert decompress(body["user_response"], "zlib") == LONG_TEXT
+
+
+def test_zstd_bodies_need_the_package(monkeypatch):
+    monkeypatch.setattr(response_bodies, "zstandard", None)
+    with pytest.raises(RuntimeError, match="zstandard"):
+        decompress(b"\x28\xb5\x2f\xfd", "zstd")
+
+
+def test_attach_bodies_restores_the_text(mongo, codec):
+    asyncio.run(insert_response(mongo, response("r_long")))
+    asyncio.run(insert_response(mongo, response("r_short", text="brief")))
+    stored = {r["response_id"]: r for r in mongo.sync.scenario_responses.find({}, {"_id": 0})}
+    assert stored["r_long"]["has_body"] and "user_response" not in stored["r_long"]
+
+    restored = asyncio.run(attach_bodies(mongo, list(stored.values())))
+    by_id = {r["response_id"]: r for r in restored}
+    assert by_id["r_long"]["user_response"] == LONG_TEXT and "preview" not in by_id["r_long"]
+    assert by_id["r_short"]["user_response"] == "brief"
@@ -0,0 +1,65 @@
+"""Responses that skip response_model validation still match the declared model"""
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+NOW = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def question(qid, reference):
+    return {"question_id": qid, "type": "multiple_choice", "category_id": "law", "category_name": "Law",
+            "question": f"{qid}?", "reference": reference, "created_at": NOW, "updated_at": NOW}
+
+
+QUESTIONS = [
+    question("q_1", "720 ILCS 5/12-3"),
+    question("q_2", "720 ILCS 5/12-3; Directive G03-02"),
+    question("q_3", "Directive G03-02"),
+]
+
+
+@pytest.fixture
+def client(mongo, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+    monkeypatch.setattr(server, "db", mongo)
+    server.app.dependency_overrides[server.require_user] = lambda: server.User(
+        user_id="user_1", email="a@example.com", name="A", role="user", created_at=NOW
+    )
+    mongo.sync.questions.insert_many([dict(q) for q in QUESTIONS])
+    server.rebuild_question_indexes([dict(q) for q in QUESTIONS])
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+    server.rebuild_question_indexes([])
+
+
+def test_reference_questions_match_their_model(client):
+    import server
+
+    response = client.get("/api/references/720 ILCS 5/12-3/questions")
+    assert response.status_code == 200
+    body = server.ReferenceQuestions.model_validate(response.json())
+    assert [q.question_id for q in body.questions] == ["q_1", "q_2"]
+    assert body.total == 2 and [r.key for r in body.related] == ["directive:G03-02"]
+
+
+def test_bookmark_pages_match_their_model(client, mongo):
+    import server
+
+    mongo.sync.user_progress.insert_many([
+        {"user_id": "user_1", "question_id": q["question_id"], "bookmarked": True,
+         "bookmarked_at": datetime(2024, 6, i + 1)}
+        for i, q in enumerate(QUESTIONS)
+    ])
+    first = client.get("/api/bookmarks?limit=2")
+    questions = TypeAdapter(List[server.Question]).validate_python(first.json())
+    assert [q.question_id for q in questions] == ["q_3", "q_2"]
+    assert first.json()[0]["created_at"] == "2024-05-01T00:00:00Z"
+
+    rest = client.get("/api/bookmarks", params={"limit": 2, "ids_only": True,
+                                                "cursor": first.headers["X-Next-Cursor"]})
+    assert rest.json() == ["q_1"] and "X-Next-Cursor" not in rest.headers
+    assert client.get("/api/bookmarks?cursor=garbage").status_code == 400
@@ -0,0 +1,28 @@
+"""Citations are found from any section on, not only as written in full"""
+from search_index import SearchIndex, subterms, tokenize
+
+
+def make_index() -> SearchIndex:
+    index = SearchIndex()
+    index.add({"question_id": "battery", "type": "flashcard", "category_id": "c",
+               "title": "Aggravated battery, 720 ILCS 5/12-3.05"})
+    index.add({"question_id": "directive", "type": "flashcard", "category_id": "c",
+               "title": "Directive S06-02 and 725 ILCS 5/103-2"})
+    return index
+
+
+def test_subterms_are_runs_of_parts():
+    assert subterms("5/12-3.05") == ["5", "5/12", "5/12-3", "12", "12-3", "12-3.05", "3", "3.05", "05"]
+    assert subterms("s06-02") == ["s06", "02"]
+
+
+def test_tokenize_keeps_the_whole_citation():
+    assert tokenize("See S06-02") == ["see", "s06-02", "s06", "02"]
+
+
+def test_sections_inside_a_citation_are_searchable():
+    index = make_index()
+    for query in ("12-3", "12-3.05", "5/12-3.05", "ilcs 12-3"):
+        results = index.search(query)["results"]
+        assert results and results[0]["question_id"] == "battery", query
+    assert [hit["question_id"] for hit in index.search("103-2")["results"]] == ["directive"]
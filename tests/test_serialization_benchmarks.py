@@ -0,0 +1,197 @@
+"""
+Micro-benchmarks for the hot serialization and validation paths.
+
+GET /questions, /questions/{id} and /bookmarks spend most of their CPU
+validating documents against ``response_model`` and encoding them (with
+their datetimes) as JSON. These benchmarks time each step on the real
+question bank, shaped as MongoDB returns it, so optimizations (orjson
+rendering, the trusted-read path in fast_json.py) can be measured and
+regressions caught:
+
+    pytest tests/test_serialization_benchmarks.py --benchmark-only
+    pytest tests/test_serialization_benchmarks.py --benchmark-autosave            # keep a baseline
+    pytest tests/test_serialization_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Skipped when pytest-benchmark is not installed.
+"""
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+import fast_json  # noqa: E402
+import server  # noqa: E402
+from content_packs import PACKS_DIR  # noqa: E402
+
+# GET /questions returns at most this many
+LIST_SIZE = 500
+
+
+def _load_questions() -> List[dict]:
+    """The content packs as documents read back from MongoDB (naive UTC datetimes, no _id)"""
+    rng = random.Random(7)
+    base = datetime(2025, 1, 1)
+    packs = []
+    for path in sorted(PACKS_DIR.glob("*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            if "question_id" in entry:
+                packs.append(entry)
+    questions = []
+    while len(questions) < LIST_SIZE:
+        for entry in packs[:LIST_SIZE - len(questions)]:
+            created = base + timedelta(minutes=rng.randint(0, 500_000))
+            questions.append({
+                **entry,
+                "question_id": f"{entry['question_id']}_{len(questions)}",
+                "created_at": created,
+                "updated_at": created + timedelta(days=rng.randint(0, 90)),
+            })
+    return questions
+
+
+def _with_progress(questions: List[dict]) -> List[dict]:
+    rng = random.Random(11)
+    now = datetime(2025, 6, 1)
+    return [{
+        **question,
+        "progress": {
+            "bookmarked": rng.random() < 0.2,
+            "attempts": rng.randint(1, 6),
+            "last_score": float(rng.randint(0, 100)),
+            "last_attempted": now - timedelta(hours=rng.randint(1, 2000)),
+            "due_at": now + timedelta(days=rng.randint(0, 30)),
+        } if rng.random() < 0.6 else None,
+    } for question in questions]
+
+
+def _route(path: str, method: str = "GET") -> APIRoute:
+    return next(route for route in server.app.routes
+                if isinstance(route, APIRoute) and route.path == path and method in route.methods)
+
+
+@pytest.fixture(scope="module")
+def question_docs():
+    return _load_questions()
+
+
+@pytest.fixture(scope="module")
+def progress_docs(question_docs):
+    return _with_progress(question_docs)
+
+
+@pytest.fixture(scope="module")
+def question_models(question_docs):
+    return [server.Question(**doc) for doc in question_docs]
+
+
+# ========== VALIDATION ==========
+
+def test_validate_question_list(benchmark, progress_docs):
+    """response_model=List[QuestionWithProgress] validation of a full /questions page"""
+    adapter = TypeAdapter(List[server.QuestionWithProgress])
+    result = benchmark(adapter.validate_python, progress_docs)
+    assert len(result) == LIST_SIZE
+
+
+def test_construct_question_list(benchmark, progress_docs):
+    """The same models built without validation, for trusted documents"""
+    result = benchmark(lambda: [server.QuestionWithProgress.model_construct(**doc) for doc in progress_docs])
+    assert len(result) == LIST_SIZE
+
+
+def test_validate_single_question(benchmark, question_docs):
+    result = benchmark(server.Question.model_validate, question_docs[0])
+    assert result.question_id == question_docs[0]["question_id"]
+
+
+# ========== DUMPING AND ENCODING ==========
+
+def test_model_dump_question_list(benchmark, question_models):
+    result = benchmark(lambda: [question.model_dump() for question in question_models])
+    assert len(result) == LIST_SIZE
+
+
+def test_model_dump_json_mode_question_list(benchmark, question_models):
+    """model_dump(mode="json"): datetimes converted to strings by pydantic-core"""
+    result = benchmark(lambda: [question.model_dump(mode="json") for question in question_models])
+    assert isinstance(result[0]["created_at"], str)
+
+
+def test_jsonable_encoder_question_docs(benchmark, question_docs):
+    """What endpoints without a response_model (e.g. /bookmarks) go through"""
+    result = benchmark(jsonable_encoder, question_docs)
+    assert isinstance(result[0]["created_at"], str)
+
+
+def test_render_json_response(benchmark, question_docs):
+    """Encoding already JSON-compatible content into the response body"""
+    content = jsonable_encoder(question_docs)
+    body = benchmark(server.app.router.default_response_class(content).render, content)
+    assert body.startswith(b"[")
+
+
+# ========== WHOLE RESPONSES ==========
+
+def test_serialize_questions_response(benchmark, progress_docs):
+    """GET /questions?with_progress=true after the query: response_model validation, dump and encode"""
+    route = _route("/api/questions")
+
+    def serialize():
+        content = asyncio.run(serialize_response(field=route.secure_cloned_response_field,
+                                                 response_content=progress_docs))
+        return route.response_class(content).body
+
+    body = benchmark(serialize)
+    assert body.startswith(b"[")
+
+
+def test_serialize_bookmarks_response(benchmark, question_docs):
+    """GET /bookmarks: catalog dicts without a response_model"""
+    route = _route("/api/bookmarks")
+    catalog = [server.Question(**doc).model_dump() for doc in question_docs]
+
+    def serialize():
+        content = asyncio.run(serialize_response(field=route.secure_cloned_response_field,
+                                                 response_content=catalog))
+        return route.response_class(content).body
+
+    body = benchmark(serialize)
+    assert body.startswith(b"[")
+
+
+def test_trusted_questions_response(benchmark, progress_docs):
+    """GET /questions?with_progress=true on the trusted-read path (fast_json.trusted)"""
+    body = benchmark(lambda: fast_json.trusted(server.QuestionWithProgress, progress_docs).body)
+    assert body.startswith(b"[")
+
+
+def test_dumps_question_docs(benchmark, progress_docs):
+    """fast_json.dumps straight from documents: orjson when installed, else json with a fallback encoder"""
+    body = benchmark(fast_json.dumps, progress_docs)
+    assert body.startswith(b"[")
+
+
+# ========== LLM GRADING ==========
+
+def test_parse_grading(benchmark):
+    reply = "GRADE: 85\nFEEDBACK: " + "Good identification of the elements of the offense. " * 20
+    grade, feedback = benchmark(server.parse_grading, reply)
+    assert grade == 85.0
+    assert feedback.startswith("Good identification")
+
+
+def test_parse_grading_without_grade(benchmark):
+    reply = "The response covers the scene security steps but " * 20
+    grade, feedback = benchmark(server.parse_grading, reply)
+    assert grade is None
+    assert feedback == reply
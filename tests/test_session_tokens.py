@@ -0,0 +1,140 @@
+"""Signing, verification and revocation of stateless session tokens"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import session_tokens
+from session_tokens import BloomFilter, RevocationSet
+
+USER = {"user_id": "user_1", "email": "a@example.com", "name": "A", "role": "user",
+        "created_at": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+
+
+@pytest.fixture(autouse=True)
+def signing_key(monkeypatch):
+    monkeypatch.setenv("SESSION_SIGNING_KEY", "current-key")
+
+
+class FakeRevocations:
+    """The token_revocations calls RevocationSet makes"""
+
+    def __init__(self):
+        self.docs = []
+
+    async def insert_one(self, doc):
+        self.docs.append(doc)
+
+    async def find_one(self, query, projection=None):
+        return next((d for d in self.docs if all(d.get(k) == v for k, v in query.items())), None)
+
+    async def _iterate(self, query):
+        after = query.get("created_at", {}).get("$gt")
+        for doc in list(self.docs):
+            if after is None or doc["created_at"] > after:
+                yield dict(doc)
+
+    def find(self, query, projection=None):
+        return self._iterate(query)
+
+
+def fake_db():
+    return SimpleNamespace(token_revocations=FakeRevocations())
+
+
+def claims(jti="t1", uid="user_1", iat=None):
+    now = time.time()
+    return {"uid": uid, "jti": jti, "iat": now if iat is None else iat, "exp": int(now) + 3600}
+
+
+# ========== TOKENS ==========
+
+def test_issued_tokens_verify_with_their_claims():
+    token = session_tokens.issue(USER, days=7)
+    assert session_tokens.enabled() and session_tokens.is_signed(token)
+    verified = session_tokens.verify(token)
+    assert verified["uid"] == "user_1" and verified["role"] == "user"
+    assert verified["cat"] == int(USER["created_at"].timestamp())
+    assert verified["exp"] - verified["iat"] == pytest.approx(7 * 86400, abs=1)
+    assert session_tokens.verify(session_tokens.issue(USER, days=7))["jti"] != verified["jti"]
+
+
+def test_tampered_malformed_and_expired_tokens_are_rejected():
+    token = session_tokens.issue(USER, days=7)
+    payload, signature = token[len(session_tokens.PREFIX):].split(".")
+    forged = session_tokens.issue({**USER, "role": "admin"}, days=7).split(".")[1]
+    assert session_tokens.verify(f"{session_tokens.PREFIX}{forged}.{signature}") is None
+    assert session_tokens.verify(token[:-2]) is None
+    assert session_tokens.verify("st1.nodots") is None
+    assert session_tokens.verify(session_tokens.issue(USER, days=0)) is None
+
+
+def test_rotated_keys_still_verify_until_removed(monkeypatch):
+    old_token = session_tokens.issue(USER, days=7)
+    monkeypatch.setenv("SESSION_SIGNING_KEY", "next-key, current-key")
+    new_token = session_tokens.issue(USER, days=7)
+    assert session_tokens.verify(old_token) and session_tokens.verify(new_token)
+    monkeypatch.setenv("SESSION_SIGNING_KEY", "next-key")
+    assert session_tokens.verify(old_token) is None
+    assert session_tokens.verify(new_token)
+
+
+def test_disabled_without_a_key(monkeypatch):
+    monkeypatch.setenv("SESSION_SIGNING_KEY", " , ")
+    assert not session_tokens.enabled()
+    assert not session_tokens.is_signed("session_abc")
+
+
+# ========== REVOCATION ==========
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(bits=1 << 14, hashes=5)
+    items = [f"jti_{i}" for i in range(500)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other_{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_revoked_token_and_only_that_token():
+    db = fake_db()
+    revoked = RevocationSet()
+    asyncio.run(revoked.revoke_token(db, claims("t1")))
+    assert asyncio.run(revoked.is_revoked(db, claims("t1")))
+    assert not asyncio.run(revoked.is_revoked(db, claims("t2")))
+
+
+def test_bloom_hits_are_confirmed_against_the_database():
+    db = fake_db()
+    revoked = RevocationSet()
+    revoked.tokens = BloomFilter(bits=8, hashes=1)
+    revoked.tokens.array[0] = 0xFF  # every id "might" be revoked
+    assert not asyncio.run(revoked.is_revoked(db, claims("t1")))
+
+
+def test_revoke_user_cuts_off_earlier_tokens():
+    db = fake_db()
+    revoked = RevocationSet()
+    asyncio.run(revoked.revoke_user(db, "user_1"))
+    cutoff = revoked.users["user_1"]
+    assert asyncio.run(revoked.is_revoked(db, claims("t1", iat=cutoff - 1)))
+    assert not asyncio.run(revoked.is_revoked(db, claims("t2", iat=cutoff + 1)))
+    assert not asyncio.run(revoked.is_revoked(db, claims("t3", uid="user_2", iat=cutoff - 1)))
+
+
+def test_other_workers_pick_revocations_up_on_refresh():
+    db = fake_db()
+    worker_a, worker_b = RevocationSet(), RevocationSet()
+    asyncio.run(worker_b.load(db))
+    asyncio.run(worker_a.revoke_token(db, claims("t1")))
+    asyncio.run(worker_a.revoke_user(db, "user_2"))
+
+    # Within REFRESH_SECONDS of the last pull nothing is fetched
+    assert not asyncio.run(worker_b.is_revoked(db, claims("t1")))
+    worker_b.next_refresh = 0
+    assert asyncio.run(worker_b.is_revoked(db, claims("t1")))
+    assert asyncio.run(worker_b.is_revoked(db, claims("t2", uid="user_2", iat=0)))
+    assert worker_b.loaded_through == db.token_revocations.docs[-1]["created_at"]
@@ -0,0 +1,64 @@
+"""SM-2 schedule transitions and the due queue"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from spaced_repetition import DEFAULT_EASE, MIN_EASE, due_cards, next_schedule, quality_from_score, record_review
+
+NOW = datetime(2024, 3, 1, 12)
+
+
+def review(progress, *qualities):
+    for quality in qualities:
+        progress = next_schedule(progress, quality, NOW)
+    return progress
+
+
+# ========== SCHEDULE ==========
+
+def test_first_reviews_use_the_fixed_intervals_then_grow_by_ease():
+    first = next_schedule(None, 4, NOW)
+    assert first == {"ease": DEFAULT_EASE, "interval_days": 1, "repetitions": 1, "lapses": 0,
+                     "due_at": NOW + timedelta(days=1), "last_reviewed": NOW}
+    assert review(first, 4)["interval_days"] == 6
+    assert review(first, 4, 4)["interval_days"] == 15  # ceil(6 * 2.5)
+    assert review(first, 4, 4, 4)["interval_days"] == 38  # ceil(15 * 2.5)
+
+
+@pytest.mark.parametrize("quality, change", [(5, 0.1), (4, 0.0), (3, -0.14), (2, -0.32), (0, -0.8)])
+def test_ease_follows_the_sm2_formula(quality, change):
+    assert next_schedule({"ease": 2.5}, quality, NOW)["ease"] == pytest.approx(2.5 + change)
+
+
+def test_ease_never_drops_below_the_minimum():
+    assert review(None, 0, 0, 0, 0, 0)["ease"] == MIN_EASE
+
+
+def test_a_lapse_restarts_the_card_but_keeps_its_ease():
+    learned = review(None, 5, 5, 5)
+    forgotten = next_schedule(learned, 1, NOW)
+    assert forgotten["repetitions"] == 0 and forgotten["interval_days"] == 1 and forgotten["lapses"] == 1
+    assert forgotten["ease"] == pytest.approx(learned["ease"] - 0.54)
+    # Failing a card that was never learned is not a lapse
+    assert next_schedule(None, 1, NOW)["lapses"] == 0
+    assert review(forgotten, 4)["interval_days"] == 1
+
+
+def test_quality_is_checked_and_mapped_from_scores():
+    with pytest.raises(ValueError):
+        next_schedule(None, 6, NOW)
+    assert [quality_from_score(s) for s in (None, 0, 20, 40, 60, 75, 90, 100)] == [None, 0, 1, 2, 3, 4, 5, 5]
+
+
+# ========== DUE QUEUE ==========
+
+def test_due_cards_come_first_then_unseen_catalog_cards(mongo):
+    asyncio.run(record_review(mongo, "user_1", "q_late", 4, now=NOW - timedelta(days=3)))
+    asyncio.run(record_review(mongo, "user_1", "q_later", 4, now=NOW - timedelta(days=2)))
+    asyncio.run(record_review(mongo, "user_1", "q_not_due", 5, now=NOW))
+    mongo.sync.user_progress.insert_one({"user_id": "user_1", "question_id": "q_bookmark", "bookmarked": True})
+
+    cards = asyncio.run(due_cards(mongo, "user_1", 4, ["q_not_due", "q_bookmark", "q_new", "q_other"], now=NOW))
+    assert [(c["question_id"], c["new"]) for c in cards] == [
+        ("q_late", False), ("q_later", False), ("q_bookmark", True), ("q_new", True)]
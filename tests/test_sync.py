@@ -0,0 +1,122 @@
+"""Delta sync: cursors, tombstones, resets and paging"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pagination import CursorError, decode_cursor, encode_cursor
+from sync import CURSOR_OVERLAP, TOMBSTONE_RETENTION, changes_since, record_deletes, record_reset
+
+START = datetime(2025, 1, 1)
+
+
+def seed(mongo, progress, responses=0):
+    mongo.sync.user_progress.insert_many([
+        {"user_id": "user_1", "question_id": f"q_{i:03d}", "bookmarked": i % 2 == 0,
+         "updated_at": START + timedelta(minutes=i)}
+        for i in range(progress)
+    ])
+    if responses:
+        mongo.sync.scenario_responses.insert_many([
+            # Pairs share a timestamp so the response_id tiebreak matters
+            {"user_id": "user_1", "response_id": f"r_{i:03d}", "ai_grade": 5,
+             "submitted_at": START + timedelta(minutes=i // 2)}
+            for i in range(responses)
+        ])
+
+
+def sync_all(mongo, cursor=None, limit=500):
+    pages = [asyncio.run(changes_since(mongo, "user_1", cursor, limit))]
+    while pages[-1]["next_cursor"]:
+        pages.append(asyncio.run(changes_since(mongo, "user_1", pages[-1]["next_cursor"], limit)))
+    return pages
+
+
+# ========== CURSORS ==========
+
+def test_cursor_starts_the_overlap_before_the_sync(mongo):
+    before = datetime.now(timezone.utc)
+    changes = asyncio.run(changes_since(mongo, "user_1"))
+    since = decode_cursor(changes["cursor"])["t"].replace(tzinfo=timezone.utc)
+    assert changes["full"] and changes["next_cursor"] is None
+    assert before - CURSOR_OVERLAP - timedelta(seconds=1) <= since <= before
+
+
+def test_old_and_garbage_cursors(mongo):
+    old = encode_cursor({"t": datetime.now(timezone.utc) - TOMBSTONE_RETENTION - timedelta(days=1)})
+    assert asyncio.run(changes_since(mongo, "user_1", old))["full"]
+    for bad in ("not a cursor", encode_cursor({"t": "yesterday"}), encode_cursor({"p": "user_progress", "t": 1})):
+        with pytest.raises(CursorError):
+            asyncio.run(changes_since(mongo, "user_1", bad))
+
+
+# ========== TOMBSTONES ==========
+
+def test_only_tombstones_after_the_cursor_are_sent(mongo):
+    asyncio.run(record_deletes(mongo, "scenario_responses", ["r_old"], user_id="user_1"))
+    cursor = asyncio.run(changes_since(mongo, "user_1"))["cursor"]
+    # Inside the overlap, so the earlier delete is sent again: harmless for a delete
+    asyncio.run(record_deletes(mongo, "scenario_responses", ["r_new"], user_id="user_1"))
+    asyncio.run(record_deletes(mongo, "scenario_responses", ["r_theirs"], user_id="user_2"))
+    asyncio.run(record_deletes(mongo, "questions", ["q_gone"]))
+
+    deleted = asyncio.run(changes_since(mongo, "user_1", cursor))["deleted"]
+    assert deleted == {"scenario_responses": ["r_old", "r_new"], "questions": ["q_gone"]}
+
+    later = encode_cursor({"t": datetime.now(timezone.utc) + timedelta(seconds=1)})
+    assert asyncio.run(changes_since(mongo, "user_1", later))["deleted"] == {}
+
+
+def test_a_reset_sends_the_collection_in_full_instead_of_its_tombstones(mongo):
+    mongo.sync.categories.insert_many([
+        {"category_id": "a", "order": 1, "updated_at": START},
+        {"category_id": "b", "order": 2, "updated_at": START},
+    ])
+    cursor = encode_cursor({"t": datetime.now(timezone.utc) - timedelta(minutes=1)})
+    asyncio.run(record_deletes(mongo, "categories", ["c"]))
+    assert asyncio.run(changes_since(mongo, "user_1", cursor))["categories"] == []
+
+    asyncio.run(record_reset(mongo, "categories"))
+    changes = asyncio.run(changes_since(mongo, "user_1", cursor))
+    assert changes["reset"] == ["categories"] and changes["deleted"] == {}
+    assert [c["category_id"] for c in changes["categories"]] == ["a", "b"]
+
+
+# ========== PAGING ==========
+
+def test_pages_cover_progress_then_responses_once_each(mongo):
+    seed(mongo, progress=7, responses=9)
+    mongo.sync.questions.insert_one({"question_id": "q_000", "updated_at": START})
+    pages = sync_all(mongo, limit=4)
+
+    assert len(pages) == 4
+    assert all(len(p["progress"]) + len(p["scenario_responses"]) <= 4 for p in pages)
+    progress = [d["question_id"] for p in pages for d in p["progress"]]
+    responses = [d["response_id"] for p in pages for d in p["scenario_responses"]]
+    assert progress == [f"q_{i:03d}" for i in range(7)]
+    assert responses == [f"r_{i:03d}" for i in range(9)]
+
+    # Shared data on the first page; the next sync's cursor on the last only
+    assert [len(p["questions"]) for p in pages] == [1, 0, 0, 0]
+    assert [p["cursor"] is None for p in pages] == [True, True, True, False]
+    assert all(p["full"] for p in pages)
+    assert sum(len(p["bookmarks"]["added"]) for p in pages) == 4
+
+
+def test_a_page_filled_by_progress_alone_still_leads_to_the_responses(mongo):
+    seed(mongo, progress=4, responses=1)
+    pages = sync_all(mongo, limit=4)
+    assert [len(p["progress"]) for p in pages] == [4, 0]
+    assert [len(p["scenario_responses"]) for p in pages] == [0, 1]
+
+
+def test_later_pages_keep_the_first_page_window(mongo):
+    recent = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+    mongo.sync.user_progress.insert_many([
+        {"user_id": "user_1", "question_id": f"q_{i:03d}", "updated_at": recent + timedelta(minutes=i)}
+        for i in range(6)
+    ])
+    cursor = encode_cursor({"t": recent + timedelta(minutes=2, seconds=30)})
+    pages = sync_all(mongo, cursor, limit=2)
+    assert [d["question_id"] for p in pages for d in p["progress"]] == ["q_003", "q_004", "q_005"]
+    assert not any(p["full"] for p in pages) and pages[-1]["cursor"]
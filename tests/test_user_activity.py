@@ -0,0 +1,62 @@
+"""Batched last-activity stamps"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import user_activity
+from user_activity import ActivityBuffer
+
+
+def seed_users(mongo, n):
+    mongo.sync.users.insert_many([{"user_id": f"user_{i}"} for i in range(n)])
+
+
+def stamped(mongo):
+    return sorted(u["user_id"] for u in mongo.sync.users.find({"last_active_at": {"$exists": True}}))
+
+
+def test_flush_stamps_each_seen_user_once_in_batches(mongo, monkeypatch):
+    monkeypatch.setattr(user_activity, "BATCH_SIZE", 2)
+    seed_users(mongo, 6)
+    buffer = ActivityBuffer()
+    for user_id in ("user_0", "user_3", "user_0", "user_4", "user_5"):
+        buffer.seen(user_id)
+
+    assert stamped(mongo) == []  # nothing is written until a flush
+    assert asyncio.run(buffer.flush(mongo)) == 4
+    assert stamped(mongo) == ["user_0", "user_3", "user_4", "user_5"]
+    assert asyncio.run(buffer.flush(mongo)) == 0
+
+
+def test_the_buffer_is_bounded(monkeypatch):
+    monkeypatch.setattr(user_activity, "MAX_PENDING", 2)
+    buffer = ActivityBuffer()
+    for user_id in ("a", "b", "a", "c", "d"):
+        buffer.seen(user_id)
+    assert buffer.pending == {"a", "b"} and buffer.dropped == 2
+
+
+class FailingUsers:
+    """users.update_many that fails on its second call"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def update_many(self, query, update):
+        self.calls.append(query["user_id"]["$in"])
+        if len(self.calls) == 2:
+            raise ConnectionError("down")
+
+
+def test_a_failed_batch_is_retried_with_the_next_flush(monkeypatch):
+    monkeypatch.setattr(user_activity, "BATCH_SIZE", 2)
+    db = SimpleNamespace(users=FailingUsers())
+    buffer = ActivityBuffer()
+    for i in range(4):
+        buffer.seen(f"user_{i}")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(buffer.flush(db))
+    assert db.users.calls == [["user_0", "user_1"], ["user_2", "user_3"]]
+    assert buffer.pending == {"user_2", "user_3"}